@@ -116,6 +116,116 @@ def remove_tags(xml_str, tags_to_remove):
     return etree.tostring(root, encoding="unicode")
 
 
+MOCK_BASE_URL = "http://example.com"
+MOCK_HTS_ENDPOINT = "foo.hts"
+
+
+class HilltopXML:
+    """Builders for small Hilltop responses."""
+
+    @staticmethod
+    def status(soft_refresh, full_refresh=100):
+        """Build a Status response with one data file."""
+        return f"""<HilltopServer>
+  <Agency>Test Council</Agency>
+  <DefaultFile>c:\\Hilltop\\DataFile.hts</DefaultFile>
+  <DataFile>
+    <Filename>c:\\Hilltop\\DataFile.hts</Filename>
+    <FullRefresh>{full_refresh}</FullRefresh>
+    <SoftRefresh>{soft_refresh}</SoftRefresh>
+  </DataFile>
+</HilltopServer>"""
+
+    @staticmethod
+    def site_list(*sites):
+        """Build a SiteList response."""
+        rows = "".join(f'<Site Name="{site}"></Site>' for site in sites)
+        return f"<HilltopServer><Agency>Test Council</Agency>{rows}</HilltopServer>"
+
+    @staticmethod
+    def get_data(site, rows, item="Flow"):
+        """Build a GetData response from (datetime, value) rows of one item."""
+        data = "".join(
+            f"<E><T>{time:%Y-%m-%dT%H:%M:%S}</T><I1>{value}</I1></E>"
+            for time, value in rows
+        )
+        return f"""<?xml version="1.0" ?>
+<Hilltop>
+  <Agency>Test Council</Agency>
+  <Measurement SiteName="{site}">
+    <DataSource Name="{item}" NumItems="1">
+      <TSType>StdSeries</TSType>
+      <DataType>SimpleTimeSeries</DataType>
+      <Interpolation>Instant</Interpolation>
+      <ItemInfo ItemNumber="1">
+        <ItemName>{item}</ItemName>
+        <ItemFormat>F</ItemFormat>
+        <Format>####</Format>
+      </ItemInfo>
+    </DataSource>
+    <Data DateFormat="Calendar" NumItems="1">{data}</Data>
+  </Measurement>
+</Hilltop>"""
+
+    @staticmethod
+    def data_source(site, name, start, end, measurements=None):
+        """Build a MeasurementList data source, measuring ``name`` by default."""
+        rows = "".join(
+            f'<Measurement Name="{m}"></Measurement>' for m in measurements or [name]
+        )
+        return f"""<DataSource Name="{name}" Site="{site}">
+    <NumItems>1</NumItems>
+    <TSType>StdSeries</TSType>
+    <DataType>SimpleTimeSeries</DataType>
+    <Interpolation>Instant</Interpolation>
+    <ItemFormat>0</ItemFormat>
+    <From>{start}</From>
+    <To>{end}</To>
+    {rows}
+  </DataSource>"""
+
+    @staticmethod
+    def measurement_list(*data_sources):
+        """Build a MeasurementList response from ``data_source`` elements."""
+        return f"<HilltopServer>{''.join(data_sources)}</HilltopServer>"
+
+
+@pytest.fixture
+def hilltop_xml():
+    """Provide builders for small Hilltop responses."""
+    return HilltopXML
+
+
+@pytest.fixture
+def read_mocked():
+    """Provide a reader for the files in tests/mocked_data."""
+
+    def _read(*parts):
+        return (Path(__file__).parent / "mocked_data" / Path(*parts)).read_text(
+            encoding="utf-8"
+        )
+
+    return _read
+
+
+@pytest.fixture
+def mock_hilltop(httpx_mock):
+    """Provide a function registering the response to one mocked request.
+
+    It takes the request class, the response text and the request
+    parameters, and mocks the request sent to ``MOCK_BASE_URL`` and
+    ``MOCK_HTS_ENDPOINT``.
+    """
+
+    def _mock(request_cls, text, **params):
+        url = request_cls(
+            base_url=MOCK_BASE_URL, hts_endpoint=MOCK_HTS_ENDPOINT, **params
+        ).gen_url()
+        httpx_mock.add_response(url=url, text=text)
+
+    return _mock
+
+
 @pytest.fixture(scope="session")
 def remote_client():
     """Create a remote client for testing."""
@@ -219,6 +329,28 @@ def local_test_server():
     # Server cleanup happens automatically when thread ends
 
 
+@pytest.fixture(scope="session")
+def local_h2_server():
+    """Start a local cleartext HTTP/2 test server for performance testing."""
+    from tests.performance.h2_server import H2TestServer
+
+    host = "127.0.0.1"
+    port = int(os.getenv("TEST_H2_SERVER_PORT", "8002"))
+    delay = float(os.getenv("TEST_SERVER_DELAY", "0.01"))
+
+    server = H2TestServer(host=host, port=port, delay=delay)
+    server.start()
+
+    yield {
+        "base_url": f"http://{host}:{port}",
+        "hts_endpoint": "foo.hts",
+        "host": host,
+        "port": port,
+        "delay": delay,
+        "server": server,
+    }
+
+
 @pytest.fixture(scope="session")
 def performance_remote_client():
     """Create a remote client for performance testing."""
@@ -0,0 +1,148 @@
+"""Local HTTP/2 test server for performance testing.
+
+This module provides a minimal cleartext HTTP/2 (h2c, prior knowledge)
+server built on the ``h2`` state machine. It serves the same mocked Hilltop
+responses as the FastAPI server in ``local_server.py`` with an artificial
+per-request delay, and can multiplex many concurrent streams over one
+connection, which the FastAPI server (HTTP/1.1 only) cannot.
+"""
+
+import asyncio
+import threading
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import (ConnectionTerminated, RequestReceived, StreamReset,
+                       WindowUpdated)
+from h2.exceptions import ProtocolError, StreamClosedError
+from h2.settings import SettingCodes
+
+# Mocked response served for each Hilltop request type.
+FIXTURES = {
+    "Status": "status/response.xml",
+    "SiteList": "site_list/all_response.xml",
+    "MeasurementList": "measurement_list/all_response.xml",
+    "GetData": "get_data/basic_response.xml",
+}
+
+
+class H2TestServer:
+    """Cleartext HTTP/2 server for mocked Hilltop responses.
+
+    Parameters
+    ----------
+    host : str, default "127.0.0.1"
+        Host to bind to.
+    port : int, default 8002
+        Port to bind to.
+    delay : float, default 0.0
+        Artificial delay in seconds before each response.
+    max_concurrent_streams : int, default 256
+        Streams each connection accepts at once.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8002,
+        delay: float = 0.0,
+        max_concurrent_streams: int = 256,
+    ):
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.max_concurrent_streams = max_concurrent_streams
+        self.connections = 0
+
+        mocked_data = Path(__file__).parent.parent / "mocked_data"
+        self.bodies = {
+            request: (mocked_data / path).read_bytes()
+            for request, path in FIXTURES.items()
+        }
+        self._loop = None
+        self._started = threading.Event()
+
+    def _body(self, path: str) -> bytes:
+        """Return the mocked body for a request path."""
+        query = parse_qs(urlsplit(path).query)
+        request = query.get("Request", ["Status"])[0]
+        return self.bodies.get(request, self.bodies["Status"])
+
+    async def _handle(self, reader, writer):
+        """Serve one HTTP/2 connection."""
+        self.connections += 1
+        conn = H2Connection(config=H2Configuration(client_side=False))
+        conn.initiate_connection()
+        conn.update_settings(
+            {SettingCodes.MAX_CONCURRENT_STREAMS: self.max_concurrent_streams}
+        )
+        writer.write(conn.data_to_send())
+        windows = {}
+
+        async def respond(stream_id, headers):
+            await asyncio.sleep(self.delay)
+            body = self._body(headers.get(":path", "/"))
+            try:
+                conn.send_headers(
+                    stream_id,
+                    [
+                        (":status", "200"),
+                        ("content-type", "text/xml"),
+                        ("content-length", str(len(body))),
+                    ],
+                )
+                while body:
+                    window = conn.local_flow_control_window(stream_id)
+                    size = min(window, conn.max_outbound_frame_size, len(body))
+                    if size <= 0:
+                        windows[stream_id] = asyncio.Event()
+                        await windows.pop(stream_id).wait()
+                        continue
+                    conn.send_data(stream_id, body[:size])
+                    body = body[size:]
+                    writer.write(conn.data_to_send())
+                conn.end_stream(stream_id)
+                writer.write(conn.data_to_send())
+            except (StreamClosedError, ProtocolError):
+                pass
+
+        try:
+            while data := await reader.read(65536):
+                for event in conn.receive_data(data):
+                    if isinstance(event, RequestReceived):
+                        headers = {
+                            k.decode(): v.decode() for k, v in event.headers
+                        }
+                        asyncio.create_task(respond(event.stream_id, headers))
+                    elif isinstance(event, WindowUpdated):
+                        for waiting in list(windows.values()):
+                            waiting.set()
+                    elif isinstance(event, StreamReset):
+                        windows.pop(event.stream_id, None)
+                    elif isinstance(event, ConnectionTerminated):
+                        return
+                writer.write(conn.data_to_send())
+                await writer.drain()
+        except (ConnectionError, ProtocolError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve(self):
+        """Run the server until the event loop is stopped."""
+        server = await asyncio.start_server(self._handle, self.host, self.port)
+        self._started.set()
+        async with server:
+            await server.serve_forever()
+
+    def start(self):
+        """Start the server on a daemon thread and wait until it listens."""
+        self._loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=self._loop.run_until_complete, args=(self._serve(),), daemon=True
+        )
+        thread.start()
+        if not self._started.wait(timeout=10):
+            raise RuntimeError("HTTP/2 test server failed to start")
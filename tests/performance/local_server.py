@@ -12,7 +12,7 @@ from pathlib import Path
 from typing import Optional
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Response
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.responses import PlainTextResponse
 
 
@@ -85,7 +85,10 @@ class LocalTestServer:
             return {"status": "healthy", "server": "whurl-performance-test"}
 
         @self.app.get("/foo.hts")
-        async def hilltop_endpoint(service: str = None, request: str = None):
+        async def hilltop_endpoint(
+            service: str = Query(None, alias="Service"),
+            request: str = Query(None, alias="Request"),
+        ):
             """Provide Main Hilltop-compatible endpoint."""
             # Simulate artificial delay if configured
             if self.default_delay > 0:
@@ -4,16 +4,19 @@ This module tests httpx performance features related to concurrency:
 - Sync vs async client performance
 - Concurrent request handling
 - Async context manager usage
+- Throughput and lock contention of one client shared by 1 to 64 threads
+- One polling cycle over thousands of telemetry series
 """
 
 import asyncio
+import os
 import time
 from concurrent.futures import ThreadPoolExecutor
 
 import httpx
 import pytest
 
-from whurl.client import HilltopClient
+from whurl.client import AsyncHilltopClient, HilltopClient
 
 
 class TestSyncVsAsyncPerformance:
@@ -289,10 +292,9 @@ class TestHilltopClientConcurrency:
 
     @pytest.mark.performance
     def test_hilltop_client_thread_safety(self, local_test_server):
-        """Test HilltopClient thread safety (though it's not designed for it)."""
+        """Test the pattern of one HilltopClient per thread."""
 
-        # Note: HilltopClient is not designed to be thread-safe
-        # This test demonstrates the recommended pattern: one client per thread
+        # A single client can also be shared, see TestSharedClientStress.
 
         def make_requests_with_own_client():
             """Each thread creates its own client."""
@@ -373,3 +375,109 @@ class TestHilltopClientConcurrency:
         print(
             f"Single client improvement: {((multiple_clients_time - single_client_time) / multiple_clients_time * 100):.1f}%"
         )
+
+    @pytest.mark.performance
+    def test_hilltop_client_map(self, local_test_server):
+        """Test that map on one shared client beats sequential requests."""
+        with HilltopClient(
+            base_url=local_test_server["base_url"],
+            hts_endpoint=local_test_server["hts_endpoint"],
+            timeout=30,
+        ) as client:
+            client.get_status()  # Warm up the connection pool.
+
+            start_time = time.perf_counter()
+            sequential = [client.get_status() for _ in range(20)]
+            sequential_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            mapped = client.map("get_status", [{}] * 20)
+            mapped_time = time.perf_counter() - start_time
+
+        assert len(mapped) == len(sequential) == 20
+        assert not any(isinstance(result, Exception) for result in mapped)
+
+        print(f"Sequential RPS: {20/sequential_time:.2f}")
+        print(f"Mapped RPS: {20/mapped_time:.2f}")
+
+
+class TestSharedClientStress:
+    """Stress one HilltopClient shared by many threads."""
+
+    # Requests per thread count; raise it for a longer soak.
+    REQUESTS = int(os.getenv("TEST_STRESS_REQUESTS", "500"))
+
+    @pytest.mark.performance
+    def test_shared_client_scaling(self, local_test_server):
+        """Report throughput and lock contention from 1 to 64 threads."""
+        rows = []
+        for threads in (1, 2, 4, 8, 16, 32, 64):
+            with HilltopClient(
+                base_url=local_test_server["base_url"],
+                hts_endpoint=local_test_server["hts_endpoint"],
+                timeout=30,
+                max_connections=threads,
+                max_keepalive_connections=threads,
+            ) as client:
+                start_time = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=threads) as executor:
+                    results = list(
+                        executor.map(
+                            lambda _: client.get_status(), range(self.REQUESTS)
+                        )
+                    )
+                elapsed = time.perf_counter() - start_time
+                stats = client.stats()
+
+            assert len(results) == self.REQUESTS
+            assert stats["responses"] == self.REQUESTS
+            assert stats["error_responses"] == 0
+            rows.append((threads, self.REQUESTS / elapsed, stats["lock"]))
+
+        base_rps = rows[0][1]
+        print(
+            f"{'threads':>7} {'RPS':>8} {'scaling':>8} {'contended':>10} {'wait ms':>8}"
+        )
+        for threads, rps, lock in rows:
+            contended = lock["contentions"] / lock["acquisitions"]
+            print(
+                f"{threads:>7} {rps:>8.1f} {rps / base_rps:>7.1f}x "
+                f"{contended:>9.2%} {lock['wait_time'] * 1000:>8.2f}"
+            )
+
+        # More threads must not make a shared client slower.
+        assert max(rps for _, rps, _ in rows) > base_rps
+
+
+class TestTelemetryPolling:
+    """Time one polling cycle over many telemetry series."""
+
+    # Series per cycle; the target deployment polls about 2,000, which takes
+    # about 15 s here as the test server shares the process.
+    SERIES = int(os.getenv("TEST_POLLING_SERIES", "500"))
+
+    @pytest.mark.performance
+    async def test_polling_cycle(self, local_test_server):
+        """Test that a full wave of series is polled well inside a minute."""
+        async with AsyncHilltopClient(
+            base_url=local_test_server["base_url"],
+            hts_endpoint=local_test_server["hts_endpoint"],
+            timeout=30,
+            max_connections=50,
+            max_keepalive_connections=50,
+        ) as client:
+            poller = client.poller(
+                [(f"Site {i}", "Stage") for i in range(self.SERIES)],
+                max_concurrency=50,
+            )
+            start_time = time.perf_counter()
+            updates = await poller.poll_once()
+            elapsed = time.perf_counter() - start_time
+
+            # Nothing is due again straight away.
+            assert await poller.poll_once() == []
+
+        assert len(updates) == self.SERIES
+        assert all(state.error is None for state in poller.series.values())
+        print(f"Polled {self.SERIES} series in {elapsed:.2f}s")
+        assert elapsed < 30
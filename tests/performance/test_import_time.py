@@ -0,0 +1,108 @@
+"""Tests for import-time performance.
+
+CLI tools and serverless functions pay for ``import whurl`` on every cold
+start. These tests guard against heavy dependencies creeping back into the
+import chain:
+- Importing the package or the clients must not import pandas, PyYAML or the
+  response parsers
+- Response models are still importable on demand
+- The client import stays cheaper than importing pandas alone
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Modules that are only needed once a response is parsed or displayed.
+DEFERRED_MODULES = [
+    "pandas",
+    "numpy",
+    "yaml",
+    "xmltodict",
+    "dotenv",
+    "whurl.schemas.responses.get_data",
+    "whurl.schemas.responses.site_list",
+]
+
+
+def _imported_modules(statement: str) -> set[str]:
+    """Run a statement in a fresh interpreter and return the loaded modules."""
+    code = f"import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(json.loads(result.stdout))
+
+
+def _cumulative_import_us(module: str) -> int:
+    """Return the cumulative import time of a module in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time: <self> | <cumulative> | <name>"
+    for line in reversed(result.stderr.splitlines()):
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"No import time reported for {module}")
+
+
+class TestImportChain:
+    """Check which modules the package imports eagerly."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("statement", ["import whurl", "import whurl.client"])
+    def test_heavy_modules_are_deferred(self, statement):
+        """Test that importing whurl does not import heavy dependencies."""
+        loaded = _imported_modules(statement)
+        assert not loaded & set(DEFERRED_MODULES)
+
+    @pytest.mark.unit
+    def test_responses_import_on_demand(self):
+        """Test that response models load when first accessed."""
+        loaded = _imported_modules(
+            "from whurl.schemas.responses import GetDataResponse"
+        )
+        assert "whurl.schemas.responses.get_data" in loaded
+        assert "pandas" in loaded
+        assert "whurl.schemas.responses.site_list" not in loaded
+
+    @pytest.mark.unit
+    def test_package_exports_clients(self):
+        """Test that the clients are still available from the package."""
+        import whurl
+        from whurl.client import AsyncHilltopClient, HilltopClient
+
+        assert whurl.HilltopClient is HilltopClient
+        assert whurl.AsyncHilltopClient is AsyncHilltopClient
+
+
+class TestImportTime:
+    """Benchmark the cost of importing the clients."""
+
+    @pytest.mark.performance
+    def test_client_import_time(self, benchmark):
+        """Benchmark a cold import of the client module."""
+        benchmark.pedantic(
+            subprocess.run,
+            args=([sys.executable, "-c", "import whurl.client"],),
+            kwargs={"check": True},
+            rounds=5,
+            iterations=1,
+        )
+
+    @pytest.mark.performance
+    def test_client_import_cheaper_than_pandas(self):
+        """Test that importing the client costs less than importing pandas."""
+        client_us = min(_cumulative_import_us("whurl.client") for _ in range(3))
+        pandas_us = min(_cumulative_import_us("pandas") for _ in range(3))
+
+        print(f"whurl.client: {client_us / 1000:.1f} ms")
+        print(f"pandas:       {pandas_us / 1000:.1f} ms")
+
+        assert client_us < pandas_us
@@ -4,15 +4,17 @@ This module tests httpx performance features related to HTTP protocols:
 - HTTP/1.1 vs HTTP/2 performance
 - Protocol negotiation
 - Protocol-specific optimizations
+- HTTP/2 fan-out of many concurrent GetData requests over few connections
 """
 
 import asyncio
+import os
 import time
 
 import httpx
 import pytest
 
-from whurl.client import HilltopClient
+from whurl.client import AsyncHilltopClient, HilltopClient
 
 
 class TestHTTPProtocolPerformance:
@@ -239,3 +241,92 @@ class TestProtocolConfiguration:
             )
             assert response.status_code == 200
             # Should work regardless of what protocol the server actually supports
+
+
+class TestHTTP2FanOut:
+    """Test the clients' HTTP/2 fan-out mode."""
+
+    # Requests per fan-out; raise it to compare protocols at scale.
+    FAN_OUT = int(os.getenv("TEST_FANOUT_REQUESTS", "200"))
+
+    @staticmethod
+    def _get_data_kwargs(count):
+        """Return GetData parameters for many distinct sites."""
+        return [{"site": f"Site {i}", "measurement": "Flow"} for i in range(count)]
+
+    @pytest.mark.performance
+    async def test_async_fanout_get_data(self, local_h2_server, local_test_server):
+        """Compare HTTP/2 fan-out with an HTTP/1.1 pool for GetData."""
+        kwargs_list = self._get_data_kwargs(self.FAN_OUT)
+        connections_before = local_h2_server["server"].connections
+
+        async with AsyncHilltopClient(
+            base_url=local_h2_server["base_url"],
+            hts_endpoint=local_h2_server["hts_endpoint"],
+            timeout=30,
+            http2=True,
+            max_connections=2,
+            max_streams_per_connection=128,
+        ) as client:
+            start_time = time.perf_counter()
+            results = await asyncio.gather(
+                *(client.get_data(**kwargs) for kwargs in kwargs_list)
+            )
+            http2_time = time.perf_counter() - start_time
+            assert client.session is client._http2_session
+
+        async with AsyncHilltopClient(
+            base_url=local_test_server["base_url"],
+            hts_endpoint=local_test_server["hts_endpoint"],
+            timeout=30,
+        ) as client:
+            start_time = time.perf_counter()
+            http1_results = await asyncio.gather(
+                *(client.get_data(**kwargs) for kwargs in kwargs_list)
+            )
+            http1_time = time.perf_counter() - start_time
+
+        assert len(results) == len(http1_results) == self.FAN_OUT
+        assert local_h2_server["server"].connections - connections_before <= 2
+
+        print(f"HTTP/2 fan-out RPS: {self.FAN_OUT / http2_time:.1f}")
+        print(f"HTTP/1.1 pool RPS:  {self.FAN_OUT / http1_time:.1f}")
+        assert http2_time < http1_time
+
+    @pytest.mark.performance
+    def test_sync_fanout_map(self, benchmark, local_h2_server):
+        """Benchmark HTTP/2 fan-out from the sync client's map."""
+        with HilltopClient(
+            base_url=local_h2_server["base_url"],
+            hts_endpoint=local_h2_server["hts_endpoint"],
+            timeout=30,
+            http2=True,
+            max_connections=2,
+            max_streams_per_connection=32,
+        ) as client:
+            results = benchmark.pedantic(
+                client.map,
+                args=("get_data", self._get_data_kwargs(200)),
+                rounds=3,
+                iterations=1,
+            )
+
+        assert not any(isinstance(result, Exception) for result in results)
+
+    @pytest.mark.performance
+    async def test_fanout_falls_back_to_http1(self, local_test_server):
+        """Test that fan-out mode works against an HTTP/1.1-only server."""
+        async with AsyncHilltopClient(
+            base_url=local_test_server["base_url"],
+            hts_endpoint=local_test_server["hts_endpoint"],
+            timeout=30,
+            http2=True,
+            max_streams_per_connection=64,
+            http1_max_connections=16,
+        ) as client:
+            results = await asyncio.gather(
+                *(client.get_data(**kwargs) for kwargs in self._get_data_kwargs(50))
+            )
+            assert client.session is not client._http2_session
+
+        assert len(results) == 50
@@ -0,0 +1,51 @@
+"""Tests for SiteInfo parsing performance.
+
+Collection-wide SiteInfo responses carry dozens of fields and nested
+attribute-heavy elements for every site. These tests benchmark:
+- Parsing a large SiteInfo response
+- Converting it to a DataFrame
+"""
+
+import pytest
+
+NUM_SITES = 2_000
+
+
+@pytest.fixture(scope="module")
+def large_site_info_xml():
+    """Build a SiteInfo response with nested attributes for every site."""
+    intervals = "".join(
+        f'<Interval ARI="{ari}" Min10="5.2" Hour1="11.5" Day1="43.3"></Interval>'
+        for ari in (2, 5, 10, 20, 50, 100)
+    )
+    sites = "\n".join(
+        f'<Site Name="Site {i}">'
+        + "".join(f"<Field{j}>value {i}-{j}</Field{j}>" for j in range(30))
+        + f"<HIRDS>{intervals}</HIRDS></Site>"
+        for i in range(NUM_SITES)
+    )
+    return (
+        '<?xml version="1.0" ?>\n<HilltopServer>\n<Agency>Test Council</Agency>\n'
+        f"{sites}\n</HilltopServer>"
+    )
+
+
+class TestSiteInfoParsing:
+    """Benchmark SiteInfo parsing and conversion."""
+
+    @pytest.mark.performance
+    def test_parse_time(self, benchmark, large_site_info_xml):
+        """Benchmark parsing a large SiteInfo response."""
+        from whurl.schemas.responses import SiteInfoResponse
+
+        response = benchmark(SiteInfoResponse.from_xml, large_site_info_xml)
+        assert len(response.site) == NUM_SITES
+
+    @pytest.mark.performance
+    def test_to_dataframe_time(self, benchmark, large_site_info_xml):
+        """Benchmark converting a large SiteInfo response to a DataFrame."""
+        from whurl.schemas.responses import SiteInfoResponse
+
+        response = SiteInfoResponse.from_xml(large_site_info_xml)
+        df = benchmark(response.to_dataframe)
+        assert df.shape == (31, NUM_SITES)
@@ -0,0 +1,68 @@
+"""Tests for SiteList parsing performance.
+
+Large agencies return SiteLists with tens of thousands of sites. These tests
+compare the default model-per-site parsing with the compact array-backed
+mode:
+- Parse time of each mode
+- Memory retained by the parsed response
+"""
+
+import tracemalloc
+
+import pytest
+
+NUM_SITES = 20_000
+
+
+@pytest.fixture(scope="module")
+def large_site_list_xml():
+    """Build a SiteList response with NZTM coordinates for every site."""
+    sites = "\n".join(
+        f'<Site Name="Site {i}">\n'
+        f"<Easting>{1_100_000 + i * 37.5:.1f}</Easting>\n"
+        f"<Northing>{4_800_000 + i * 61.25:.1f}</Northing>\n"
+        "</Site>"
+        for i in range(NUM_SITES)
+    )
+    return (
+        '<?xml version="1.0" ?>\n<HilltopServer>\n<Agency>Test Council</Agency>\n'
+        f"{sites}\n</HilltopServer>"
+    )
+
+
+def _retained_bytes(xml: str, compact: bool) -> int:
+    """Return the memory held by a parsed response."""
+    from whurl.schemas.responses import SiteListResponse
+
+    tracemalloc.start()
+    response = SiteListResponse.from_xml(xml, compact=compact)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(response.site_list) == NUM_SITES
+    return retained
+
+
+class TestSiteListParsing:
+    """Compare full and compact SiteList parsing."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("compact", [False, True], ids=["models", "compact"])
+    def test_parse_time(self, benchmark, large_site_list_xml, compact):
+        """Benchmark parsing a large SiteList."""
+        from whurl.schemas.responses import SiteListResponse
+
+        response = benchmark(
+            SiteListResponse.from_xml, large_site_list_xml, compact=compact
+        )
+        assert len(response.site_list) == NUM_SITES
+
+    @pytest.mark.performance
+    def test_compact_retains_less_memory(self, large_site_list_xml):
+        """Test that the compact mode holds several times less memory."""
+        full = _retained_bytes(large_site_list_xml, compact=False)
+        compact = _retained_bytes(large_site_list_xml, compact=True)
+
+        print(f"models:  {full / 1e6:.1f} MB")
+        print(f"compact: {compact / 1e6:.1f} MB")
+
+        assert compact * 3 < full
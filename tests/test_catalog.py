@@ -0,0 +1,127 @@
+"""Tests for the in-memory catalog."""
+
+import pytest
+
+BASE_URL = "http://example.com"
+HTS_ENDPOINT = "foo.hts"
+SITE = "Test Site 123"
+
+
+def _mock_server(mock_hilltop, read_mocked, status_xml=None):
+    """Register the responses a catalog build or refresh needs."""
+    from whurl.schemas.requests import (CollectionListRequest,
+                                        MeasurementListRequest,
+                                        SiteListRequest, StatusRequest)
+
+    mock_hilltop(StatusRequest, status_xml or read_mocked("status", "response.xml"))
+    mock_hilltop(SiteListRequest, read_mocked("site_list", "all_response.xml"))
+    mock_hilltop(CollectionListRequest, read_mocked("collection_list", "response.xml"))
+    mock_hilltop(
+        MeasurementListRequest,
+        read_mocked("measurement_list", "multi_response.xml"),
+        site=SITE,
+    )
+
+
+def _check_indexes(catalog):
+    """Check the indexes built from the mocked responses."""
+    from datetime import datetime
+
+    assert "Test Site Alpha" in catalog.sites
+    assert catalog.measurements(SITE) == {
+        "Flow",
+        "Stage",
+        "Monthly Flow Deviation (monthly median)",
+        "Atmospheric Pressure",
+    }
+    assert catalog.sites_with("Stage") == {SITE}
+    assert catalog.sites_with("Rainfall") == set()
+    assert catalog.sites_with(
+        "Atmosperic Pressure", collection="AtmostphericPressure"
+    ) == {"Lake Thing at Place", "Whangatutoi at Waitotara"}
+    assert catalog.collection_items["AirTemperature"][0] == (
+        "Air Quality at Whatsit",
+        "Air Temperature (1.5m)",
+    )
+    assert catalog.time_range(SITE) == (
+        datetime(2023, 1, 1),
+        datetime(2025, 9, 16, 8, 15),
+    )
+    assert catalog.time_range(SITE, "Flow") == catalog.time_range(SITE)
+    assert catalog.time_range("Nowhere") is None
+
+
+@pytest.mark.unit
+def test_catalog_from_responses(read_mocked):
+    """Test indexing responses that are already held."""
+    from whurl.catalog import HilltopCatalog
+    from whurl.exceptions import HilltopRequestError
+    from whurl.schemas.responses import (CollectionListResponse,
+                                         MeasurementListResponse,
+                                         SiteListResponse)
+
+    catalog = HilltopCatalog(
+        site_list=SiteListResponse.from_xml(
+            read_mocked("site_list", "all_response.xml")
+        ),
+        measurement_lists={
+            SITE: MeasurementListResponse.from_xml(
+                read_mocked("measurement_list", "multi_response.xml")
+            )
+        },
+        collection_list=CollectionListResponse.from_xml(
+            read_mocked("collection_list", "response.xml")
+        ),
+    )
+
+    _check_indexes(catalog)
+    with pytest.raises(HilltopRequestError):
+        catalog.refresh()
+
+
+@pytest.mark.unit
+def test_catalog_build_and_refresh(httpx_mock, mock_hilltop, read_mocked):
+    """Test building a catalog and refreshing it after a data file changes."""
+    from whurl.catalog import HilltopCatalog
+    from whurl.client import HilltopClient
+    from whurl.schemas.requests import StatusRequest
+
+    _mock_server(mock_hilltop, read_mocked)
+
+    with HilltopClient(base_url=BASE_URL, hts_endpoint=HTS_ENDPOINT) as client:
+        catalog = HilltopCatalog.build(client, sites=[SITE])
+        _check_indexes(catalog)
+
+        # Nothing has been refreshed on the server, so only Status is fetched.
+        status_xml = read_mocked("status", "response.xml")
+        mock_hilltop(StatusRequest, status_xml)
+        assert catalog.refresh() == set()
+        assert len(httpx_mock.get_requests()) == 5
+
+        # A data file was refreshed, and the tracked site is in no collection
+        # that says which file it lives in, so it is re-fetched.
+        _mock_server(
+            mock_hilltop,
+            read_mocked,
+            status_xml.replace("<SoftRefresh>1234345", "<SoftRefresh>1234999", 1),
+        )
+        stale = catalog.refresh()
+
+    assert stale == {SITE}
+    _check_indexes(catalog)
+
+
+@pytest.mark.unit
+async def test_catalog_abuild(mock_hilltop, read_mocked):
+    """Test building a catalog with the async client."""
+    from whurl.catalog import HilltopCatalog
+    from whurl.client import AsyncHilltopClient
+
+    _mock_server(mock_hilltop, read_mocked)
+
+    async with AsyncHilltopClient(
+        base_url=BASE_URL, hts_endpoint=HTS_ENDPOINT
+    ) as client:
+        catalog = await HilltopCatalog.abuild(client, sites=[SITE])
+
+    _check_indexes(catalog)
@@ -0,0 +1,215 @@
+"""Tests for change detection between sync runs."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from whurl.changes import ChangeSnapshot, adetect_changes, detect_changes
+from whurl.client import AsyncHilltopClient, HilltopClient
+from whurl.schemas.requests import (MeasurementListRequest, SiteListRequest,
+                                    StatusRequest)
+from whurl.schemas.responses import MeasurementListResponse, StatusResponse
+
+BASE_URL = "http://example.com"
+HTS_ENDPOINT = "foo.hts"
+START = "2020-01-01T00:00:00"
+
+
+def _measurement_list_xml(hilltop_xml, site, ends):
+    """Build a MeasurementList response with one data source per end time."""
+    return hilltop_xml.measurement_list(
+        *(hilltop_xml.data_source(site, name, START, end) for name, end in ends.items())
+    )
+
+
+def _mock_server(mock_hilltop, hilltop_xml, soft_refresh, lists):
+    """Register Status, SiteList and MeasurementList responses."""
+    mock_hilltop(StatusRequest, hilltop_xml.status(soft_refresh))
+    mock_hilltop(SiteListRequest, hilltop_xml.site_list(*lists))
+    for site, ends in lists.items():
+        mock_hilltop(
+            MeasurementListRequest,
+            _measurement_list_xml(hilltop_xml, site, ends),
+            site=site,
+        )
+
+
+@pytest.mark.unit
+def test_snapshot_from_responses(hilltop_xml):
+    """Test that file counters and end times are read from responses."""
+    snapshot = ChangeSnapshot.from_responses(
+        StatusResponse.from_xml(hilltop_xml.status(5)),
+        {
+            "A": MeasurementListResponse.from_xml(
+                _measurement_list_xml(
+                    hilltop_xml,
+                    "A",
+                    {"Flow": "2024-01-01T00:00:00", "Stage": "2024-02-01T00:00:00"},
+                )
+            )
+        },
+    )
+
+    assert snapshot.file_counters == {"datafile.hts": (100, 5)}
+    assert snapshot.end_times == {
+        ("A", "Flow"): datetime(2024, 1, 1),
+        ("A", "Stage"): datetime(2024, 2, 1),
+    }
+
+
+@pytest.mark.unit
+def test_changed_series_and_files():
+    """Test that new series and moved end times are reported."""
+    before = ChangeSnapshot(
+        {"data.hts": (1, 1), "old.hts": (1, 1)},
+        {("A", "Flow"): datetime(2024, 1, 1), ("A", "Stage"): datetime(2024, 1, 1)},
+    )
+    after = ChangeSnapshot(
+        {"data.hts": (1, 2)},
+        {
+            ("A", "Flow"): datetime(2024, 1, 2),
+            ("A", "Stage"): datetime(2024, 1, 1),
+            ("B", "Flow"): datetime(2024, 1, 1),
+        },
+    )
+
+    assert before.changed_series(after) == {("A", "Flow"), ("B", "Flow")}
+    assert before.changed_files(after) == {"data.hts", "old.hts"}
+
+
+@pytest.mark.unit
+def test_save_and_load(tmp_path: Path):
+    """Test that a snapshot survives a round trip through a file."""
+    snapshot = ChangeSnapshot(
+        {"data.hts": (1, None)}, {("A", "Flow"): datetime(2024, 1, 1, 12, 30)}
+    )
+    path = tmp_path / "snapshot.json"
+    snapshot.save(path)
+
+    loaded = ChangeSnapshot.load(path)
+
+    assert loaded.file_counters == snapshot.file_counters
+    assert loaded.end_times == snapshot.end_times
+
+
+@pytest.mark.unit
+def test_detect_changes(httpx_mock, mock_hilltop, hilltop_xml):
+    """Test a first run, an unchanged run and a run with new data."""
+    _mock_server(
+        mock_hilltop,
+        hilltop_xml,
+        1,
+        {
+            "A": {"Flow": "2024-01-01T00:00:00"},
+            "B": {"Flow": "2024-01-01T00:00:00"},
+        },
+    )
+    with HilltopClient(base_url=BASE_URL, hts_endpoint=HTS_ENDPOINT) as client:
+        changed, first = detect_changes(client)
+        assert changed == {("A", "Flow"), ("B", "Flow")}
+
+        # No data file was refreshed, so only Status is fetched.
+        mock_hilltop(StatusRequest, hilltop_xml.status(1))
+        changed, second = detect_changes(client, first)
+        assert changed == set()
+        assert second.end_times == first.end_times
+        assert len(httpx_mock.get_requests()) == 5
+
+        _mock_server(
+            mock_hilltop,
+            hilltop_xml,
+            2,
+            {
+                "A": {"Flow": "2024-01-01T00:00:00"},
+                "B": {"Flow": "2024-01-01T00:15:00"},
+            },
+        )
+        changed, third = detect_changes(client, second)
+
+    assert changed == {("B", "Flow")}
+    assert third.end_times[("B", "Flow")] == datetime(2024, 1, 1, 0, 15)
+
+
+@pytest.mark.unit
+async def test_adetect_changes_for_some_sites(mock_hilltop, hilltop_xml):
+    """Test that stored end times of unchecked sites are kept."""
+    since = ChangeSnapshot(
+        {"datafile.hts": (100, 1)},
+        {
+            ("A", "Flow"): datetime(2024, 1, 1),
+            ("B", "Flow"): datetime(2024, 1, 1),
+        },
+    )
+    mock_hilltop(StatusRequest, hilltop_xml.status(2))
+    mock_hilltop(
+        MeasurementListRequest,
+        _measurement_list_xml(hilltop_xml, "A", {"Flow": "2024-01-02T00:00:00"}),
+        site="A",
+    )
+
+    async with AsyncHilltopClient(
+        base_url=BASE_URL, hts_endpoint=HTS_ENDPOINT
+    ) as client:
+        changed, snapshot = await adetect_changes(client, since, sites=["A"])
+
+    assert changed == {("A", "Flow")}
+    assert snapshot.end_times == {
+        ("A", "Flow"): datetime(2024, 1, 2),
+        ("B", "Flow"): datetime(2024, 1, 1),
+    }
+    assert snapshot.file_counters == since.file_counters
+
+
+@pytest.mark.unit
+def test_full_run_after_partial_run(mock_hilltop, hilltop_xml):
+    """Test that a full run still checks the sites a partial run skipped."""
+    since = ChangeSnapshot(
+        {"datafile.hts": (100, 1)},
+        {
+            ("A", "Flow"): datetime(2024, 1, 1),
+            ("B", "Flow"): datetime(2024, 1, 1),
+        },
+    )
+    ends = {
+        "A": {"Flow": "2024-01-02T00:00:00"},
+        "B": {"Flow": "2024-01-02T00:00:00"},
+    }
+    mock_hilltop(StatusRequest, hilltop_xml.status(2))
+    mock_hilltop(
+        MeasurementListRequest,
+        _measurement_list_xml(hilltop_xml, "A", ends["A"]),
+        site="A",
+    )
+    _mock_server(mock_hilltop, hilltop_xml, 2, ends)
+
+    with HilltopClient(base_url=BASE_URL, hts_endpoint=HTS_ENDPOINT) as client:
+        changed, partial = detect_changes(client, since, sites=["A"])
+        assert changed == {("A", "Flow")}
+        assert partial.file_counters == since.file_counters
+
+        changed, full = detect_changes(client, partial)
+
+    assert changed == {("B", "Flow")}
+    assert full.file_counters == {"datafile.hts": (100, 2)}
+
+
+@pytest.mark.unit
+def test_status_without_data_files(mock_hilltop, hilltop_xml):
+    """Test that every site is checked when Status lists no data files."""
+    status_xml = "<HilltopServer><Agency>Test Council</Agency></HilltopServer>"
+
+    with HilltopClient(base_url=BASE_URL, hts_endpoint=HTS_ENDPOINT) as client:
+        snapshot = None
+        for end in ["2024-01-01T00:00:00", "2024-01-03T00:00:00"]:
+            mock_hilltop(StatusRequest, status_xml)
+            mock_hilltop(SiteListRequest, hilltop_xml.site_list("A"))
+            mock_hilltop(
+                MeasurementListRequest,
+                _measurement_list_xml(hilltop_xml, "A", {"Flow": end}),
+                site="A",
+            )
+            changed, snapshot = detect_changes(client, snapshot)
+
+    assert snapshot.file_counters == {}
+    assert changed == {("A", "Flow")}
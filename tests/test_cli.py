@@ -0,0 +1,208 @@
+"""Tests for bulk downloads and the whurl command."""
+
+import importlib.util
+import json
+from datetime import datetime
+
+import httpx
+import pandas as pd
+import pytest
+
+from whurl.cli import main
+from whurl.download import DownloadJob, DownloadManifest, plan_chunks
+from whurl.exceptions import HilltopConfigError
+
+BASE_URL = "http://example.com"
+
+
+def _serve(httpx_mock, hilltop_xml, failing=()):
+    """Answer GetData requests with hourly values, or errors for some sites."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        if params["Site"] in failing:
+            return httpx.Response(
+                200, text="<HilltopServer><Error>Busy</Error></HilltopServer>"
+            )
+        times = pd.date_range(params["From"], params["To"], freq="h")
+        return httpx.Response(
+            200, text=hilltop_xml.get_data(params["Site"], zip(times, times.hour))
+        )
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+
+
+def _write_manifest(tmp_path, **options):
+    """Write a YAML manifest for two sites over three days in 1-day chunks."""
+    manifest = {
+        "base_url": BASE_URL,
+        "hts_endpoint": "data.hts",
+        "output": str(tmp_path / "out"),
+        "chunk": "1D",
+        "selections": [
+            {
+                "sites": ["Site A", "Site B"],
+                "measurements": ["Flow"],
+                "from": "2024-01-01T00:00:00",
+                "to": "2024-01-04T00:00:00",
+            }
+        ],
+        **options,
+    }
+    path = tmp_path / "manifest.yaml"
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    return path
+
+
+@pytest.mark.unit
+def test_plan_chunks(tmp_path):
+    """Test that windows are split into chunks and repeats dropped."""
+    manifest = DownloadManifest.load(_write_manifest(tmp_path, chunk="2D"))
+    manifest.selections.append(manifest.selections[0])
+
+    chunks = plan_chunks(manifest)
+
+    assert [(c.site, c.start.day, c.end.day, c.last) for c in chunks] == [
+        ("Site A", 1, 3, False),
+        ("Site A", 3, 4, True),
+        ("Site B", 1, 3, False),
+        ("Site B", 3, 4, True),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"chunk": "-1D"},
+        {"format": "xlsx"},
+        {"selections": []},
+        {
+            "selections": [
+                {
+                    "sites": ["Site A"],
+                    "measurements": ["Flow"],
+                    "from": "2024-01-04T00:00:00",
+                    "to": "2024-01-01T00:00:00",
+                }
+            ]
+        },
+    ],
+)
+def test_invalid_manifest(tmp_path, options):
+    """Test that invalid manifests are rejected."""
+    with pytest.raises(HilltopConfigError):
+        DownloadManifest.load(_write_manifest(tmp_path, **options))
+
+
+@pytest.mark.unit
+def test_download_and_resume(tmp_path, httpx_mock, hilltop_xml, capsys):
+    """Test that chunks are written once and skipped when run again."""
+    _serve(httpx_mock, hilltop_xml)
+    manifest = _write_manifest(tmp_path)
+
+    assert main(["download", str(manifest)]) == 0
+
+    files = sorted((tmp_path / "out").rglob("*.csv"))
+    assert len(files) == 6
+    assert files[0].relative_to(tmp_path / "out").as_posix() == (
+        "site=Site%20A/measurement=Flow/20240101T000000_20240102T000000.csv"
+    )
+    first = pd.read_csv(files[0], index_col="DateTime", parse_dates=True)
+    assert first.index.max() == datetime(2024, 1, 1, 23)
+    last = pd.read_csv(files[2], index_col="DateTime", parse_dates=True)
+    assert last.index.max() == datetime(2024, 1, 4)
+
+    out = capsys.readouterr()
+    assert "[6/6]" in out.err
+    assert "6 chunks downloaded, 0 already done, 0 failed; 146 rows" in out.out
+
+    assert main(["download", str(manifest)]) == 0
+    assert len(httpx_mock.get_requests()) == 6
+    assert "0 chunks downloaded, 6 already done" in capsys.readouterr().out
+
+
+@pytest.mark.unit
+def test_failed_chunks_are_retried(tmp_path, httpx_mock, hilltop_xml, capsys):
+    """Test that failed chunks are left out of the checkpoint."""
+    manifest = _write_manifest(tmp_path)
+    checkpoint = tmp_path / "progress.jsonl"
+    _serve(httpx_mock, hilltop_xml, failing={"Site B"})
+
+    assert main(["download", str(manifest), "--checkpoint", str(checkpoint)]) == 1
+    assert len(checkpoint.read_text().splitlines()) == 3
+    assert "3 failed" in capsys.readouterr().out
+
+    httpx_mock.reset()
+    _serve(httpx_mock, hilltop_xml)
+    assert main(["download", str(manifest), "--checkpoint", str(checkpoint), "-q"]) == 0
+    assert {r.url.params["Site"] for r in httpx_mock.get_requests()} == {"Site B"}
+    assert "3 chunks downloaded, 3 already done" in capsys.readouterr().out
+
+
+@pytest.mark.unit
+def test_chunks_ending_in_the_future_are_fetched_again(
+    tmp_path, httpx_mock, hilltop_xml
+):
+    """Test that a chunk that may still get data is not checkpointed."""
+    _serve(httpx_mock, hilltop_xml)
+    today = pd.Timestamp.now().floor("D")
+    selection = {
+        "sites": ["Site A"],
+        "measurements": ["Flow"],
+        "from": f"{today - pd.Timedelta(days=2):%Y-%m-%dT%H:%M:%S}",
+        "to": f"{today + pd.Timedelta(days=1):%Y-%m-%dT%H:%M:%S}",
+    }
+    manifest = DownloadManifest.load(_write_manifest(tmp_path, selections=[selection]))
+
+    first = DownloadJob(manifest).run()
+    second = DownloadJob(manifest).run()
+
+    assert first["downloaded"] == 3
+    assert (second["skipped"], second["downloaded"]) == (2, 1)
+    assert len(httpx_mock.get_requests()) == 4
+
+
+@pytest.mark.unit
+def test_interrupted_download_resumes(tmp_path, httpx_mock, hilltop_xml):
+    """Test that an interrupted job checkpoints what it wrote and resumes."""
+    _serve(httpx_mock, hilltop_xml)
+    manifest = DownloadManifest.load(_write_manifest(tmp_path, max_workers=2))
+    lines = []
+
+    def interrupt(line):
+        lines.append(line)
+        if len(lines) == 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        DownloadJob(manifest).run(report=interrupt)
+
+    checkpoint = tmp_path / "out" / "checkpoint.jsonl"
+    done = [json.loads(line)["chunk"] for line in checkpoint.read_text().splitlines()]
+    files = sorted((tmp_path / "out").rglob("*.csv"))
+    assert 2 <= len(done) < 6
+    assert len(files) == len(done) == len(httpx_mock.get_requests())
+
+    summary = DownloadJob(manifest).run()
+
+    assert summary["skipped"] == len(done)
+    assert summary["downloaded"] == 6 - len(done)
+    assert len(httpx_mock.get_requests()) == 6
+    assert len(list((tmp_path / "out").rglob("*.csv"))) == 6
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(
+    any(importlib.util.find_spec(name) for name in ("pyarrow", "fastparquet")),
+    reason="a Parquet engine is installed",
+)
+def test_parquet_needs_an_engine(tmp_path, capsys):
+    """Test that Parquet output without an engine is refused."""
+    manifest = _write_manifest(tmp_path)
+
+    with pytest.raises(SystemExit) as exc:
+        main(["download", str(manifest), "--format", "parquet"])
+
+    assert exc.value.code == 2
+    assert "pyarrow" in capsys.readouterr().err
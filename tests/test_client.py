@@ -150,3 +150,630 @@ async def test_async_hilltop_client_validate_response():
     )
     with pytest.raises(HilltopResponseError):
         await client._validate_response(invalid_response)
+
+
+def _read_mocked(*parts):
+    """Read a mocked response file."""
+    from pathlib import Path
+
+    return (Path(__file__).parent / "mocked_data" / Path(*parts)).read_text(
+        encoding="utf-8"
+    )
+
+
+def test_hilltop_client_fetch_template(httpx_mock):
+    """Test that stamped template requests can be sent with fetch."""
+    from whurl.client import HilltopClient
+    from whurl.schemas.requests import GetDataRequest
+    from whurl.schemas.responses import GetDataResponse
+
+    xml = _read_mocked("get_data", "basic_response.xml")
+
+    with HilltopClient(base_url="http://example.com", hts_endpoint="foo.hts") as client:
+        template = client.request_template(
+            GetDataRequest, measurement="Stage", from_datetime="Data Start"
+        )
+        for site in ["Site A", "Site B"]:
+            httpx_mock.add_response(url=template.gen_url(site=site), text=xml)
+
+        results = [client.fetch(template.stamp(site=s)) for s in ["Site A", "Site B"]]
+
+    assert all(isinstance(r, GetDataResponse) for r in results)
+    assert [r.request.site for r in results] == ["Site A", "Site B"]
+
+
+def test_hilltop_client_fetch_unknown_request():
+    """Test that fetch rejects requests without a response model."""
+    from whurl.client import HilltopClient
+    from whurl.exceptions import HilltopRequestError
+    from whurl.schemas.requests.base import BaseHilltopRequest
+
+    with HilltopClient(base_url="http://example.com", hts_endpoint="foo.hts") as client:
+        with pytest.raises(HilltopRequestError):
+            client.fetch(BaseHilltopRequest())
+
+
+async def test_async_hilltop_client_fetch_template(httpx_mock):
+    """Test that stamped template requests can be sent with async fetch."""
+    import asyncio
+
+    from whurl.client import AsyncHilltopClient
+    from whurl.schemas.requests import StatusRequest
+    from whurl.schemas.responses import StatusResponse
+
+    xml = _read_mocked("status", "response.xml")
+
+    async with AsyncHilltopClient(
+        base_url="http://example.com", hts_endpoint="foo.hts"
+    ) as client:
+        template = client.request_template(StatusRequest)
+        httpx_mock.add_response(url=template.gen_url(), text=xml, is_reusable=True)
+        results = await asyncio.gather(
+            *(client.fetch(template.stamp()) for _ in range(3))
+        )
+
+    assert all(isinstance(r, StatusResponse) for r in results)
+
+
+def _site_info_xml(site: str) -> str:
+    """Build a SiteInfo response for one site."""
+    return (
+        "<HilltopServer><Agency>Test Council</Agency>"
+        f'<Site Name="{site}"><Easting>1</Easting><Northing>2</Northing>'
+        "<Altitude>3</Altitude></Site></HilltopServer>"
+    )
+
+
+def test_hilltop_client_get_site_info_many(httpx_mock):
+    """Test that site info is fetched per site and combined in order."""
+    from whurl.client import HilltopClient
+    from whurl.schemas.requests import SiteInfoRequest
+
+    sites = [f"Site {i}" for i in range(5)]
+    fields = ["Easting", "Northing"]
+
+    with HilltopClient(base_url="http://example.com", hts_endpoint="foo.hts") as client:
+        template = client.request_template(SiteInfoRequest, field_list=fields)
+        for site in sites:
+            httpx_mock.add_response(
+                url=template.gen_url(site=site), text=_site_info_xml(site)
+            )
+        result = client.get_site_info_many(sites, field_list=fields, max_workers=3)
+
+    assert result.agency == "Test Council"
+    assert [site.name for site in result.site] == sites
+    # Fields the server returned but were not asked for are not parsed.
+    assert all(site.info == {"Easting": "1", "Northing": "2"} for site in result.site)
+    assert result.to_dataframe().shape == (2, 5)
+
+
+async def test_async_hilltop_client_get_site_info_many(httpx_mock):
+    """Test that site info is fetched concurrently and combined in order."""
+    from whurl.client import AsyncHilltopClient
+    from whurl.schemas.requests import SiteInfoRequest
+
+    sites = [f"Site {i}" for i in range(5)]
+
+    async with AsyncHilltopClient(
+        base_url="http://example.com", hts_endpoint="foo.hts"
+    ) as client:
+        template = client.request_template(SiteInfoRequest)
+        for site in sites:
+            httpx_mock.add_response(
+                url=template.gen_url(site=site), text=_site_info_xml(site)
+            )
+        result = await client.get_site_info_many(sites, max_concurrency=2)
+
+    assert [site.name for site in result.site] == sites
+    assert set(result.site[0].info) == {"Easting", "Northing", "Altitude"}
+
+
+def test_hilltop_client_get_time_ranges(httpx_mock):
+    """Test that time ranges are fetched per pair and tabulated in order."""
+    import pandas as pd
+
+    from whurl.client import HilltopClient
+    from whurl.schemas.requests import TimeRangeRequest
+
+    xml = _read_mocked("time_range", "response.xml")
+    pairs = [("Test Site Alpha", "Stage")] * 3
+
+    with HilltopClient(base_url="http://example.com", hts_endpoint="foo.hts") as client:
+        url = TimeRangeRequest(
+            base_url="http://example.com",
+            hts_endpoint="foo.hts",
+            site="Test Site Alpha",
+            measurement="Stage",
+        ).gen_url()
+        httpx_mock.add_response(url=url, text=xml, is_reusable=True)
+        ranges = client.get_time_ranges(pairs, max_workers=2)
+
+    assert list(ranges.columns) == ["Site", "Measurement", "From", "To", "Units"]
+    assert len(ranges) == 3
+    assert ranges.loc[0, "From"] == pd.Timestamp("2023-01-01T00:00:00")
+    assert ranges.loc[0, "Units"] == "mm"
+
+
+def test_hilltop_client_get_time_ranges_from_measurement_list(httpx_mock):
+    """Test that the MeasurementList source sends one request per site."""
+    import pandas as pd
+
+    from whurl.client import HilltopClient
+    from whurl.exceptions import HilltopRequestError
+    from whurl.schemas.requests import MeasurementListRequest
+
+    xml = _read_mocked("measurement_list", "multi_response.xml")
+    pairs = [
+        ("Test Site 123", "Stage"),
+        ("Test Site 123", "Rainfall"),
+        ("Test Site 123", "Atmospheric Pressure"),
+    ]
+
+    with HilltopClient(base_url="http://example.com", hts_endpoint="foo.hts") as client:
+        url = client.request_template(MeasurementListRequest).gen_url(
+            site="Test Site 123"
+        )
+        httpx_mock.add_response(url=url, text=xml)
+        ranges = client.get_time_ranges(pairs, source="measurement_list")
+
+        with pytest.raises(HilltopRequestError):
+            client.get_time_ranges(pairs, source="site_info")
+
+    assert list(ranges["Measurement"]) == [m for _, m in pairs]
+    assert ranges.loc[0, "Units"] == "mm"
+    assert ranges.loc[2, "To"] == pd.Timestamp("2025-09-16T08:15:00")
+    assert pd.isna(ranges.loc[1, "From"])
+
+
+async def test_async_hilltop_client_get_time_ranges(httpx_mock):
+    """Test that time ranges are fetched concurrently."""
+    from whurl.client import AsyncHilltopClient
+    from whurl.schemas.requests import MeasurementListRequest
+
+    xml = _read_mocked("measurement_list", "multi_response.xml")
+
+    async with AsyncHilltopClient(
+        base_url="http://example.com", hts_endpoint="foo.hts"
+    ) as client:
+        url = client.request_template(MeasurementListRequest).gen_url(
+            site="Test Site 123"
+        )
+        httpx_mock.add_response(url=url, text=xml)
+        ranges = await client.get_time_ranges(
+            [("Test Site 123", "Flow")], source="measurement_list"
+        )
+
+    assert ranges.loc[0, "Units"] == "l/s"
+
+
+def test_hilltop_client_map(httpx_mock):
+    """Test that map keeps input order and captures per-item errors."""
+    from whurl.client import HilltopClient
+    from whurl.exceptions import HilltopResponseError
+    from whurl.schemas.requests import SiteInfoRequest
+    from whurl.schemas.responses import SiteInfoResponse
+
+    sites = [f"Site {i}" for i in range(6)]
+
+    with HilltopClient(base_url="http://example.com", hts_endpoint="foo.hts") as client:
+        template = client.request_template(SiteInfoRequest)
+        for i, site in enumerate(sites):
+            if i == 3:
+                httpx_mock.add_response(url=template.gen_url(site=site), status_code=500)
+            else:
+                httpx_mock.add_response(
+                    url=template.gen_url(site=site), text=_site_info_xml(site)
+                )
+        results = client.map("get_site_info", [{"site": site} for site in sites])
+
+        assert isinstance(results[3], HilltopResponseError)
+        assert [r.site[0].name for i, r in enumerate(results) if i != 3] == [
+            site for i, site in enumerate(sites) if i != 3
+        ]
+        assert all(
+            isinstance(r, SiteInfoResponse) for i, r in enumerate(results) if i != 3
+        )
+        executor = client._executor
+
+    # Closing the client shuts its thread pool down.
+    assert client._executor is None
+    assert executor._shutdown
+
+
+def test_hilltop_client_map_bounds_concurrency():
+    """Test that map runs at most max_workers calls at once."""
+    import threading
+    import time
+
+    from whurl.client import HilltopClient
+
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def work(value):
+        with lock:
+            running.append(value)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(value)
+        return value * 2
+
+    with HilltopClient(
+        base_url="http://example.com", hts_endpoint="foo.hts", max_connections=8
+    ) as client:
+        results = client.map(work, [{"value": i} for i in range(20)], max_workers=3)
+
+    assert results == [i * 2 for i in range(20)]
+    assert max(peak) <= 3
+
+
+def test_hilltop_client_map_errors():
+    """Test map's argument checks and raising mode."""
+    from whurl.client import HilltopClient
+    from whurl.exceptions import HilltopRequestError
+
+    def fail(value):
+        raise ValueError(value)
+
+    with HilltopClient(base_url="http://example.com", hts_endpoint="foo.hts") as client:
+        with pytest.raises(HilltopRequestError):
+            client.map("not_a_method", [{}])
+        with pytest.raises(HilltopRequestError):
+            client.map("_validate_response", [{}])
+        with pytest.raises(HilltopRequestError):
+            client.map(fail, [{"value": 1}], max_workers=0)
+        with pytest.raises(ValueError, match="1"):
+            client.map(fail, [{"value": 1}, {"value": 2}], return_exceptions=False)
+        assert client.map(fail, []) == []
+
+
+def test_hilltop_client_stats_shared_between_threads(httpx_mock):
+    """Test that responses from many threads are all counted."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from whurl.client import HilltopClient
+    from whurl.schemas.requests import StatusRequest
+
+    xml = _read_mocked("status", "response.xml")
+
+    with HilltopClient(base_url="http://example.com", hts_endpoint="foo.hts") as client:
+        url = client.request_template(StatusRequest).gen_url()
+        httpx_mock.add_response(url=url, text=xml, is_reusable=True)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: client.get_status(), range(40)))
+        stats = client.stats()
+
+    assert stats["responses"] == 40
+    assert stats["error_responses"] == 0
+    assert stats["lock"]["acquisitions"] >= 40
+
+
+def test_hilltop_client_fanout_config_error():
+    """Test that fan-out options are validated."""
+    from whurl.client import AsyncHilltopClient, HilltopClient
+    from whurl.exceptions import HilltopConfigError
+
+    options = {"base_url": "http://example.com", "hts_endpoint": "foo.hts"}
+    for client_class in (HilltopClient, AsyncHilltopClient):
+        with pytest.raises(HilltopConfigError):
+            client_class(**options, max_streams_per_connection=16)
+        with pytest.raises(HilltopConfigError):
+            client_class(**options, http2=True, max_streams_per_connection=0)
+        with pytest.raises(HilltopConfigError):
+            client_class(
+                **options,
+                http2=True,
+                max_streams_per_connection=16,
+                http1_max_connections=0,
+            )
+
+
+def test_hilltop_client_fanout_falls_back_to_http1(httpx_mock):
+    """Test that fan-out mode switches to HTTP/1.1 for HTTP/1.1 servers."""
+    from whurl.client import HilltopClient
+
+    xml = _read_mocked("status", "response.xml")
+    httpx_mock.add_response(text=xml, is_reusable=True)
+
+    with HilltopClient(
+        base_url="http://example.com",
+        hts_endpoint="foo.hts",
+        http2=True,
+        max_streams_per_connection=16,
+    ) as client:
+        results = client.map("get_status", [{}] * 10, return_exceptions=False)
+        assert client.session is not client._http2_session
+        assert client._http2_session in client._retired_sessions
+
+    assert len(results) == 10
+
+
+async def test_async_hilltop_client_fanout_falls_back_to_http1(httpx_mock):
+    """Test that async fan-out mode switches to HTTP/1.1 for HTTP/1.1 servers."""
+    import asyncio
+
+    from whurl.client import AsyncHilltopClient
+
+    xml = _read_mocked("status", "response.xml")
+    httpx_mock.add_response(text=xml, is_reusable=True)
+
+    async with AsyncHilltopClient(
+        base_url="http://example.com",
+        hts_endpoint="foo.hts",
+        http2=True,
+        max_streams_per_connection=16,
+    ) as client:
+        results = await asyncio.gather(*(client.get_status() for _ in range(10)))
+        assert client.session is not client._http2_session
+
+    assert len(results) == 10
+
+
+def test_hilltop_client_fanout_keeps_http2_after_connect_error(httpx_mock):
+    """Test that failing to connect does not switch fan-out mode to HTTP/1.1."""
+    import httpx
+
+    from whurl.client import HilltopClient
+
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+
+    with HilltopClient(
+        base_url="http://example.com",
+        hts_endpoint="foo.hts",
+        http2=True,
+        max_streams_per_connection=16,
+    ) as client:
+        with pytest.raises(httpx.ConnectError):
+            client.get_status()
+        assert client.session is client._http2_session
+        assert client._retired_sessions == []
+
+
+async def test_async_hilltop_client_fanout_keeps_http2_after_connect_error(
+    httpx_mock,
+):
+    """Test that failing to connect does not switch async fan-out to HTTP/1.1."""
+    import httpx
+
+    from whurl.client import AsyncHilltopClient
+
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+
+    async with AsyncHilltopClient(
+        base_url="http://example.com",
+        hts_endpoint="foo.hts",
+        http2=True,
+        max_streams_per_connection=16,
+    ) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get_status()
+        assert client.session is client._http2_session
+        assert client._retired_sessions == []
+
+
+def test_hilltop_client_compression(httpx_mock):
+    """Test that compressed responses are requested, decoded and counted."""
+    import gzip
+    import zlib
+
+    from pytest_httpx import IteratorStream
+
+    from whurl.client import HilltopClient
+    from whurl.schemas.responses import StatusResponse
+
+    xml = _read_mocked("status", "response.xml")
+    body = xml.encode("utf-8")
+    for encoding, compressed in [
+        ("gzip", gzip.compress(body)),
+        ("deflate", zlib.compress(body)),
+    ]:
+        # Chunked, so the body is decompressed as it is read.
+        chunks = [compressed[i : i + 64] for i in range(0, len(compressed), 64)]
+        httpx_mock.add_response(
+            match_headers={"Accept-Encoding": "gzip, deflate"},
+            stream=IteratorStream(chunks),
+            headers={"Content-Encoding": encoding},
+        )
+
+    with HilltopClient(base_url="http://example.com", hts_endpoint="foo.hts") as client:
+        results = [client.get_status(), client.get_status()]
+        stats = client.stats()
+
+    expected = StatusResponse.from_xml(xml).model_dump(exclude={"request"})
+    assert [r.model_dump(exclude={"request"}) for r in results] == [expected] * 2
+    assert stats["bytes_decoded"] == 2 * len(body)
+    assert 0 < stats["bytes_received"] < stats["bytes_decoded"]
+
+
+async def test_async_hilltop_client_compression_disabled(httpx_mock):
+    """Test that compression can be turned off."""
+    from pytest_httpx import IteratorStream
+
+    from whurl.client import AsyncHilltopClient
+
+    body = _read_mocked("status", "response.xml").encode("utf-8")
+    httpx_mock.add_response(
+        match_headers={"Accept-Encoding": "identity"},
+        stream=IteratorStream([body]),
+    )
+
+    async with AsyncHilltopClient(
+        base_url="http://example.com", hts_endpoint="foo.hts", compression=False
+    ) as client:
+        await client.get_status()
+        stats = client.stats()
+
+    assert stats["bytes_received"] == stats["bytes_decoded"] == len(body)
+
+
+def test_hilltop_client_hedges_slow_requests(httpx_mock):
+    """Test that a stalled request is hedged and the faster copy is used."""
+    import threading
+    import time
+
+    import httpx
+
+    from whurl.client import HilltopClient
+    from whurl.hedging import HedgePolicy
+
+    xml = _read_mocked("status", "response.xml")
+    calls = []
+    lock = threading.Lock()
+
+    def respond(request):
+        with lock:
+            calls.append(request)
+            stalled = len(calls) == 1
+        if stalled:
+            time.sleep(0.5)
+        return httpx.Response(200, text=xml)
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    policy = HedgePolicy(initial_delay=0.05, budget=1.0)
+
+    with HilltopClient(
+        base_url="http://example.com", hts_endpoint="foo.hts", hedging=policy
+    ) as client:
+        start = time.perf_counter()
+        client.get_status()
+        elapsed = time.perf_counter() - start
+        stats = client.stats()
+
+    assert elapsed < 0.4
+    assert len(calls) == 2
+    assert stats["hedging"]["hedges"] == stats["hedging"]["hedge_wins"] == 1
+
+
+def test_hilltop_client_hedge_delay_starts_when_sent(httpx_mock):
+    """Test that time spent waiting for a hedging thread is not hedged."""
+    import time
+
+    from whurl.client import HilltopClient
+    from whurl.hedging import HedgePolicy
+
+    httpx_mock.add_response(text=_read_mocked("status", "response.xml"))
+    policy = HedgePolicy(initial_delay=0.05, budget=1.0)
+
+    with HilltopClient(
+        base_url="http://example.com",
+        hts_endpoint="foo.hts",
+        max_connections=1,
+        hedging=policy,
+    ) as client:
+        # Keep both hedging threads busy for longer than the hedge delay.
+        executor = client._get_hedge_executor()
+        for _ in range(2):
+            executor.submit(time.sleep, 0.3)
+        client.get_status()
+        stats = client.stats()
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert stats["hedging"]["hedges"] == 0
+
+
+async def test_async_hilltop_client_hedges_slow_requests(httpx_mock):
+    """Test that async hedging cancels the copy that loses the race."""
+    import asyncio
+    import time
+
+    import httpx
+
+    from whurl.client import AsyncHilltopClient
+    from whurl.hedging import HedgePolicy
+
+    xml = _read_mocked("status", "response.xml")
+    calls = []
+
+    async def respond(request):
+        calls.append(request)
+        if len(calls) == 2:
+            await asyncio.sleep(10)
+        return httpx.Response(200, text=xml)
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    policy = HedgePolicy(initial_delay=0.05, budget=0.5)
+
+    async with AsyncHilltopClient(
+        base_url="http://example.com", hts_endpoint="foo.hts", hedging=policy
+    ) as client:
+        start = time.perf_counter()
+        # The budget allows one hedge per two requests, from the second on.
+        await client.get_status()
+        await client.get_status()
+        elapsed = time.perf_counter() - start
+        stats = client.stats()
+
+    assert elapsed < 1
+    assert len(calls) == 3
+    assert stats["hedging"]["requests"] == 2
+    assert stats["hedging"]["hedges"] == stats["hedging"]["hedge_wins"] == 1
+
+
+def test_hilltop_client_endpoints_round_robin(httpx_mock):
+    """Test that requests are spread across mirrors."""
+    from whurl.client import HilltopClient
+
+    xml = _read_mocked("status", "response.xml")
+    httpx_mock.add_response(text=xml, is_reusable=True)
+    urls = ["http://primary.example.com", "http://replica.example.com"]
+
+    with HilltopClient(base_url=urls, hts_endpoint="foo.hts") as client:
+        assert client.base_url == urls[0]
+        for _ in range(4):
+            client.get_status()
+        stats = client.stats()
+
+    assert [r.url.host for r in httpx_mock.get_requests()] == [
+        "primary.example.com",
+        "replica.example.com",
+    ] * 2
+    assert [stats["endpoints"][url]["requests"] for url in urls] == [2, 2]
+
+
+def test_hilltop_client_endpoints_failover(httpx_mock):
+    """Test that a failed mirror is retried elsewhere and then skipped."""
+    import re
+
+    import httpx
+
+    from whurl.client import HilltopClient
+
+    xml = _read_mocked("status", "response.xml")
+    httpx_mock.add_exception(
+        httpx.ConnectError("Connection refused"),
+        url=re.compile(r"http://primary\.example\.com/.*"),
+    )
+    httpx_mock.add_response(
+        url=re.compile(r"http://replica\.example\.com/.*"),
+        text=xml,
+        is_reusable=True,
+    )
+    urls = ["http://primary.example.com", "http://replica.example.com"]
+
+    with HilltopClient(base_url=urls, hts_endpoint="foo.hts") as client:
+        for _ in range(3):
+            client.get_status()
+        stats = client.stats()["endpoints"]
+
+    assert stats[urls[0]]["failures"] == 1
+    assert not stats[urls[0]]["healthy"]
+    assert stats[urls[1]]["requests"] == 3
+
+
+async def test_async_hilltop_client_endpoints_server_error(httpx_mock):
+    """Test that 5xx responses fail over, and the last one is returned."""
+    from whurl.client import AsyncHilltopClient
+    from whurl.exceptions import HilltopResponseError
+
+    httpx_mock.add_response(status_code=503, is_reusable=True)
+    urls = ["http://primary.example.com", "http://replica.example.com"]
+
+    async with AsyncHilltopClient(base_url=urls, hts_endpoint="foo.hts") as client:
+        with pytest.raises(HilltopResponseError):
+            await client.get_status()
+        stats = client.stats()["endpoints"]
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert all(stats[url]["failures"] == 1 for url in urls)
@@ -0,0 +1,59 @@
+"""Tests for the coordinate transforms."""
+
+import numpy as np
+import pytest
+
+# Wellington, Auckland, Christchurch and Invercargill, with reference values
+# from PROJ (NZGD49 shifted with the EPSG:1564 seven-parameter transform).
+LONGITUDE = [174.7762, 174.7633, 172.6362, 168.3538]
+LATITUDE = [-41.2865, -36.8485, -43.5321, -46.4132]
+NZTM_EASTING = [1748735.553, 1757209.253, 1570604.409, 1242940.487]
+NZTM_NORTHING = [5427916.479, 5920482.809, 5180029.368, 4849543.893]
+NZMG_EASTING = [2658759.624, 2667645.680, 2480605.107, 2152700.919]
+NZMG_NORTHING = [5989629.930, 6482180.720, 5741642.227, 5411538.592]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "crs, easting, northing",
+    [
+        ("EPSG:2193", NZTM_EASTING, NZTM_NORTHING),
+        ("EPSG:27200", NZMG_EASTING, NZMG_NORTHING),
+    ],
+)
+def test_projection_matches_reference(crs, easting, northing):
+    """Test forward and inverse projections against reference values."""
+    from whurl.coordinates import transform
+
+    x, y = transform(LONGITUDE, LATITUDE, "EPSG:4326", crs)
+    np.testing.assert_allclose(x, easting, atol=0.01)
+    np.testing.assert_allclose(y, northing, atol=0.01)
+
+    lon, lat = transform(easting, northing, crs, "EPSG:4167")
+    np.testing.assert_allclose(lon, LONGITUDE, atol=1e-7)
+    np.testing.assert_allclose(lat, LATITUDE, atol=1e-7)
+
+
+@pytest.mark.unit
+def test_projected_to_projected():
+    """Test conversion between NZMG and NZTM."""
+    from whurl.coordinates import transform
+
+    x, y = transform(NZMG_EASTING, NZMG_NORTHING, "EPSG:27200", "EPSG:2193")
+    np.testing.assert_allclose(x, NZTM_EASTING, atol=0.01)
+    np.testing.assert_allclose(y, NZTM_NORTHING, atol=0.01)
+
+
+@pytest.mark.unit
+def test_missing_values_and_invalid_codes():
+    """Test that NaN passes through and unknown codes are rejected."""
+    from whurl.coordinates import transform
+    from whurl.exceptions import HilltopRequestError
+
+    x, y = transform(
+        [np.nan, 1748735.553], [5427916.479, np.nan], "EPSG:2193", "EPSG:4326"
+    )
+    assert np.isnan(x).all() and np.isnan(y).all()
+
+    with pytest.raises(HilltopRequestError):
+        transform([0.0], [0.0], "EPSG:3857", "EPSG:4326")
@@ -0,0 +1,105 @@
+"""Tests for downsampling series for plotting."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from whurl.downsampling import downsample, lttb, min_max
+from whurl.exceptions import HilltopRequestError
+from whurl.schemas.responses import GetDataResponse
+
+
+def _series(size=10_000):
+    """Build a noisy wave with one spike up and one down."""
+    index = pd.date_range("2020-01-01", periods=size, freq="5min", name="DateTime")
+    rng = np.random.default_rng(0)
+    flow = np.sin(np.arange(size) / 500) + rng.random(size) * 0.1
+    flow[1234], flow[6543] = 50.0, -50.0
+    return pd.DataFrame(
+        {"Flow": flow, "Stage": np.arange(size, dtype=float), "Quality": "Good"},
+        index=index,
+    )
+
+
+@pytest.mark.unit
+def test_lttb():
+    """Test that LTTB keeps the ends and picks one point per bucket."""
+    x = np.arange(10)
+    y = np.array([0, 1, 0, 1, 9, 1, 0, 1, 0, 1], dtype=float)
+
+    picked = lttb(x, y, 4)
+
+    assert picked.tolist() == [0, 4, 5, 9]
+    assert lttb(x, y, 20).tolist() == list(range(10))
+
+
+@pytest.mark.unit
+def test_min_max():
+    """Test that each bucket's extremes are kept."""
+    y = np.array([3, 1, 2, 8, 5, 4, 0, 7, 6, 9], dtype=float)
+
+    assert min_max(y, 4).tolist() == [1, 3, 6, 9]
+    assert min_max(np.arange(100.0), 60).size <= 60
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("method", ["lttb", "min_max"])
+def test_downsample_keeps_peaks(method):
+    """Test that series are cut to n points without losing their peaks."""
+    frame = _series()
+
+    result = downsample(frame, 500, method=method, columns=["Flow"])
+
+    assert len(result) <= 500
+    assert result.index.is_monotonic_increasing
+    assert result["Flow"].max() == 50.0
+    assert result["Flow"].min() == -50.0
+    assert list(result.columns) == ["Flow", "Stage", "Quality"]
+
+
+@pytest.mark.unit
+def test_downsample_each_column():
+    """Test that every numeric column picks its own points."""
+    frame = _series()
+    frame.loc[frame.index[:5000], "Stage"] = np.nan
+
+    result = downsample(frame, 100)
+
+    flow_only = downsample(frame, 100, columns=["Flow"])
+    assert 100 < len(result) <= 200
+    assert set(flow_only.index) < set(result.index)
+    assert result.loc[frame.index[5000], "Stage"] == 5000.0
+    assert downsample(frame.iloc[:50], 100).equals(frame.iloc[:50])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"n": 100, "method": "m4"},
+        {"n": 2, "method": "lttb"},
+        {"n": 1, "method": "min_max"},
+        {"n": 100, "columns": ["Rainfall"]},
+    ],
+)
+def test_invalid_options(options):
+    """Test that invalid options are rejected."""
+    with pytest.raises(HilltopRequestError):
+        downsample(_series(), **options)
+
+
+@pytest.mark.unit
+def test_response_downsample(hilltop_xml):
+    """Test downsampling every measurement of a response."""
+    times = pd.date_range("2024-01-01", periods=200, freq="h")
+    raw = GetDataResponse.from_xml(
+        hilltop_xml.get_data("Site A", [(t, i % 7) for i, t in enumerate(times)])
+    )
+
+    display = raw.downsample(20, method="min_max")
+
+    frame = display.measurement[0].data.timeseries
+    assert len(frame) <= 20
+    assert (frame["Flow"].min(), frame["Flow"].max()) == (0.0, 6.0)
+    assert len(raw.measurement[0].data.timeseries) == 200
+    assert raw.downsample(20, columns=["Stage"]).measurement[0] is raw.measurement[0]
@@ -0,0 +1,119 @@
+"""Tests for load balancing across Hilltop mirrors."""
+
+from collections import Counter
+
+import pytest
+
+from whurl.endpoints import EndpointPool
+from whurl.exceptions import HilltopConfigError
+
+URLS = ["http://primary.example.com", "http://replica.example.com"]
+
+
+def _send(pool, latency=0.1):
+    """Acquire and release an endpoint, returning its URL."""
+    endpoint = pool.acquire()
+    pool.release(endpoint, latency=latency)
+    return endpoint.url
+
+
+@pytest.mark.unit
+def test_round_robin():
+    """Test that requests alternate between endpoints."""
+    pool = EndpointPool(URLS)
+    assert [_send(pool) for _ in range(4)] == URLS * 2
+
+
+@pytest.mark.unit
+def test_least_outstanding():
+    """Test that the endpoint with fewer requests in flight is chosen."""
+    pool = EndpointPool(URLS, strategy="least_outstanding")
+    busy = [pool.acquire() for _ in range(2)]
+    assert {e.url for e in busy} == set(URLS)
+
+    pool.release(busy[1], latency=0.1)
+    assert pool.acquire() is busy[1]
+
+
+@pytest.mark.unit
+def test_latency_weighted():
+    """Test that faster endpoints get proportionally more requests."""
+    pool = EndpointPool(URLS, strategy="latency_weighted")
+    primary, replica = pool.endpoints
+    pool.release(pool.acquire(exclude=[replica]), latency=0.1)
+    pool.release(pool.acquire(exclude=[primary]), latency=0.4)
+
+    counts = Counter()
+    for _ in range(2000):
+        endpoint = pool.acquire()
+        counts[endpoint.url] += 1
+        pool.release(endpoint)
+
+    assert 3 < counts[URLS[0]] / counts[URLS[1]] < 5
+
+
+@pytest.mark.unit
+def test_failed_endpoint_is_skipped_until_cooldown():
+    """Test that a failed endpoint leaves rotation for the cooldown."""
+    pool = EndpointPool(URLS, cooldown=60)
+    primary = pool.acquire()
+    pool.release(primary, failed=True)
+
+    assert {_send(pool) for _ in range(4)} == {URLS[1]}
+    assert pool.stats()[URLS[0]] == {
+        "outstanding": 0,
+        "requests": 1,
+        "failures": 1,
+        "latency": None,
+        "healthy": False,
+    }
+
+    primary.down_until = 0.0
+    assert {_send(pool) for _ in range(4)} == set(URLS)
+
+
+@pytest.mark.unit
+def test_all_endpoints_down():
+    """Test that the endpoint back soonest is used when all are down."""
+    pool = EndpointPool(URLS, cooldown=60)
+    first = pool.acquire()
+    pool.release(first, failed=True)
+    second = pool.acquire()
+    pool.release(second, failed=True)
+
+    assert second is not first
+    assert pool.acquire() is first
+    with pytest.raises(HilltopConfigError):
+        pool.acquire(exclude=pool.endpoints)
+
+
+@pytest.mark.unit
+def test_url_for():
+    """Test that request URLs are moved to another endpoint's base URL."""
+    pool = EndpointPool(URLS)
+    url = URLS[0] + "/foo.hts?Service=Hilltop&Request=Status"
+
+    assert pool.url_for(url, pool.endpoints[1]) == (
+        URLS[1] + "/foo.hts?Service=Hilltop&Request=Status"
+    )
+    assert pool.url_for("http://other.com/foo.hts", pool.endpoints[1]) == (
+        "http://other.com/foo.hts"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"urls": []},
+        {"urls": "http://primary.example.com"},
+        {"urls": URLS * 2},
+        {"urls": URLS, "strategy": "random"},
+        {"urls": URLS, "cooldown": -1},
+        {"urls": URLS, "smoothing": 0},
+    ],
+)
+def test_invalid_options(options):
+    """Test that invalid pools are rejected."""
+    with pytest.raises(HilltopConfigError):
+        EndpointPool(**options)
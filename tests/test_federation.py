@@ -0,0 +1,197 @@
+"""Tests for federated queries across HTS endpoints."""
+
+import re
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from whurl.exceptions import HilltopConfigError, HilltopResponseError
+from whurl.federation import AsyncFederatedClient, FederatedClient
+from whurl.schemas.responses import (GetDataResponse, MeasurementListResponse,
+                                     SiteListResponse)
+
+BASE_URL = "http://example.com"
+ERROR_XML = "<HilltopServer><Error>No data for site</Error></HilltopServer>"
+
+
+@pytest.fixture
+def get_data_xml(hilltop_xml):
+    """Build GetData responses with one Stage value per (minute, value) point."""
+
+    def build(points, site="Site A"):
+        rows = [(datetime(2023, 1, 1, 0, minute), value) for minute, value in points]
+        return hilltop_xml.get_data(site, rows, item="Stage")
+
+    return build
+
+
+def _stage(response):
+    """Return the Stage values of a single-measurement response by minute."""
+    (measurement,) = response.measurement
+    series = measurement.data.timeseries["Stage"]
+    return dict(zip(series.index.minute, series))
+
+
+def _mock(httpx_mock, endpoint, text):
+    """Answer every request to one HTS endpoint."""
+    httpx_mock.add_response(
+        url=re.compile(rf"{BASE_URL}/{re.escape(endpoint)}\?.*"), text=text
+    )
+
+
+@pytest.mark.unit
+def test_merge_get_data_by_timestamp(get_data_xml):
+    """Test that values at the same time come from the first response."""
+    first = GetDataResponse.from_xml(get_data_xml([(0, 1), (10, 1), (20, 1)]))
+    second = GetDataResponse.from_xml(get_data_xml([(5, 2), (20, 2), (30, 2)]))
+
+    merged = GetDataResponse.merge([first, second])
+
+    assert _stage(merged) == {0: 1, 5: 2, 10: 1, 20: 1, 30: 2}
+    assert merged.measurement[0].data.timeseries.index.is_monotonic_increasing
+    assert merged.agency == "Test Council"
+    assert merged.request is None
+
+
+@pytest.mark.unit
+def test_merge_get_data_by_range(get_data_xml):
+    """Test that the first response's time span replaces the others."""
+    first = GetDataResponse.from_xml(get_data_xml([(10, 1), (20, 1)]))
+    second = GetDataResponse.from_xml(get_data_xml([(0, 2), (15, 2), (30, 2)]))
+
+    merged = GetDataResponse.merge([first, second], overlap="range")
+
+    assert _stage(merged) == {0: 2, 10: 1, 20: 1, 30: 2}
+
+
+@pytest.mark.unit
+def test_merge_get_data_keeps_other_measurements(get_data_xml):
+    """Test that measurements in only one response are kept as they are."""
+    first = GetDataResponse.from_xml(get_data_xml([(0, 1)], site="Site A"))
+    second = GetDataResponse.from_xml(get_data_xml([(0, 2)], site="Site B"))
+
+    merged = GetDataResponse.merge([first, second])
+
+    assert [m.site_name for m in merged.measurement] == ["Site A", "Site B"]
+    assert merged.measurement[1] is second.measurement[0]
+
+
+@pytest.mark.unit
+def test_merge_site_and_measurement_lists(hilltop_xml):
+    """Test that sites and data sources found twice are listed once."""
+    sites = SiteListResponse.merge(
+        [
+            SiteListResponse.from_xml(hilltop_xml.site_list("A", "B")),
+            SiteListResponse.from_xml(hilltop_xml.site_list("B", "C"), compact=True),
+        ]
+    )
+    assert [site.name for site in sites.site_list] == ["A", "B", "C"]
+
+    lists = MeasurementListResponse.merge(
+        [
+            MeasurementListResponse.from_xml(
+                hilltop_xml.measurement_list(
+                    hilltop_xml.data_source(
+                        "A",
+                        "Water Level",
+                        "2023-01-01T00:00:00",
+                        "2024-01-01T00:00:00",
+                        ["Stage"],
+                    )
+                )
+            ),
+            MeasurementListResponse.from_xml(
+                hilltop_xml.measurement_list(
+                    hilltop_xml.data_source(
+                        "A",
+                        "Water Level",
+                        "2010-01-01T00:00:00",
+                        "2023-06-01T00:00:00",
+                        ["Stage", "Flow"],
+                    )
+                )
+            ),
+        ]
+    )
+    (source,) = lists.data_sources
+    assert (source.from_time.year, source.to_time.year) == (2010, 2024)
+    assert [m.name for m in source.measurements] == ["Stage", "Flow"]
+
+
+@pytest.mark.unit
+def test_federated_get_data(httpx_mock, get_data_xml):
+    """Test that every endpoint is queried and the results merged."""
+    _mock(httpx_mock, "data.hts", get_data_xml([(20, 1), (30, 1)]))
+    _mock(httpx_mock, "archive.hts", get_data_xml([(0, 2), (10, 2), (20, 2)]))
+    _mock(httpx_mock, "other.hts", ERROR_XML)
+
+    with FederatedClient(
+        ["data.hts", "archive.hts", "other.hts"], base_url=BASE_URL
+    ) as fed:
+        response = fed.get_data(site="Site A", measurement="Stage")
+
+    assert _stage(response) == {0: 2, 10: 2, 20: 1, 30: 1}
+    assert {r.url.path for r in httpx_mock.get_requests()} == {
+        "/data.hts",
+        "/archive.hts",
+        "/other.hts",
+    }
+
+
+@pytest.mark.unit
+def test_federated_every_endpoint_fails(httpx_mock):
+    """Test that an error is raised when no endpoint has the data."""
+    _mock(httpx_mock, "data.hts", ERROR_XML)
+    _mock(httpx_mock, "archive.hts", ERROR_XML)
+
+    with FederatedClient(["data.hts", "archive.hts"], base_url=BASE_URL) as fed:
+        with pytest.raises(HilltopResponseError):
+            fed.get_data(site="Site A", measurement="Stage")
+
+
+@pytest.mark.unit
+def test_federated_endpoint_down(httpx_mock, get_data_xml):
+    """Test that an HTTP error status is raised rather than left out."""
+    _mock(httpx_mock, "data.hts", get_data_xml([(20, 1), (30, 1)]))
+    httpx_mock.add_response(
+        url=re.compile(rf"{BASE_URL}/archive\.hts\?.*"),
+        status_code=503,
+        text="Service Unavailable",
+        is_reusable=True,
+    )
+
+    with FederatedClient(["data.hts", "archive.hts"], base_url=BASE_URL) as fed:
+        with pytest.raises(HilltopResponseError, match="503"):
+            fed.get_data(site="Site A", measurement="Stage")
+
+
+@pytest.mark.unit
+async def test_async_federated_site_list(httpx_mock, hilltop_xml):
+    """Test that the async client merges site lists."""
+    _mock(httpx_mock, "data.hts", hilltop_xml.site_list("A", "B"))
+    _mock(httpx_mock, "archive.hts", hilltop_xml.site_list("C", "A"))
+
+    async with AsyncFederatedClient(
+        ["data.hts", "archive.hts"], base_url=BASE_URL
+    ) as fed:
+        response = await fed.get_site_list()
+
+    assert isinstance(response.to_dataframe(), pd.DataFrame)
+    assert [site.name for site in response.site_list] == ["A", "B", "C"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"hts_endpoints": []},
+        {"hts_endpoints": "data.hts"},
+        {"hts_endpoints": ["data.hts", "data.hts"]},
+        {"hts_endpoints": ["data.hts"], "overlap": "latest"},
+    ],
+)
+def test_invalid_options(options):
+    """Test that invalid federations are rejected."""
+    with pytest.raises(HilltopConfigError):
+        FederatedClient(base_url=BASE_URL, **options)
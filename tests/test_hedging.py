@@ -0,0 +1,82 @@
+"""Tests for the request hedging policy."""
+
+import pytest
+
+from whurl.exceptions import HilltopConfigError
+from whurl.hedging import HedgePolicy
+from whurl.schemas.requests import GetDataRequest, StatusRequest
+
+
+@pytest.mark.unit
+def test_delay_uses_percentile_of_recent_latencies():
+    """Test that the delay follows the recorded response times."""
+    policy = HedgePolicy(percentile=90, min_samples=10, window=100)
+    assert policy.delay() == policy.initial_delay
+
+    for latency in range(1, 101):
+        policy.record(latency / 1000)
+    assert policy.delay() == pytest.approx(0.090, abs=0.001)
+
+    # Only the most recent window of response times counts.
+    for _ in range(100):
+        policy.record(0.2)
+    assert policy.delay() == pytest.approx(0.2)
+
+
+@pytest.mark.unit
+def test_delay_is_clamped():
+    """Test that the delay stays within the configured bounds."""
+    policy = HedgePolicy(min_delay=0.05, max_delay=0.5, min_samples=1)
+    policy.record(0.001)
+    assert policy.delay() == 0.05
+
+    policy = HedgePolicy(min_delay=0.05, max_delay=0.5, min_samples=1)
+    policy.record(20.0)
+    assert policy.delay() == 0.5
+
+
+@pytest.mark.unit
+def test_budget_caps_hedges():
+    """Test that no more than the budgeted fraction of requests is hedged."""
+    policy = HedgePolicy(budget=0.25)
+    allowed = 0
+    for _ in range(100):
+        policy.start()
+        allowed += policy.allow_hedge()
+
+    assert allowed == 25
+    assert policy.stats()["hedges"] == 25
+
+    full = HedgePolicy(budget=1.0)
+    full.start()
+    assert full.allow_hedge()
+    assert not full.allow_hedge()
+
+
+@pytest.mark.unit
+def test_applies_to_request_types():
+    """Test that only the configured request types are hedged."""
+    status = StatusRequest(base_url="http://example.com", hts_endpoint="foo.hts")
+    get_data = GetDataRequest(base_url="http://example.com", hts_endpoint="foo.hts")
+
+    assert HedgePolicy().applies_to(status)
+    assert not HedgePolicy().applies_to(get_data)
+    assert HedgePolicy(request_types=(GetDataRequest,)).applies_to(get_data)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"percentile": 0},
+        {"percentile": 101},
+        {"min_delay": 1.0, "max_delay": 0.5},
+        {"budget": 1.5},
+        {"budget": -0.1},
+        {"window": 10, "min_samples": 20},
+    ],
+)
+def test_invalid_options(options):
+    """Test that out of range options are rejected."""
+    with pytest.raises(HilltopConfigError):
+        HedgePolicy(**options)
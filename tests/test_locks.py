@@ -0,0 +1,52 @@
+"""Tests for the contention-tracking lock."""
+
+import threading
+
+import pytest
+
+from whurl.locks import TrackedLock
+
+
+@pytest.mark.unit
+def test_uncontended_acquisitions():
+    """Test that acquisitions without waiting are not counted as contended."""
+    lock = TrackedLock()
+    for _ in range(3):
+        with lock:
+            assert lock.locked()
+
+    assert not lock.locked()
+    assert lock.stats() == {"acquisitions": 3, "contentions": 0, "wait_time": 0.0}
+
+
+@pytest.mark.unit
+def test_contended_acquisition():
+    """Test that waiting for another thread is counted and timed."""
+    lock = TrackedLock()
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with lock:
+            holding.set()
+            release.wait()
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    holding.wait()
+
+    assert not lock.acquire(blocking=False)
+    assert not lock.acquire(timeout=0.01)
+
+    threading.Timer(0.02, release.set).start()
+    with lock:
+        pass
+    thread.join()
+
+    stats = lock.stats()
+    assert stats["acquisitions"] == 2
+    assert stats["contentions"] == 1
+    assert stats["wait_time"] > 0
+
+    lock.reset_stats()
+    assert lock.stats() == {"acquisitions": 0, "contentions": 0, "wait_time": 0.0}
@@ -0,0 +1,159 @@
+"""Tests for the telemetry polling engine."""
+
+import asyncio
+
+import httpx
+import pandas as pd
+import pytest
+
+from whurl.client import AsyncHilltopClient
+from whurl.exceptions import HilltopConfigError
+from whurl.polling import Poller
+
+START = pd.Timestamp("2024-01-01T00:00:00")
+
+
+class FakeServer:
+    """Serve GetData responses for series with a value every ``spacing``."""
+
+    def __init__(self, spacing, hilltop_xml):
+        self.spacing = spacing
+        self.hilltop_xml = hilltop_xml
+        self.now = START
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        params = request.url.params
+        site = params["Site"]
+        if site == "Missing":
+            return httpx.Response(
+                200, text="<HilltopServer><Error>No data</Error></HilltopServer>"
+            )
+        spacing = pd.Timedelta(seconds=self.spacing[site])
+        times = pd.date_range(START, self.now, freq=spacing)
+        if "From" in params:
+            times = times[times >= pd.Timestamp(params["From"])]
+        else:
+            times = times[-1:]
+        return httpx.Response(
+            200, text=self.hilltop_xml.get_data(site, zip(times, range(len(times))))
+        )
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+@pytest.fixture
+def server(httpx_mock, hilltop_xml):
+    """A fake server answering every GetData request."""
+    server = FakeServer({"Fast": 60, "Slow": 900}, hilltop_xml)
+    httpx_mock.add_callback(server, is_reusable=True)
+    return server
+
+
+@pytest.mark.unit
+async def test_poll_emits_only_new_rows(server):
+    """Test that each poll hands on the rows after the last one seen."""
+    clock = FakeClock()
+    async with AsyncHilltopClient(
+        base_url="http://example.com", hts_endpoint="foo.hts"
+    ) as client:
+        poller = client.poller([("Fast", "Flow")], clock=clock)
+
+        server.now = START + pd.Timedelta(minutes=10)
+        (first,) = await poller.poll_once()
+        assert list(first.data.index) == [server.now]
+
+        server.now += pd.Timedelta(minutes=3)
+        clock.time += 60
+        (second,) = await poller.poll_once()
+
+    assert len(second.data) == 3
+    assert second.data.index[0] > first.data.index[-1]
+    assert "From" in server.requests[-1].url.params
+
+
+@pytest.mark.unit
+async def test_intervals_follow_data_rate(server):
+    """Test that series are polled about as often as they report."""
+    clock = FakeClock()
+    async with AsyncHilltopClient(
+        base_url="http://example.com", hts_endpoint="foo.hts"
+    ) as client:
+        poller = client.poller(
+            [("Fast", "Flow"), ("Slow", "Flow"), ("Missing", "Flow")],
+            min_interval=30,
+            clock=clock,
+        )
+        await poller.poll_once()
+        for _ in range(3):
+            server.now += pd.Timedelta(minutes=30)
+            clock.time += 1800
+            await poller.poll_once()
+
+    fast, slow, missing = poller.series.values()
+    assert fast.interval == pytest.approx(60)
+    assert slow.interval == pytest.approx(900)
+    assert missing.error is not None
+    assert missing.interval == pytest.approx(60 * 1.5**4)
+
+
+@pytest.mark.unit
+async def test_only_due_series_are_polled(server):
+    """Test that a cycle skips series that are not yet due."""
+    clock = FakeClock()
+    async with AsyncHilltopClient(
+        base_url="http://example.com", hts_endpoint="foo.hts"
+    ) as client:
+        poller = client.poller([("Fast", "Flow"), ("Slow", "Flow")], clock=clock)
+        await poller.poll_once()
+        assert len(server.requests) == 2
+
+        await poller.poll_once()
+        assert len(server.requests) == 2
+        assert poller.next_due() == pytest.approx(60)
+
+
+@pytest.mark.unit
+async def test_run_until_stopped(server):
+    """Test that run passes updates to a callback until stopped."""
+    received = []
+    async with AsyncHilltopClient(
+        base_url="http://example.com", hts_endpoint="foo.hts"
+    ) as client:
+        poller = client.poller([("Fast", "Flow"), ("Slow", "Flow")])
+
+        async def callback(update):
+            received.append(update)
+            if len(received) == 2:
+                poller.stop()
+
+        await asyncio.wait_for(poller.run(callback), timeout=5)
+
+    assert {update.site for update in received} == {"Fast", "Slow"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"min_interval": 0},
+        {"interval": 10, "min_interval": 30},
+        {"interval": 1000, "max_interval": 900},
+        {"max_concurrency": 0},
+        {"backoff": 0.5},
+        {"smoothing": 0},
+    ],
+)
+def test_invalid_options(options):
+    """Test that out of range options are rejected."""
+    with pytest.raises(HilltopConfigError):
+        Poller(None, [], **options)
@@ -0,0 +1,134 @@
+"""Tests for local resampling of GetData results."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from whurl.exceptions import HilltopRequestError
+from whurl.resampling import resample
+from whurl.schemas.responses import GetDataResponse
+
+
+def _series(drop=()):
+    """Build a series with a value every 20 minutes from 00:10 to 03:50."""
+    index = pd.date_range(
+        "2024-01-01 00:10", "2024-01-01 03:50", freq="20min", name="DateTime"
+    )
+    frame = pd.DataFrame(
+        {"Flow": np.arange(len(index), dtype=float), "Quality": "Good"}, index=index
+    )
+    return frame.drop(frame.index[list(drop)])
+
+
+def _hours(frame):
+    """Map each row's hour to its values."""
+    return {t.hour: list(row) for t, row in zip(frame.index, frame.to_numpy())}
+
+
+@pytest.mark.unit
+def test_interpolate():
+    """Test that values are interpolated at each boundary in the data."""
+    assert _hours(resample(_series(), "Interpolate", "1 hour")) == {
+        1: [2.5],
+        2: [5.5],
+        3: [8.5],
+    }
+
+
+@pytest.mark.unit
+def test_average_is_time_weighted():
+    """Test that averages integrate the series over the covered time."""
+    result = resample(_series(), "Average", "1 hour")
+
+    assert list(result.columns) == ["Flow"]
+    assert _hours(result) == {1: [1.25], 2: [4.0], 3: [7.0], 4: [9.75]}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("method", ["Interpolate", "Average", "Total"])
+def test_non_nanosecond_index(method):
+    """Test that an index in another unit gives the same results."""
+    series = _series()
+    micros = series.set_axis(series.index.as_unit("us"))
+
+    result = resample(micros, method, "1 hour")
+
+    pd.testing.assert_frame_equal(result, resample(series, method, "1 hour"))
+
+
+@pytest.mark.unit
+def test_total_and_extrema():
+    """Test totals and extremes, labelled with the end of the interval."""
+    assert _hours(resample(_series(), "Total", "1 hour")) == {
+        1: [3.0],
+        2: [12.0],
+        3: [21.0],
+        4: [30.0],
+    }
+    extrema = resample(_series(), "Extrema", "1 hour")
+    assert list(extrema.columns) == ["Flow Min", "Flow Max"]
+    assert _hours(extrema)[2] == [3.0, 5.0]
+
+
+@pytest.mark.unit
+def test_alignment_and_calendar_intervals():
+    """Test that boundaries fall on the alignment time of day."""
+    result = resample(_series(), "Total", "2 hours", alignment="01:00")
+    assert _hours(result) == {1: [3.0], 3: [33.0], 5: [30.0]}
+
+    monthly = resample(_series(), "Total", "1 month", alignment="09:00")
+    assert monthly.index[0] == pd.Timestamp("2024-01-01 09:00")
+    assert monthly["Flow"].iloc[0] == 66.0
+
+
+@pytest.mark.unit
+def test_gap_tolerance():
+    """Test that intervals overlapping a long gap have no value."""
+    # The values from 01:30 to 02:10 are missing: an 80 minute gap.
+    series = _series(drop=[4, 5, 6])
+
+    average = resample(series, "Average", "1 hour", gap_tolerance="30 minutes")
+    assert np.isnan(average["Flow"].to_numpy()).tolist() == [False, True, True, False]
+
+    interpolated = resample(series, "Interpolate", "1 hour", gap_tolerance=1800)
+    assert np.isnan(interpolated["Flow"].to_numpy()).tolist() == [False, True, False]
+
+    moving = resample(series, "Moving Average", "1 hour", gap_tolerance="30 m")
+    assert moving["Flow"].isna().sum() == 3
+    assert moving.loc["2024-01-01 01:10", "Flow"] == 2.0
+
+    assert not resample(series, "Average", "1 hour")["Flow"].isna().any()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"method": "EP", "interval": "1 hour"},
+        {"method": "Median", "interval": "1 hour"},
+        {"method": "Average", "interval": "one hour"},
+        {"method": "Average", "interval": "1 hour", "alignment": "25:00"},
+        {"method": "Average", "interval": "1 hour", "gap_tolerance": "1 month"},
+        {"method": "Moving Average", "interval": "1 year"},
+    ],
+)
+def test_invalid_options(options):
+    """Test that statistics that cannot be computed locally are rejected."""
+    with pytest.raises(HilltopRequestError):
+        resample(_series(), **options)
+
+
+@pytest.mark.unit
+def test_response_resample(hilltop_xml):
+    """Test resampling every measurement of a response."""
+    times = pd.date_range("2024-01-01", periods=4, freq="30min")
+    raw = GetDataResponse.from_xml(
+        hilltop_xml.get_data("Site A", zip(times, [0, 2, 4, 4]))
+    )
+
+    hourly = raw.resample("Average", "1 hour")
+
+    (measurement,) = hourly.measurement
+    assert measurement.site_name == "Site A"
+    assert measurement.data.timeseries["Flow"].tolist() == [2.0, 4.0]
+    assert len(raw.measurement[0].data.timeseries) == 4
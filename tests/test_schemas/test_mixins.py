@@ -146,3 +146,48 @@ class TestModelReprMixin:
         assert "timeseries: '<DataFrame:" in repr_str
         assert "rows × " in repr_str
         assert "columns>'" in repr_str
+
+    def test_large_lists_are_truncated(self):
+        """Test that repr caps list items and summarises the full size."""
+
+        class Child(ModelReprMixin, BaseModel):
+            name: str
+
+        class Parent(ModelReprMixin, BaseModel):
+            children: list[Child]
+
+        model = Parent(children=[Child(name=f"child {i}") for i in range(5000)])
+        repr_str = repr(model)
+
+        assert repr_str.startswith("Parent:  # children: 5000 items")
+        assert "child 9" in repr_str
+        assert "child 10\n" not in repr_str
+        assert "... 4990 more items" in repr_str
+
+        parsed = yaml.safe_load(repr_str)
+        assert len(parsed["Parent"]["children"]) == 11
+
+        # The full dump is still available on request.
+        full = yaml.safe_load(model.to_yaml())
+        assert len(full["Parent"]["children"]) == 5000
+
+    def test_depth_limit(self):
+        """Test that models nested beyond repr_max_depth are elided."""
+
+        class Leaf(ModelReprMixin, BaseModel):
+            value: int
+
+        class Branch(ModelReprMixin, BaseModel):
+            leaf: Leaf
+
+        class Tree(ModelReprMixin, BaseModel):
+            repr_max_depth: ClassVar[int] = 1
+
+            branch: Branch
+
+        model = Tree(branch=Branch(leaf=Leaf(value=1)))
+
+        assert yaml.safe_load(repr(model)) == {"Tree": {"branch": {"leaf": "<Leaf>"}}}
+        assert yaml.safe_load(model.to_yaml()) == {
+            "Tree": {"branch": {"leaf": {"value": 1}}}
+        }
@@ -89,3 +89,87 @@ def test_validate_request():
             hts_endpoint="test.hts",
             request="InvalidRequest",
         )
+
+
+def test_requests_are_frozen():
+    """Test that requests cannot be modified after validation."""
+    from pydantic import ValidationError
+
+    from whurl.schemas.requests import GetDataRequest
+
+    request = GetDataRequest(
+        base_url="https://example.com", hts_endpoint="test.hts", site="Site A"
+    )
+    with pytest.raises(ValidationError):
+        request.site = "Site B"
+
+
+def test_gen_url_is_cached():
+    """Test that the URL is generated once and reused."""
+    from whurl.schemas.requests import GetDataRequest
+
+    request = GetDataRequest(
+        base_url="https://example.com", hts_endpoint="test.hts", site="Site A"
+    )
+    url = request.gen_url()
+    assert request.gen_url() is url
+
+    # Copies with updated fields must not reuse the stale URL.
+    copy = request.model_copy(update={"site": "Site B"})
+    assert "Site=Site%20B" in copy.gen_url()
+    assert request.gen_url() is url
+
+
+def test_cache_key():
+    """Test that equivalent requests share a canonical cache key."""
+    from whurl.schemas.requests import GetDataRequest
+
+    request = GetDataRequest(
+        base_url="https://Example.com/",
+        hts_endpoint="Test.hts",
+        site="Site A",
+        measurement="Flow",
+    )
+    same = GetDataRequest(
+        base_url="https://example.com",
+        hts_endpoint="test.hts",
+        measurement="Flow",
+        site="Site A",
+    )
+    other = GetDataRequest(
+        base_url="https://example.com",
+        hts_endpoint="test.hts",
+        measurement="Flow",
+        site="Site B",
+    )
+
+    assert request.cache_key() == same.cache_key()
+    assert request.cache_key() != other.cache_key()
+    assert request.cache_key() == (
+        "https://example.com/test.hts?"
+        "Measurement=Flow&Request=GetData&Service=Hilltop&Site=Site%20A"
+    )
+
+
+def test_requests_are_hashable():
+    """Test that requests can be used as dictionary keys."""
+    from whurl.schemas.requests import GetDataRequest, SiteInfoRequest
+
+    request = GetDataRequest(
+        base_url="https://example.com", hts_endpoint="test.hts", site="Site A"
+    )
+    same = GetDataRequest(
+        base_url="https://example.com", hts_endpoint="test.hts", site="Site A"
+    )
+    same.gen_url()  # A cached URL must not affect equality.
+
+    assert request == same
+    assert len({request, same}) == 1
+
+    field_list = SiteInfoRequest(
+        base_url="https://example.com",
+        hts_endpoint="test.hts",
+        site="Site A",
+        field_list=["Easting", "Northing"],
+    )
+    assert field_list in {field_list}
@@ -0,0 +1,128 @@
+import pytest
+
+
+class TestRequestTemplate:
+    def test_stamp_matches_direct_construction(self):
+        from whurl.schemas.requests import GetDataRequest, RequestTemplate
+
+        shared = {
+            "base_url": "http://example.com",
+            "hts_endpoint": "foo.hts",
+            "measurement": "Flow",
+            "from_datetime": "2024-01-01T00:00:00",
+            "to_datetime": "2024-02-01T00:00:00",
+        }
+        template = RequestTemplate(GetDataRequest, **shared)
+
+        for site in ["Site A", "Site & B", "Site/C"]:
+            stamped = template.stamp(site=site)
+            direct = GetDataRequest(site=site, **shared)
+
+            assert isinstance(stamped, GetDataRequest)
+            assert stamped.site == site
+            assert stamped.gen_url() == direct.gen_url()
+            assert template.gen_url(site=site) == direct.gen_url()
+
+        assert template.gen_url() == GetDataRequest(**shared).gen_url()
+        assert template.stamp() is template.base
+
+    def test_stamp_can_clear_a_field(self):
+        from whurl.schemas.requests import GetDataRequest, RequestTemplate
+
+        template = RequestTemplate(
+            GetDataRequest,
+            base_url="http://example.com",
+            hts_endpoint="foo.hts",
+            site="Site A",
+            measurement="Flow",
+        )
+
+        assert template.gen_url(site=None) == (
+            GetDataRequest(
+                base_url="http://example.com",
+                hts_endpoint="foo.hts",
+                measurement="Flow",
+            ).gen_url()
+        )
+
+    def test_non_template_fields_are_fully_validated(self):
+        from whurl.exceptions import HilltopRequestError
+        from whurl.schemas.requests import GetDataRequest, RequestTemplate
+
+        template = RequestTemplate(
+            GetDataRequest,
+            base_url="http://example.com",
+            hts_endpoint="foo.hts",
+            from_datetime="2024-01-01T00:00:00",
+        )
+
+        stamped = template.stamp(site="Site A", to_datetime="2024-02-01T00:00:00")
+        assert stamped.to_datetime == "2024-02-01T00:00:00"
+
+        # The model validator comparing From and To must still run.
+        with pytest.raises(HilltopRequestError):
+            template.stamp(to_datetime="2023-01-01T00:00:00")
+        with pytest.raises(HilltopRequestError):
+            template.gen_url(to_datetime="2023-01-01T00:00:00")
+
+    def test_template_fields_are_checked(self):
+        from whurl.exceptions import HilltopRequestError
+        from whurl.schemas.requests import (GetDataRequest, RequestTemplate,
+                                            TimeRangeRequest)
+
+        template = RequestTemplate(
+            TimeRangeRequest,
+            base_url="http://example.com",
+            hts_endpoint="foo.hts",
+            site="Site A",
+            measurement="Flow",
+        )
+
+        # TimeRange requires a site, so its own field validator must run.
+        with pytest.raises(HilltopRequestError):
+            template.stamp(site="")
+
+        template = RequestTemplate(
+            GetDataRequest, base_url="http://example.com", hts_endpoint="foo.hts"
+        )
+        with pytest.raises(HilltopRequestError):
+            template.stamp(site=42)
+        with pytest.raises(HilltopRequestError):
+            template.stamp(no_such_field="x")
+
+    def test_stamp_keeps_validated_values(self):
+        from pydantic import field_validator
+
+        from whurl.schemas.requests import RequestTemplate, TimeRangeRequest
+
+        class StrippedSiteRequest(TimeRangeRequest):
+            @field_validator("site", mode="before")
+            def strip_site(cls, value):
+                return value.strip() if isinstance(value, str) else value
+
+        shared = {
+            "base_url": "http://example.com",
+            "hts_endpoint": "foo.hts",
+            "measurement": "Flow",
+        }
+        template = RequestTemplate(StrippedSiteRequest, site="Site B", **shared)
+        direct = StrippedSiteRequest(site="  Site A ", **shared)
+
+        stamped = template.stamp(site="  Site A ")
+
+        assert stamped.site == direct.site == "Site A"
+        assert stamped.gen_url() == direct.gen_url()
+        assert stamped.cache_key() == direct.cache_key()
+        assert template.gen_url(site="  Site A ") == direct.gen_url()
+
+    def test_invalid_shared_parameters(self):
+        from whurl.exceptions import HilltopRequestError
+        from whurl.schemas.requests import GetDataRequest, RequestTemplate
+
+        with pytest.raises(HilltopRequestError):
+            RequestTemplate(
+                GetDataRequest,
+                base_url="http://example.com",
+                hts_endpoint="foo.hts",
+                method="NotAMethod",
+            )
@@ -45,3 +45,23 @@ class TestParameterValidation:
                 hts_endpoint=hts_endpoint,
                 request="InvalidRequest",
             ).gen_url()
+
+    def test_field_list(self):
+        """Test that the field list is sent as a comma-separated list."""
+        from whurl.schemas.requests import RequestTemplate, SiteInfoRequest
+
+        request = SiteInfoRequest(
+            base_url="http://example.com",
+            hts_endpoint="foo.hts",
+            site="River At Site",
+            field_list=["Easting", "Northing"],
+        )
+        assert request.gen_url().endswith("&FieldList=Easting%2CNorthing")
+
+        template = RequestTemplate(
+            SiteInfoRequest,
+            base_url="http://example.com",
+            hts_endpoint="foo.hts",
+            field_list=["Easting", "Northing"],
+        )
+        assert template.gen_url(site="River At Site") == request.gen_url()
@@ -1308,3 +1308,67 @@ class TestResponseValidation:
         assert isinstance(result, GetDataResponse)
         assert result.agency == "Test Council"
         assert isinstance(result.request, GetDataRequest)
+
+    @pytest.mark.unit
+    def test_to_wide_frame_unit(self, collection_response_xml_mocked):
+        """Test that collection measurements are aligned into one wide frame."""
+        import numpy as np
+        import pandas as pd
+
+        from whurl.schemas.responses import GetDataResponse
+
+        result = GetDataResponse.from_xml(collection_response_xml_mocked)
+        wide = result.to_wide_frame()
+
+        assert isinstance(wide, pd.DataFrame)
+        assert wide.index.name == "DateTime"
+        assert wide.index.is_monotonic_increasing
+        assert wide.index.is_unique
+        assert list(wide.columns.names) == ["Site", "Item"]
+        assert ("Test Site Alpha", "Stage") in wide.columns
+        assert ("Test Site Alpha", "Rainfall") in wide.columns
+
+        # The union index covers every timestamp from every measurement.
+        expected = set()
+        for measurement in result.measurement:
+            expected.update(measurement.data.timeseries.index)
+        assert set(wide.index) == expected
+
+        stage = result.measurement[0].data.timeseries["Stage"]
+        np.testing.assert_array_equal(
+            wide[("Test Site Alpha", "Stage")].loc[stage.index].to_numpy(),
+            stage.to_numpy(),
+        )
+        # Stage was not recorded at the rainfall timestamps.
+        rainfall_only = wide.index.difference(stage.index)
+        assert wide.loc[rainfall_only, ("Test Site Alpha", "Stage")].isna().all()
+
+    @pytest.mark.unit
+    def test_to_wide_frame_keeps_values_over_gaps_unit(self, hilltop_xml):
+        """Test that a gap in a later measurement keeps the earlier value."""
+        from datetime import datetime
+
+        import numpy as np
+
+        from whurl.schemas.responses import GetDataResponse
+
+        times = [datetime(2024, 1, 1, hour) for hour in range(3)]
+        result = GetDataResponse.from_xml(
+            hilltop_xml.get_data("Site A", zip(times, [1, 2, 3]))
+        )
+        later = GetDataResponse.from_xml(
+            hilltop_xml.get_data("Site A", zip(times[1:], [20, 30]))
+        )
+        later.measurement[0].data.timeseries.loc[times[1], "Flow"] = np.nan
+        result.measurement.extend(later.measurement)
+
+        wide = result.to_wide_frame()
+
+        assert wide[("Site A", "Flow")].tolist() == [1.0, 2.0, 30.0]
+
+    @pytest.mark.unit
+    def test_to_wide_frame_empty_unit(self):
+        """Test that a response without data gives an empty frame."""
+        from whurl.schemas.responses import GetDataResponse
+
+        assert GetDataResponse(Agency="Test Council").to_wide_frame().empty
@@ -717,3 +717,79 @@ class TestMeasurementList:
         # Test the top level response object
         assert isinstance(measurement_list, MeasurementListResponse)
         assert measurement_list.agency == "Test Council"
+
+    @pytest.mark.unit
+    def test_to_dataframe_unit(self, multi_response_xml_mocked):
+        """Test that every measurement of every data source becomes a row."""
+        import pandas as pd
+
+        from whurl.schemas.responses import MeasurementListResponse
+
+        measurement_list = MeasurementListResponse.from_xml(multi_response_xml_mocked)
+        df = measurement_list.to_dataframe()
+
+        assert list(df["Measurement Name"]) == [
+            "Flow",
+            "Stage",
+            "Monthly Flow Deviation (monthly median)",
+            "Atmospheric Pressure",
+        ]
+        assert list(df["DataSource"]) == [
+            "Flow",
+            "Flow",
+            "Flow",
+            "Atmospheric Pressure",
+        ]
+        assert (df["Site"] == "Test Site 123").all()
+        assert list(df["Units"]) == ["l/s", "mm", "%", "kpa"]
+        # Fields only set on some measurements are NaN elsewhere.
+        assert df["VM"].isna().tolist() == [True, True, False, True]
+        assert pd.api.types.is_datetime64_any_dtype(df["FirstRating"])
+        assert "Divisor" not in df.columns
+
+    @pytest.mark.unit
+    def test_to_dataframe_top_level_unit(self, units_response_xml_mocked):
+        """Test the frame for measurements outside any data source."""
+        from whurl.schemas.responses import MeasurementListResponse
+
+        measurement_list = MeasurementListResponse.from_xml(units_response_xml_mocked)
+        df = measurement_list.to_dataframe()
+
+        assert list(df.columns) == ["Measurement Name", "Units"]
+        assert list(df["Units"]) == ["m3/s", "m"]
+
+    @pytest.mark.unit
+    def test_availability_unit(self, multi_response_xml_mocked):
+        """Test the site by measurement availability matrix."""
+        from whurl.schemas.responses import MeasurementListResponse
+
+        measurement_list = MeasurementListResponse.from_xml(multi_response_xml_mocked)
+        matrix = measurement_list.availability()
+
+        assert matrix.shape == (1, 4)
+        assert matrix.at["Test Site 123", "Stage"]
+        assert matrix.to_numpy().all()
+        assert "Rainfall" not in matrix.columns
+
+        measurement_list.data_sources[1].site = "Other Site"
+        matrix = measurement_list.availability()
+        assert matrix.at["Other Site", "Atmospheric Pressure"]
+        assert not matrix.at["Other Site", "Flow"]
+
+    @pytest.mark.unit
+    def test_time_ranges_unit(self, multi_response_xml_mocked):
+        """Test that measurements take their data source's time range."""
+        import pandas as pd
+
+        from whurl.schemas.responses import MeasurementListResponse
+
+        measurement_list = MeasurementListResponse.from_xml(multi_response_xml_mocked)
+        ranges = measurement_list.time_ranges()
+
+        assert list(ranges.columns) == ["Site", "Measurement", "From", "To", "Units"]
+        assert len(ranges) == 4
+        stage = ranges[ranges["Measurement"] == "Stage"].iloc[0]
+        assert stage["Site"] == "Test Site 123"
+        assert stage["From"] == pd.Timestamp("2023-01-01T00:00:00")
+        assert stage["To"] == pd.Timestamp("2025-09-16T08:15:00")
+        assert stage["Units"] == "mm"
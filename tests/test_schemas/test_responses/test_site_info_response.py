@@ -359,3 +359,76 @@ class TestResponseValidation:
         assert isinstance(df, pd.DataFrame)
 
         assert len(result.site) > 1
+
+
+class TestParsing:
+    @pytest.mark.unit
+    def test_attributes_are_parsed_individually(self, collection_response_xml_mocked):
+        """Test that every attribute of a nested element is kept."""
+        from whurl.schemas.responses.site_info import SiteInfoResponse
+
+        result = SiteInfoResponse.from_xml(collection_response_xml_mocked)
+        interval = result.site[0].info["HIRDS"]["Interval"][0]
+
+        assert interval["@ARI"] == "1.58"
+        assert interval["@Day5"] == "68.6"
+        assert result.site[0].info["District"] is None
+
+    @pytest.mark.unit
+    def test_selected_fields(self, collection_response_xml_mocked):
+        """Test that only the requested fields are kept, and none for none."""
+        from whurl.schemas.responses.site_info import SiteInfoResponse
+
+        some = SiteInfoResponse.from_xml(
+            collection_response_xml_mocked, fields=["District", "Missing"]
+        )
+        none = SiteInfoResponse.from_xml(collection_response_xml_mocked, fields=[])
+
+        assert [site.info for site in some.site[:1]] == [{"District": None}]
+        assert all(site.info == {} for site in none.site)
+        assert [site.name for site in none.site] == [site.name for site in some.site]
+
+    @pytest.mark.unit
+    def test_unescaped_attribute_values(self):
+        """Test that unescaped characters in site names are repaired."""
+        from whurl.schemas.responses.site_info import SiteInfoResponse
+
+        xml = (
+            "<HilltopServer><Agency>Test Council</Agency>"
+            '<Site Name="Stream & Drain <Upper>"><Altitude>12</Altitude></Site>'
+            "</HilltopServer>"
+        )
+        result = SiteInfoResponse.from_xml(xml)
+
+        assert result.site[0].name == "Stream & Drain <Upper>"
+        assert result.site[0].info == {"Altitude": "12"}
+
+    @pytest.mark.unit
+    def test_malformed_xml_raises(self):
+        """Test that XML that cannot be repaired raises a parse error."""
+        from whurl.exceptions import HilltopParseError
+        from whurl.schemas.responses.site_info import SiteInfoResponse
+
+        with pytest.raises(HilltopParseError):
+            SiteInfoResponse.from_xml("<HilltopServer><Site Name='A'>")
+
+    @pytest.mark.unit
+    def test_to_dataframe_orientation(self):
+        """Test that sites are columns and missing fields are NaN."""
+        import pandas as pd
+
+        from whurl.schemas.responses.site_info import SiteInfoResponse
+
+        xml = (
+            "<HilltopServer><Agency>Test Council</Agency>"
+            '<Site Name="A"><Altitude>12</Altitude><Easting>1</Easting></Site>'
+            '<Site Name="B"><Easting>2</Easting><Northing>3</Northing></Site>'
+            "</HilltopServer>"
+        )
+        df = SiteInfoResponse.from_xml(xml).to_dataframe()
+
+        assert list(df.columns) == ["A", "B"]
+        assert list(df.index) == ["Altitude", "Easting", "Northing"]
+        assert df.loc["Easting", "B"] == "2"
+        assert pd.isna(df.loc["Altitude", "B"])
+        assert pd.isna(df.loc["Northing", "A"])
@@ -514,3 +514,157 @@ class TestResponseValidation:
 
         # Check for known site from mock data
         assert "Test Site Alpha" in df["@Name"].values
+
+    @pytest.mark.unit
+    def test_spatial_index_unit(self, bbox_response_xml_mocked):
+        """Test building a spatial index from the site list."""
+        from whurl.exceptions import HilltopRequestError
+        from whurl.schemas.responses import SiteListResponse
+
+        site_list = SiteListResponse.from_xml(bbox_response_xml_mocked)
+        index = site_list.spatial_index("EPSG:4326")
+
+        assert index.within(175, -40, 176, -39) == ["Test Site Alpha"]
+        assert index.within(170, -46, 171, -45) == []
+        name, distance = index.nearest(175.16, -39.77, k=1)[0]
+        assert name == "Test Site Alpha"
+        assert distance < 500
+
+        with pytest.raises(HilltopRequestError):
+            site_list.spatial_index("EPSG:9999")
+        with pytest.raises(HilltopRequestError):
+            SiteListResponse(Site=[{"@Name": "Nowhere"}]).spatial_index()
+
+    @pytest.mark.unit
+    def test_coordinates_unit(self, bbox_response_xml_mocked):
+        """Test converting site coordinates between reference systems."""
+        import numpy as np
+
+        from whurl.schemas.responses import SiteListResponse
+
+        site_list = SiteListResponse.from_xml(bbox_response_xml_mocked)
+
+        lon, lat = site_list.coordinates("EPSG:4326")
+        np.testing.assert_allclose(lon, [175.16182082])
+        np.testing.assert_allclose(lat, [-39.76939402])
+
+        # The response only holds latitude and longitude, so NZTM is derived.
+        easting, northing = site_list.coordinates("EPSG:2193")
+        assert 1_600_000 < easting[0] < 1_900_000
+        assert 5_500_000 < northing[0] < 5_700_000
+
+        index = site_list.spatial_index("EPSG:2193")
+        assert index.nearest(easting[0], northing[0])[0] == ("Test Site Alpha", 0.0)
+
+        sites = SiteListResponse(
+            Agency="Test",
+            Site=[
+                {"@Name": "NZTM", "Easting": easting[0], "Northing": northing[0]},
+                {"@Name": "None"},
+            ],
+        )
+        lon, lat = sites.coordinates("EPSG:4326")
+        np.testing.assert_allclose(lon[0], 175.16182082)
+        assert np.isnan(lon[1]) and np.isnan(lat[1])
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "xml_fixture",
+        [
+            "all_response_xml_mocked",
+            "bbox_response_xml_mocked",
+            "empty_response_xml_mocked",
+        ],
+    )
+    def test_compact_matches_models_unit(self, request, xml_fixture):
+        """Test that compact parsing gives the same sites as full parsing."""
+        import pandas as pd
+
+        from whurl.schemas.responses import SiteListResponse
+        from whurl.schemas.responses.site_list import CompactSiteList
+
+        xml = request.getfixturevalue(xml_fixture)
+        full = SiteListResponse.from_xml(xml)
+        compact = SiteListResponse.from_xml(xml, compact=True)
+
+        assert isinstance(compact.site_list, CompactSiteList)
+        assert compact.agency == full.agency
+        assert compact.version == full.version
+        assert compact.site_list == full.site_list
+        assert compact.to_dict() == full.to_dict()
+        pd.testing.assert_frame_equal(compact.to_dataframe(), full.to_dataframe())
+
+    @pytest.mark.unit
+    def test_compact_serialization_unit(self, all_response_xml_mocked):
+        """Test that a compact response dumps like a fully parsed one."""
+        import warnings
+
+        from whurl.schemas.responses import SiteListResponse
+
+        full = SiteListResponse.from_xml(all_response_xml_mocked)
+        compact = SiteListResponse.from_xml(all_response_xml_mocked, compact=True)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert compact.model_dump_json() == full.model_dump_json()
+            assert compact.model_dump() == full.model_dump()
+            assert compact.model_dump(by_alias=True, exclude_unset=True) == (
+                full.model_dump(by_alias=True, exclude_unset=True)
+            )
+
+    @pytest.mark.unit
+    def test_compact_site_list_view_unit(self, bbox_response_xml_mocked):
+        """Test that the compact site list builds sites on demand."""
+        from whurl.exceptions import HilltopResponseError
+        from whurl.schemas.responses import SiteListResponse
+
+        result = SiteListResponse.from_xml(bbox_response_xml_mocked, compact=True)
+        sites = result.site_list
+
+        assert len(sites) == 1
+        site = sites[0]
+        assert isinstance(site, SiteListResponse.Site)
+        assert site.name == "Test Site Alpha"
+        assert site.latitude == -39.76939402
+        assert site.easting is None
+        assert site.to_dict() == {
+            "@Name": "Test Site Alpha",
+            "Latitude": -39.76939402,
+            "Longitude": 175.16182082,
+        }
+        assert len(sites[:0]) == 0
+        assert sites[-1] == site
+        with pytest.raises(IndexError):
+            sites[1]
+        with pytest.raises(TypeError):
+            sites[0] = site
+
+        error_xml = "<HilltopServer><Error>Unrecognised request</Error></HilltopServer>"
+        with pytest.raises(HilltopResponseError):
+            SiteListResponse.from_xml(error_xml, compact=True)
+
+    @pytest.mark.unit
+    def test_compact_with_client_unit(self, httpx_mock, bbox_response_xml_mocked):
+        """Test requesting a compact site list through the client."""
+        from whurl.client import HilltopClient
+        from whurl.schemas.requests import SiteListRequest
+        from whurl.schemas.responses.site_list import CompactSiteList
+
+        base_url = "http://example.com"
+        hts_endpoint = "foo.hts"
+        httpx_mock.add_response(
+            url=SiteListRequest(
+                base_url=base_url, hts_endpoint=hts_endpoint, location="LatLong"
+            ).gen_url(),
+            method="GET",
+            text=bbox_response_xml_mocked,
+        )
+
+        with HilltopClient(base_url=base_url, hts_endpoint=hts_endpoint) as client:
+            result = client.get_site_list(location="LatLong", compact=True)
+
+        assert isinstance(result.site_list, CompactSiteList)
+        assert result.request.location == "LatLong"
+        assert result.spatial_index("EPSG:4326").within(175, -40, 176, -39) == [
+            "Test Site Alpha"
+        ]
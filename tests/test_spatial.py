@@ -0,0 +1,98 @@
+"""Tests for the in-memory spatial index."""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def random_sites():
+    """Scatter sites over a New Zealand sized NZTM extent."""
+    rng = np.random.default_rng(42)
+    x = rng.uniform(1_000_000, 2_100_000, 2000)
+    y = rng.uniform(4_700_000, 6_200_000, 2000)
+    x[::100] = np.nan
+    names = [f"Site {i}" for i in range(len(x))]
+    return names, x, y
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("leaf_size", [1, 3, 16])
+def test_within_matches_linear_scan(random_sites, leaf_size):
+    """Test bounding box queries against a brute-force scan."""
+    from whurl.spatial import SiteIndex
+
+    names, x, y = random_sites
+    index = SiteIndex(names, x, y, leaf_size=leaf_size)
+    assert len(index) == 1980
+
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        min_x = rng.uniform(1_000_000, 2_100_000)
+        min_y = rng.uniform(4_700_000, 6_200_000)
+        size = rng.uniform(0, 300_000)
+        expected = [
+            names[i]
+            for i in np.flatnonzero(
+                (x >= min_x) & (x <= min_x + size) & (y >= min_y) & (y <= min_y + size)
+            )
+        ]
+        assert index.within(min_x, min_y, min_x + size, min_y + size) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("leaf_size", [1, 3, 16])
+def test_nearest_matches_linear_scan(random_sites, leaf_size):
+    """Test nearest-site queries against a brute-force scan."""
+    from whurl.spatial import SiteIndex
+
+    names, x, y = random_sites
+    index = SiteIndex(names, x, y, leaf_size=leaf_size)
+
+    rng = np.random.default_rng(1)
+    for k in range(1, 12):
+        qx = rng.uniform(1_000_000, 2_100_000)
+        qy = rng.uniform(4_700_000, 6_200_000)
+        distances = np.hypot(x - qx, y - qy)
+        expected = np.argsort(np.where(np.isnan(distances), np.inf, distances))[:k]
+
+        result = index.nearest(qx, qy, k=k)
+        assert [name for name, _ in result] == [names[i] for i in expected]
+        assert np.allclose([d for _, d in result], distances[expected])
+
+
+@pytest.mark.unit
+def test_nearest_geographic_uses_great_circle_distance():
+    """Test that WGS84 nearest queries return great-circle metres."""
+    from whurl.spatial import SiteIndex
+
+    index = SiteIndex(
+        ["Wellington", "Auckland", "Christchurch"],
+        [174.7762, 174.7633, 172.6362],
+        [-41.2865, -36.8485, -43.5321],
+        geographic=True,
+    )
+
+    result = index.nearest(174.78, -41.29, k=2)
+    assert [name for name, _ in result] == ["Wellington", "Christchurch"]
+    assert result[0][1] < 1_000
+    # Wellington to Christchurch is roughly 300 km as the crow flies.
+    assert 290_000 < result[1][1] < 320_000
+
+    assert index.within(172, -44, 175, -40) == ["Wellington", "Christchurch"]
+
+
+@pytest.mark.unit
+def test_empty_and_small_indexes():
+    """Test queries on indexes with fewer sites than requested."""
+    from whurl.exceptions import HilltopRequestError
+    from whurl.spatial import SiteIndex
+
+    empty = SiteIndex([], [], [])
+    assert empty.within(0, 0, 1, 1) == []
+    assert empty.nearest(0, 0, k=3) == []
+
+    single = SiteIndex(["Only"], [3.0], [4.0])
+    assert single.nearest(0, 0, k=5) == [("Only", 5.0)]
+
+    with pytest.raises(HilltopRequestError):
+        SiteIndex(["A", "B"], [1.0], [1.0])
@@ -70,3 +70,25 @@ def test_validate_hilltop_interval_notation():
         validate_hilltop_interval_notation("15parsecs")
     with pytest.raises(HilltopRequestError):
         validate_hilltop_interval_notation("15 parsecs")
+
+
+@pytest.mark.unit
+def test_parse_hilltop_interval():
+    """Test parse_hilltop_interval function."""
+    import pandas as pd
+
+    from whurl.exceptions import HilltopRequestError
+    from whurl.utils import parse_hilltop_interval
+
+    assert parse_hilltop_interval("30") == pd.Timedelta(seconds=30)
+    assert parse_hilltop_interval(90) == pd.Timedelta(seconds=90)
+    assert parse_hilltop_interval("2.5 minutes") == pd.Timedelta(seconds=150)
+    assert parse_hilltop_interval("15m") == pd.Timedelta(minutes=15)
+    assert parse_hilltop_interval("1 hour") == pd.Timedelta(hours=1)
+    assert parse_hilltop_interval("1 week") == pd.Timedelta(days=7)
+    assert parse_hilltop_interval("1 mo") == pd.DateOffset(months=1)
+    assert parse_hilltop_interval("2 years") == pd.DateOffset(years=2)
+
+    for value in ["", "hour", "1 fortnight", "0", "1.5 months", "1 hour 2"]:
+        with pytest.raises(HilltopRequestError):
+            parse_hilltop_interval(value)
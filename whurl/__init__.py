@@ -11,10 +11,22 @@ This package provides:
 - Comprehensive error handling and configuration management
 """
 
-from .client import AsyncHilltopClient, HilltopClient
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import AsyncHilltopClient, HilltopClient
 
 __author__ = """Nic Mostert"""
 __email__ = "nicolas.mostert@horizons.govt.nz"
 __version__ = "0.1.2"
 
 __all__ = ["HilltopClient", "AsyncHilltopClient"]
+
+
+def __getattr__(name: str):
+    """Import the clients on first access to keep ``import whurl`` cheap."""
+    if name in __all__:
+        from . import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,510 @@
+"""In-memory catalog of the sites, measurements and collections on a server.
+
+A ``HilltopCatalog`` is built once from SiteList, MeasurementList,
+CollectionList and Status responses, and then answers discovery questions
+such as "which measurements exist at this site" from hash indexes instead of
+further requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from whurl.exceptions import HilltopRequestError
+
+if TYPE_CHECKING:
+    from whurl.client import AsyncHilltopClient, HilltopClient
+    from whurl.schemas.responses import (CollectionListResponse,
+                                         MeasurementListResponse,
+                                         SiteListResponse, StatusResponse)
+
+
+def _base_measurement(name: str) -> str:
+    """Strip the data source from a collection item's measurement.
+
+    Collection items name measurements as "Measurement [DataSource]".
+    """
+    if name.endswith("]") and " [" in name:
+        return name[: name.rindex(" [")]
+    return name
+
+
+def _file_key(filename: str) -> str:
+    """Normalise a Hilltop file path for comparison."""
+    return filename.replace("/", "\\").rsplit("\\", 1)[-1].lower()
+
+
+class HilltopCatalog:
+    """Hash indexes over the sites, measurements and collections of a server.
+
+    Build a catalog with ``build`` (or ``abuild`` for the async client),
+    which fetches everything it needs concurrently, or construct one from
+    responses you already hold. ``refresh`` then re-fetches only what the
+    server's data file refresh counters say may have changed.
+
+    Parameters
+    ----------
+    site_list : SiteListResponse, optional
+        The server's site list.
+    measurement_lists : mapping of str to MeasurementListResponse, optional
+        MeasurementList responses keyed by the site they were requested for.
+    collection_list : CollectionListResponse, optional
+        The server's collection list.
+    status : StatusResponse, optional
+        The server's status, used by ``refresh`` to detect changes.
+
+    Attributes
+    ----------
+    sites : set of str
+        Names of the sites in the site list and measurement lists.
+    site_measurements : dict of str to set of str
+        Measurement names available at each site.
+    measurement_sites : dict of str to set of str
+        Sites at which each measurement is available.
+    collection_items : dict of str to list of tuple of (str, str)
+        Site and measurement of each item in each collection. Measurements
+        are stripped of their "[DataSource]" suffix.
+    site_time_ranges : dict of str to tuple of (datetime, datetime)
+        Earliest start and latest end of the data at each site.
+    measurement_time_ranges : dict of tuple of (str, str) to tuple
+        Start and end of the data source holding each site's measurement.
+    client : HilltopClient or AsyncHilltopClient or None
+        The client the catalog was built with, used by ``refresh``.
+    tracked_sites : set of str or None
+        The sites passed to ``build``, whose measurement lists ``refresh``
+        keeps up to date. None tracks every site in the site list.
+
+    Examples
+    --------
+    >>> with HilltopClient() as client:
+    ...     catalog = HilltopCatalog.build(client)
+    ...     catalog.site_measurements["Manawatu at Teachers College"]
+    ...     catalog.sites_with("Rainfall", collection="Rainfall")
+    """
+
+    def __init__(
+        self,
+        site_list: SiteListResponse | None = None,
+        measurement_lists: Mapping[str, MeasurementListResponse] | None = None,
+        collection_list: CollectionListResponse | None = None,
+        status: StatusResponse | None = None,
+    ):
+        self.site_list = site_list
+        self.measurement_lists = dict(measurement_lists or {})
+        self.collection_list = collection_list
+        self.status = status
+        self.client = None
+        self.tracked_sites = None
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Rebuild every index from the stored responses."""
+        self.sites = set()
+        self.site_measurements = {}
+        self.measurement_sites = {}
+        self.collection_items = {}
+        self.site_time_ranges = {}
+        self.measurement_time_ranges = {}
+
+        if self.site_list is not None:
+            self.sites.update(site.name for site in self.site_list.site_list)
+
+        for requested_site, measurement_list in self.measurement_lists.items():
+            self.sites.add(requested_site)
+            self.site_measurements.setdefault(requested_site, set())
+            for measurement in measurement_list.measurements:
+                self._add_measurement(measurement.site or requested_site, measurement)
+            for ds in measurement_list.data_sources:
+                site = ds.site or requested_site
+                self._add_time_range(site, None, ds.from_time, ds.to_time)
+                for measurement in ds.measurements:
+                    self._add_measurement(measurement.site or site, measurement)
+                    self._add_time_range(
+                        measurement.site or site,
+                        measurement.name,
+                        ds.from_time,
+                        ds.to_time,
+                    )
+
+        if self.collection_list is not None:
+            for collection in self.collection_list.collections:
+                self.collection_items[collection.name] = [
+                    (item.site_name, _base_measurement(item.measurement or ""))
+                    for item in collection.items
+                ]
+
+    def _add_measurement(self, site: str, measurement) -> None:
+        """Index one measurement available at a site."""
+        self.sites.add(site)
+        self.site_measurements.setdefault(site, set()).add(measurement.name)
+        self.measurement_sites.setdefault(measurement.name, set()).add(site)
+
+    def _add_time_range(
+        self,
+        site: str,
+        measurement: str | None,
+        from_time: datetime | None,
+        to_time: datetime | None,
+    ) -> None:
+        """Widen the time range of a site, or of one of its measurements."""
+        if from_time is None or to_time is None:
+            return
+        if measurement is None:
+            key, ranges = site, self.site_time_ranges
+        else:
+            key, ranges = (site, measurement), self.measurement_time_ranges
+        if key in ranges:
+            start, end = ranges[key]
+            from_time, to_time = min(start, from_time), max(end, to_time)
+        ranges[key] = (from_time, to_time)
+
+    def measurements(self, site: str) -> set[str]:
+        """Get the measurements available at a site.
+
+        Parameters
+        ----------
+        site : str
+            The site name.
+
+        Returns
+        -------
+        set of str
+            Measurement names, empty if the site is unknown.
+        """
+        return self.site_measurements.get(site, set())
+
+    def sites_with(self, measurement: str, collection: str | None = None) -> set[str]:
+        """Get the sites at which a measurement is available.
+
+        Parameters
+        ----------
+        measurement : str
+            The measurement name.
+        collection : str, optional
+            Only include sites whose item for this measurement is in the
+            collection.
+
+        Returns
+        -------
+        set of str
+            Site names, empty if the measurement is unknown.
+        """
+        if collection is None:
+            return self.measurement_sites.get(measurement, set())
+        return {
+            site
+            for site, item_measurement in self.collection_items.get(collection, [])
+            if item_measurement == measurement
+        }
+
+    def time_range(
+        self, site: str, measurement: str | None = None
+    ) -> tuple[datetime, datetime] | None:
+        """Get the time range of the data at a site.
+
+        Parameters
+        ----------
+        site : str
+            The site name.
+        measurement : str, optional
+            Narrow the range to the data source holding this measurement.
+
+        Returns
+        -------
+        tuple of (datetime, datetime) or None
+            Start and end of the data, or None if unknown.
+        """
+        if measurement is None:
+            return self.site_time_ranges.get(site)
+        return self.measurement_time_ranges.get((site, measurement))
+
+    def _file_counters(self, status: StatusResponse | None) -> dict:
+        """Map each data file to its refresh counters."""
+        if status is None:
+            return {}
+        return {
+            _file_key(data_file.filename): (
+                data_file.full_refresh,
+                data_file.soft_refresh,
+            )
+            for data_file in status.data_files or []
+        }
+
+    def _changed_files(self, status: StatusResponse) -> set[str] | None:
+        """Find the data files refreshed since the stored status.
+
+        Returns None if there is no stored status to compare with, meaning
+        that anything may have changed.
+        """
+        if self.status is None:
+            return None
+        before = self._file_counters(self.status)
+        after = self._file_counters(status)
+        return {
+            name
+            for name in before.keys() | after.keys()
+            if before.get(name) != after.get(name)
+        }
+
+    def _stale_sites(
+        self,
+        site_list: SiteListResponse,
+        collection_list: CollectionListResponse | None,
+        status: StatusResponse,
+        changed_files: set[str] | None,
+    ) -> set[str]:
+        """Work out which sites need their measurement list re-fetched.
+
+        New sites are always stale. Known sites are stale if a collection
+        places one of their items in a changed data file, or if no
+        collection says which file they live in.
+        """
+        current = self._tracked(site_list)
+        if changed_files is None:
+            return current
+
+        default_file = _file_key(status.default_file or "")
+        site_files = {}
+        if collection_list is not None:
+            for collection in collection_list.collections:
+                for item in collection.items:
+                    filename = _file_key(item.filename or "") or default_file
+                    site_files.setdefault(item.site_name, set()).add(filename)
+
+        return {
+            site
+            for site in current
+            if site not in self.measurement_lists
+            or site not in site_files
+            or site_files[site] & changed_files
+        }
+
+    def _tracked(self, site_list: SiteListResponse) -> set[str]:
+        """Get the sites whose measurement lists the catalog keeps."""
+        if self.tracked_sites is not None:
+            return set(self.tracked_sites)
+        return {site.name for site in site_list.site_list}
+
+    def _apply(
+        self,
+        site_list: SiteListResponse,
+        collection_list: CollectionListResponse | None,
+        status: StatusResponse,
+        measurement_lists: Mapping[str, MeasurementListResponse],
+    ) -> None:
+        """Store re-fetched responses and rebuild the indexes."""
+        current = self._tracked(site_list)
+        self.measurement_lists = {
+            site: measurement_list
+            for site, measurement_list in self.measurement_lists.items()
+            if site in current
+        }
+        self.measurement_lists.update(measurement_lists)
+        self.site_list = site_list
+        self.collection_list = collection_list
+        self.status = status
+        self._reindex()
+
+    @classmethod
+    def build(
+        cls,
+        client: HilltopClient,
+        sites: Iterable[str] | None = None,
+        max_workers: int = 8,
+    ) -> HilltopCatalog:
+        """Fetch everything the catalog needs concurrently and index it.
+
+        Parameters
+        ----------
+        client : HilltopClient
+            The client to fetch with. It is kept for ``refresh``.
+        sites : iterable of str, optional
+            Sites to fetch measurement lists for. Defaults to every site in
+            the site list.
+        max_workers : int, default 8
+            Maximum number of requests in flight at once.
+
+        Returns
+        -------
+        HilltopCatalog
+            The indexed catalog.
+
+        Raises
+        ------
+        HilltopResponseError
+            If any request fails.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            status = pool.submit(client.get_status)
+            collection_list = pool.submit(client.get_collection_list)
+            site_list = client.get_site_list()
+            names = (
+                list(sites)
+                if sites is not None
+                else [site.name for site in site_list.site_list]
+            )
+            measurement_lists = pool.map(
+                lambda site: client.get_measurement_list(site=site), names
+            )
+            catalog = cls(
+                site_list,
+                dict(zip(names, measurement_lists)),
+                collection_list.result(),
+                status.result(),
+            )
+        catalog.client = client
+        catalog.tracked_sites = set(names) if sites is not None else None
+        return catalog
+
+    @classmethod
+    async def abuild(
+        cls,
+        client: AsyncHilltopClient,
+        sites: Iterable[str] | None = None,
+        max_concurrency: int = 8,
+    ) -> HilltopCatalog:
+        """Fetch everything the catalog needs concurrently and index it.
+
+        Parameters
+        ----------
+        client : AsyncHilltopClient
+            The client to fetch with. It is kept for ``arefresh``.
+        sites : iterable of str, optional
+            Sites to fetch measurement lists for. Defaults to every site in
+            the site list.
+        max_concurrency : int, default 8
+            Maximum number of requests in flight at once.
+
+        Returns
+        -------
+        HilltopCatalog
+            The indexed catalog.
+
+        Raises
+        ------
+        HilltopResponseError
+            If any request fails.
+        """
+        status, collection_list, site_list = await asyncio.gather(
+            client.get_status(), client.get_collection_list(), client.get_site_list()
+        )
+        names = (
+            list(sites)
+            if sites is not None
+            else [site.name for site in site_list.site_list]
+        )
+        measurement_lists = await cls._afetch_measurement_lists(
+            client, names, max_concurrency
+        )
+        catalog = cls(site_list, measurement_lists, collection_list, status)
+        catalog.client = client
+        catalog.tracked_sites = set(names) if sites is not None else None
+        return catalog
+
+    @staticmethod
+    async def _afetch_measurement_lists(
+        client: AsyncHilltopClient, sites: list[str], max_concurrency: int
+    ) -> dict[str, MeasurementListResponse]:
+        """Fetch measurement lists for sites with bounded concurrency."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(site: str) -> MeasurementListResponse:
+            async with semaphore:
+                return await client.get_measurement_list(site=site)
+
+        results = await asyncio.gather(*(fetch(site) for site in sites))
+        return dict(zip(sites, results))
+
+    def refresh(self, max_workers: int = 8) -> set[str]:
+        """Re-fetch whatever may have changed on the server.
+
+        The server status is always fetched. If no data file has been
+        refreshed since the catalog was built, nothing else is. Otherwise
+        the site and collection lists are re-fetched, along with the
+        measurement lists of new sites and of sites in changed files.
+
+        Parameters
+        ----------
+        max_workers : int, default 8
+            Maximum number of requests in flight at once.
+
+        Returns
+        -------
+        set of str
+            Sites whose measurement lists were re-fetched.
+
+        Raises
+        ------
+        HilltopRequestError
+            If the catalog was not built with a client.
+        """
+        client = self._require_client()
+        status = client.get_status()
+        changed_files = self._changed_files(status)
+        if changed_files == set():
+            self.status = status
+            return set()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            collection_list = pool.submit(client.get_collection_list)
+            site_list = client.get_site_list()
+            stale = self._stale_sites(
+                site_list, collection_list.result(), status, changed_files
+            )
+            names = sorted(stale)
+            measurement_lists = pool.map(
+                lambda site: client.get_measurement_list(site=site), names
+            )
+            measurement_lists = dict(zip(names, measurement_lists))
+        self._apply(site_list, collection_list.result(), status, measurement_lists)
+        return stale
+
+    async def arefresh(self, max_concurrency: int = 8) -> set[str]:
+        """Re-fetch whatever may have changed on the server asynchronously.
+
+        See ``refresh`` for what is re-fetched.
+
+        Parameters
+        ----------
+        max_concurrency : int, default 8
+            Maximum number of requests in flight at once.
+
+        Returns
+        -------
+        set of str
+            Sites whose measurement lists were re-fetched.
+
+        Raises
+        ------
+        HilltopRequestError
+            If the catalog was not built with a client.
+        """
+        client = self._require_client()
+        status = await client.get_status()
+        changed_files = self._changed_files(status)
+        if changed_files == set():
+            self.status = status
+            return set()
+
+        collection_list, site_list = await asyncio.gather(
+            client.get_collection_list(), client.get_site_list()
+        )
+        stale = self._stale_sites(site_list, collection_list, status, changed_files)
+        measurement_lists = await self._afetch_measurement_lists(
+            client, sorted(stale), max_concurrency
+        )
+        self._apply(site_list, collection_list, status, measurement_lists)
+        return stale
+
+    def _require_client(self):
+        """Return the client the catalog was built with."""
+        if self.client is None:
+            raise HilltopRequestError(
+                "This catalog has no client to refresh with. "
+                "Create it with HilltopCatalog.build or abuild."
+            )
+        return self.client
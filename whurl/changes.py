@@ -0,0 +1,404 @@
+"""Detect which series have new data since an earlier sync run.
+
+A ``ChangeSnapshot`` records the refresh counters of the server's data files
+and the end time of every (site, measurement) series. Comparing a stored
+snapshot with a fresh one gives the series that have new data, so an
+incremental sync only fetches those. ``detect_changes`` takes the fresh
+snapshot with as few requests as it can: if no data file has been refreshed
+since the stored snapshot, the Status request is the only one sent.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from whurl.catalog import HilltopCatalog, _file_key
+
+if TYPE_CHECKING:
+    from whurl.client import AsyncHilltopClient, HilltopClient
+    from whurl.schemas.responses import MeasurementListResponse, StatusResponse
+
+
+def _file_counters(status: StatusResponse) -> dict[str, tuple]:
+    """Map each data file to its (full, soft) refresh counters."""
+    return {
+        _file_key(data_file.filename): (data_file.full_refresh, data_file.soft_refresh)
+        for data_file in status.data_files or []
+    }
+
+
+def _end_times(
+    measurement_lists: Mapping[str, MeasurementListResponse],
+) -> dict[tuple[str, str], datetime]:
+    """Get the end time of every series in MeasurementList responses.
+
+    Measurements without their own "To" take that of their data source.
+    Where a series is found in more than one data source, the latest end
+    time is kept.
+
+    Parameters
+    ----------
+    measurement_lists : mapping of str to MeasurementListResponse
+        MeasurementList responses keyed by the site they were requested for.
+
+    Returns
+    -------
+    dict of tuple of (str, str) to datetime
+        End time of each (site, measurement) series.
+    """
+    end_times = {}
+
+    def add(site: str, measurement: str, to_time: datetime | None) -> None:
+        key = (site, measurement)
+        if to_time is not None and (key not in end_times or to_time > end_times[key]):
+            end_times[key] = to_time
+
+    for requested_site, measurement_list in measurement_lists.items():
+        for measurement in measurement_list.measurements:
+            add(
+                measurement.site or requested_site,
+                measurement.name,
+                measurement.to_time,
+            )
+        for ds in measurement_list.data_sources:
+            for measurement in ds.measurements:
+                add(
+                    measurement.site or ds.site,
+                    measurement.name,
+                    measurement.to_time or ds.to_time,
+                )
+    return end_times
+
+
+class ChangeSnapshot:
+    """Data file refresh counters and series end times at one point in time.
+
+    Parameters
+    ----------
+    file_counters : mapping of str to tuple of (int, int)
+        Full and soft refresh counters of each data file, keyed by file
+        name.
+    end_times : mapping of tuple of (str, str) to datetime
+        End time of the data of each (site, measurement) series.
+
+    Examples
+    --------
+    >>> before = ChangeSnapshot.load("snapshot.json")
+    >>> changed, after = detect_changes(client, before)
+    >>> for site, measurement in changed:
+    ...     sync(site, measurement)
+    >>> after.save("snapshot.json")
+    """
+
+    def __init__(
+        self,
+        file_counters: Mapping[str, tuple[int | None, int | None]],
+        end_times: Mapping[tuple[str, str], datetime],
+    ):
+        self.file_counters = dict(file_counters)
+        self.end_times = dict(end_times)
+
+    def __repr__(self) -> str:
+        """Return a short description of the snapshot."""
+        return (
+            f"ChangeSnapshot(files={len(self.file_counters)}, "
+            f"series={len(self.end_times)})"
+        )
+
+    @classmethod
+    def from_responses(
+        cls,
+        status: StatusResponse,
+        measurement_lists: Mapping[str, MeasurementListResponse],
+    ) -> ChangeSnapshot:
+        """Take a snapshot from responses that are already held.
+
+        Parameters
+        ----------
+        status : StatusResponse
+            The server's status.
+        measurement_lists : mapping of str to MeasurementListResponse
+            MeasurementList responses keyed by the site they were requested
+            for.
+
+        Returns
+        -------
+        ChangeSnapshot
+            The snapshot.
+        """
+        return cls(_file_counters(status), _end_times(measurement_lists))
+
+    @classmethod
+    def from_catalog(cls, catalog: HilltopCatalog) -> ChangeSnapshot:
+        """Take a snapshot from the responses held by a catalog.
+
+        Parameters
+        ----------
+        catalog : HilltopCatalog
+            A catalog with a stored status.
+
+        Returns
+        -------
+        ChangeSnapshot
+            The snapshot.
+        """
+        counters = _file_counters(catalog.status) if catalog.status else {}
+        return cls(counters, _end_times(catalog.measurement_lists))
+
+    def changed_files(self, current: ChangeSnapshot) -> set[str]:
+        """Find the data files refreshed between this snapshot and another.
+
+        Parameters
+        ----------
+        current : ChangeSnapshot
+            The later snapshot.
+
+        Returns
+        -------
+        set of str
+            Names of the files whose counters differ, or that are in only
+            one of the snapshots.
+        """
+        before, after = self.file_counters, current.file_counters
+        return {
+            name
+            for name in before.keys() | after.keys()
+            if before.get(name) != after.get(name)
+        }
+
+    def changed_series(self, current: ChangeSnapshot) -> set[tuple[str, str]]:
+        """Find the series with new data between this snapshot and another.
+
+        A series has changed if it is new, or if its end time has moved.
+        Series that are no longer listed are not included, and neither are
+        edits to values within a series' existing time range.
+
+        Parameters
+        ----------
+        current : ChangeSnapshot
+            The later snapshot.
+
+        Returns
+        -------
+        set of tuple of (str, str)
+            The changed (site, measurement) series.
+        """
+        return {
+            key
+            for key, to_time in current.end_times.items()
+            if self.end_times.get(key) != to_time
+        }
+
+    def to_dict(self) -> dict:
+        """Convert the snapshot to a JSON-compatible dictionary.
+
+        Returns
+        -------
+        dict
+            The file counters and a list of [site, measurement, end time]
+            rows, with end times in ISO 8601 format.
+        """
+        return {
+            "file_counters": {
+                name: list(counters) for name, counters in self.file_counters.items()
+            },
+            "end_times": [
+                [site, measurement, to_time.isoformat()]
+                for (site, measurement), to_time in sorted(self.end_times.items())
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> ChangeSnapshot:
+        """Restore a snapshot from the output of ``to_dict``.
+
+        Parameters
+        ----------
+        data : mapping
+            A dictionary as returned by ``to_dict``.
+
+        Returns
+        -------
+        ChangeSnapshot
+            The restored snapshot.
+        """
+        return cls(
+            {
+                name: tuple(counters)
+                for name, counters in data["file_counters"].items()
+            },
+            {
+                (site, measurement): datetime.fromisoformat(to_time)
+                for site, measurement, to_time in data["end_times"]
+            },
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the snapshot to a JSON file.
+
+        Parameters
+        ----------
+        path : str or Path
+            The file to write.
+        """
+        Path(path).write_text(json.dumps(self.to_dict()), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> ChangeSnapshot:
+        """Read a snapshot written by ``save``.
+
+        Parameters
+        ----------
+        path : str or Path
+            The file to read.
+
+        Returns
+        -------
+        ChangeSnapshot
+            The restored snapshot.
+        """
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def _compare(
+    since: ChangeSnapshot | None,
+    status: StatusResponse,
+    measurement_lists: Mapping[str, MeasurementListResponse],
+    partial: bool,
+) -> tuple[set[tuple[str, str]], ChangeSnapshot]:
+    """Take a fresh snapshot and compare it with the stored one.
+
+    When only some sites were checked, the stored end times of the other
+    sites are carried over to the fresh snapshot, and so are the stored file
+    counters: the other sites have not been checked since the files were
+    refreshed, so a later run must not skip them.
+    """
+    snapshot = ChangeSnapshot.from_responses(status, measurement_lists)
+    if since is None:
+        if partial:
+            snapshot.file_counters = {}
+        return set(snapshot.end_times), snapshot
+    changed = since.changed_series(snapshot)
+    if partial:
+        snapshot.file_counters = dict(since.file_counters)
+        snapshot.end_times = {
+            **{
+                key: to_time
+                for key, to_time in since.end_times.items()
+                if key[0] not in measurement_lists
+            },
+            **snapshot.end_times,
+        }
+    return changed, snapshot
+
+
+def detect_changes(
+    client: HilltopClient,
+    since: ChangeSnapshot | None = None,
+    sites: Iterable[str] | None = None,
+    max_workers: int = 8,
+) -> tuple[set[tuple[str, str]], ChangeSnapshot]:
+    """Find the series with new data since an earlier snapshot.
+
+    The server status is always fetched. If no data file has been refreshed
+    since ``since`` was taken, nothing else is. Otherwise the measurement
+    list of every site is fetched, one request per site, and series end
+    times are compared. When ``sites`` is given, the returned snapshot
+    keeps the stored end times of the other sites, and the stored file
+    counters, so a later run over every site still checks for new data.
+
+    Parameters
+    ----------
+    client : HilltopClient
+        The client to fetch with.
+    since : ChangeSnapshot, optional
+        The snapshot taken at the end of the previous sync run. Without
+        one, every series is reported as changed.
+    sites : iterable of str, optional
+        Sites to check. Defaults to every site in the site list.
+    max_workers : int, default 8
+        Maximum number of requests in flight at once.
+
+    Returns
+    -------
+    changed : set of tuple of (str, str)
+        The (site, measurement) series with new data.
+    snapshot : ChangeSnapshot
+        The current snapshot, to store for the next run.
+
+    Raises
+    ------
+    HilltopResponseError
+        If any request fails.
+    """
+    status = client.get_status()
+    counters = _file_counters(status)
+    # A server listing no data files gives no counters to compare.
+    if since is not None and counters and counters == since.file_counters:
+        return set(), ChangeSnapshot(counters, since.end_times)
+
+    if sites is None:
+        names = [site.name for site in client.get_site_list().site_list]
+    else:
+        names = sorted(set(sites))
+    results = client.map(
+        "get_measurement_list",
+        [{"site": site} for site in names],
+        max_workers=max_workers,
+        return_exceptions=False,
+    )
+    return _compare(since, status, dict(zip(names, results)), sites is not None)
+
+
+async def adetect_changes(
+    client: AsyncHilltopClient,
+    since: ChangeSnapshot | None = None,
+    sites: Iterable[str] | None = None,
+    max_concurrency: int = 8,
+) -> tuple[set[tuple[str, str]], ChangeSnapshot]:
+    """Find the series with new data since an earlier snapshot asynchronously.
+
+    See ``detect_changes`` for what is fetched.
+
+    Parameters
+    ----------
+    client : AsyncHilltopClient
+        The client to fetch with.
+    since : ChangeSnapshot, optional
+        The snapshot taken at the end of the previous sync run. Without
+        one, every series is reported as changed.
+    sites : iterable of str, optional
+        Sites to check. Defaults to every site in the site list.
+    max_concurrency : int, default 8
+        Maximum number of requests in flight at once.
+
+    Returns
+    -------
+    changed : set of tuple of (str, str)
+        The (site, measurement) series with new data.
+    snapshot : ChangeSnapshot
+        The current snapshot, to store for the next run.
+
+    Raises
+    ------
+    HilltopResponseError
+        If any request fails.
+    """
+    status = await client.get_status()
+    counters = _file_counters(status)
+    # A server listing no data files gives no counters to compare.
+    if since is not None and counters and counters == since.file_counters:
+        return set(), ChangeSnapshot(counters, since.end_times)
+
+    if sites is None:
+        names = [site.name for site in (await client.get_site_list()).site_list]
+    else:
+        names = sorted(set(sites))
+    measurement_lists = await HilltopCatalog._afetch_measurement_lists(
+        client, names, max_concurrency
+    )
+    return _compare(since, status, measurement_lists, sites is not None)
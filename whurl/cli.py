@@ -0,0 +1,117 @@
+"""The ``whurl`` command.
+
+Run ``whurl download MANIFEST`` to download the series listed in a manifest
+(see ``whurl.download``). Progress is printed to stderr as each chunk
+finishes, and a summary when the job ends.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Sequence
+
+from whurl import __version__
+from whurl.exceptions import HilltopConfigError
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="whurl", description="Tools for Hilltop Server."
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    download = commands.add_parser(
+        "download",
+        help="download the series in a manifest",
+        description=(
+            "Download the series in a YAML or JSON manifest, in chunks. "
+            "Finished chunks are kept in a checkpoint file, so a job that is "
+            "run again resumes where it stopped."
+        ),
+    )
+    download.add_argument("manifest", help="path to the manifest file")
+    download.add_argument(
+        "-o", "--output", help="output directory, overriding the manifest"
+    )
+    download.add_argument(
+        "-f",
+        "--format",
+        choices=("csv", "parquet"),
+        help="file format, overriding the manifest",
+    )
+    download.add_argument(
+        "-j",
+        "--max-workers",
+        type=int,
+        help="chunks fetched at once, overriding the manifest",
+    )
+    download.add_argument(
+        "--checkpoint",
+        help="checkpoint file (default: checkpoint.jsonl in the output directory)",
+    )
+    download.add_argument(
+        "-q", "--quiet", action="store_true", help="only print the summary"
+    )
+    return parser
+
+
+def _download(args: argparse.Namespace) -> int:
+    """Run a download job and print its summary."""
+    from whurl.download import DownloadJob, DownloadManifest, throughput
+
+    manifest = DownloadManifest.load(args.manifest)
+    overrides = {
+        "output": args.output,
+        "format": args.format,
+        "max_workers": args.max_workers,
+    }
+    manifest = DownloadManifest.model_validate(
+        {
+            **manifest.model_dump(by_alias=True),
+            **{key: value for key, value in overrides.items() if value is not None},
+        }
+    )
+    job = DownloadJob(manifest, checkpoint=args.checkpoint)
+
+    def report(line: str) -> None:
+        print(line, file=sys.stderr, flush=True)
+
+    summary = job.run(report=None if args.quiet else report)
+    print(
+        f"{summary['downloaded']} chunks downloaded, {summary['skipped']} already "
+        f"done, {summary['failed']} failed; {summary['rows']:,} rows, "
+        f"{summary['bytes'] / 1e6:.1f} MB in {summary['seconds']:.1f} s "
+        f"({throughput(summary)})"
+    )
+    for key, message in summary["errors"]:
+        print(f"failed: {key}: {message}", file=sys.stderr)
+    return 1 if summary["failed"] else 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the ``whurl`` command.
+
+    Parameters
+    ----------
+    argv : sequence of str, optional
+        Command line arguments. Defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        Exit status: 0 on success, 1 if any chunk failed.
+
+    Raises
+    ------
+    SystemExit
+        With status 2, for invalid arguments or an invalid manifest.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    try:
+        return _download(args)
+    except HilltopConfigError as e:
+        parser.exit(2, f"whurl: error: {e}\n")
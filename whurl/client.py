@@ -5,27 +5,346 @@ interacting with Hilltop Server APIs. The clients handle request validation,
 response parsing, and proper resource management.
 """
 
+from __future__ import annotations
+
 import asyncio
+import importlib.util
 import os
-from typing import Optional
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-import certifi
 import httpx
-from dotenv import load_dotenv
 from pydantic import BaseModel
 
+from whurl.endpoints import EndpointPool
 from whurl.exceptions import (HilltopConfigError, HilltopParseError,
-                              HilltopResponseError)
+                              HilltopRequestError, HilltopResponseError)
+from whurl.hedging import HedgePolicy
+from whurl.locks import TrackedLock
+from whurl.polling import Poller
+from whurl.schemas import responses
 from whurl.schemas.requests import (CollectionListRequest, GetDataRequest,
-                                    MeasurementListRequest, SiteInfoRequest,
-                                    SiteListRequest, StatusRequest,
-                                    TimeRangeRequest)
-from whurl.schemas.responses import (CollectionListResponse, GetDataResponse,
-                                     MeasurementListResponse, SiteInfoResponse,
-                                     SiteListResponse, StatusResponse,
-                                     TimeRangeResponse)
+                                    MeasurementListRequest, RequestTemplate,
+                                    SiteInfoRequest, SiteListRequest,
+                                    StatusRequest, TimeRangeRequest)
+from whurl.schemas.requests.base import BaseHilltopRequest
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from whurl.schemas.responses import (CollectionListResponse,
+                                         GetDataResponse,
+                                         MeasurementListResponse,
+                                         SiteInfoResponse, SiteListResponse,
+                                         StatusResponse, TimeRangeResponse)
+
+# Name of the response model used to parse the reply to each request type.
+# Response models are resolved lazily, so that importing the client does not
+# import pandas and the XML parsers.
+_RESPONSE_TYPES = {
+    CollectionListRequest: "CollectionListResponse",
+    GetDataRequest: "GetDataResponse",
+    MeasurementListRequest: "MeasurementListResponse",
+    SiteInfoRequest: "SiteInfoResponse",
+    SiteListRequest: "SiteListResponse",
+    StatusRequest: "StatusResponse",
+    TimeRangeRequest: "TimeRangeResponse",
+}
+
+
+@lru_cache(maxsize=None)
+def _load_dotenv() -> None:
+    """Load a ``.env`` file into the environment, once per process."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def _resolve_config(
+    base_url: str | None, hts_endpoint: str | None
+) -> tuple[str | None, str | None]:
+    """Fill in missing configuration from the environment.
+
+    The ``.env`` file is only read when a setting was not passed explicitly.
+
+    Parameters
+    ----------
+    base_url : str or None
+        Base URL passed to the client.
+    hts_endpoint : str or None
+        HTS endpoint passed to the client.
+
+    Returns
+    -------
+    tuple of (str or None, str or None)
+        The resolved base URL and HTS endpoint.
+    """
+    if not base_url or not hts_endpoint:
+        _load_dotenv()
+    return (
+        base_url or os.getenv("HILLTOP_BASE_URL"),
+        hts_endpoint or os.getenv("HILLTOP_HTS_ENDPOINT"),
+    )
+
+
+def _response_type(request: BaseHilltopRequest) -> type[BaseModel]:
+    """Look up the response model for a request.
+
+    Parameters
+    ----------
+    request : BaseHilltopRequest
+        The request whose response will be parsed.
+
+    Returns
+    -------
+    type
+        The response model class with a ``from_xml`` constructor.
+
+    Raises
+    ------
+    HilltopRequestError
+        If the request type has no known response model.
+    """
+    try:
+        name = _RESPONSE_TYPES[type(request)]
+    except KeyError:
+        raise HilltopRequestError(
+            f"No response model for {type(request).__name__}"
+        ) from None
+    return getattr(responses, name)
+
+
+@lru_cache(maxsize=None)
+def _accept_encoding(compression: bool) -> str:
+    """Return the ``Accept-Encoding`` header a client sends.
+
+    httpx decodes gzip and deflate itself, and brotli when the ``brotli``
+    or ``brotlicffi`` package is installed, so "br" is only offered then.
+
+    Parameters
+    ----------
+    compression : bool
+        Whether the client asks for compressed responses.
+
+    Returns
+    -------
+    str
+        The encodings in order of preference, or "identity".
+    """
+    if not compression:
+        return "identity"
+    encodings = ["gzip", "deflate"]
+    if any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi")):
+        encodings.insert(0, "br")
+    return ", ".join(encodings)
+
+
+def _session_options(
+    client: HilltopClient | AsyncHilltopClient, http2: bool
+) -> dict[str, Any]:
+    """Return the httpx client options for one of a client's sessions.
+
+    Parameters
+    ----------
+    client : HilltopClient or AsyncHilltopClient
+        The client the session belongs to.
+    http2 : bool
+        Whether the session may use HTTP/2. In fan-out mode, False gives
+        the HTTP/1.1 fallback pool.
+
+    Returns
+    -------
+    dict
+        Keyword arguments for ``httpx.Client`` or ``httpx.AsyncClient``.
+    """
+    options = {
+        "timeout": httpx.Timeout(timeout=client.timeout),
+        "verify": client.verify_ssl,
+        "follow_redirects": True,
+        "http2": http2,
+        "headers": {"Accept-Encoding": _accept_encoding(client.compression)},
+    }
+    if client.max_streams_per_connection is None:
+        options["limits"] = httpx.Limits(
+            max_connections=client.max_connections,
+            max_keepalive_connections=client.max_keepalive_connections,
+        )
+    elif http2:
+        # A few long-lived connections, each carrying many streams. Plain
+        # HTTP cannot negotiate HTTP/2, so it is spoken with prior knowledge.
+        options["limits"] = httpx.Limits(
+            max_connections=client.max_connections,
+            max_keepalive_connections=client.max_connections,
+        )
+        options["http1"] = not str(client.base_url).startswith("http://")
+    else:
+        options["limits"] = httpx.Limits(
+            max_connections=client.http1_max_connections,
+            max_keepalive_connections=client.http1_max_connections,
+        )
+    return options
+
+
+# Errors raised when a server that only speaks HTTP/1.1 drops an HTTP/2 prior
+# knowledge connection after accepting it.
+_HTTP1_ONLY_ERRORS = (httpx.RemoteProtocolError, httpx.ReadError, httpx.WriteError)
+
+# Counters reported by the clients' ``stats``.
+_COUNTERS = ("responses", "error_responses", "bytes_received", "bytes_decoded")
+
+
+def _count(counters: dict[str, int], response: httpx.Response) -> None:
+    """Add a received response to a client's counters.
+
+    Parameters
+    ----------
+    counters : dict
+        The client's counters, keyed by the names in ``_COUNTERS``.
+    response : httpx.Response
+        A response whose body has been read.
+    """
+    counters["responses"] += 1
+    if response.is_error:
+        counters["error_responses"] += 1
+    # Bytes as transferred, before any Content-Encoding is removed.
+    counters["bytes_received"] += response.num_bytes_downloaded
+    counters["bytes_decoded"] += len(response.content)
+
+
+def _endpoint_pool(
+    base_url: str | Sequence[str] | None, strategy: str, cooldown: float
+) -> EndpointPool | None:
+    """Build the endpoint pool for a client given several base URLs.
+
+    Parameters
+    ----------
+    base_url : str or sequence of str or None
+        The ``base_url`` passed to the client.
+    strategy : str
+        How the pool chooses between endpoints.
+    cooldown : float
+        Seconds an endpoint is skipped after it fails.
+
+    Returns
+    -------
+    EndpointPool or None
+        The pool, or None if ``base_url`` is a single URL or not given.
+    """
+    if base_url is None or isinstance(base_url, str):
+        return None
+    return EndpointPool(base_url, strategy=strategy, cooldown=cooldown)
+
+
+def _check_fanout_options(client: HilltopClient | AsyncHilltopClient) -> None:
+    """Validate the HTTP/2 fan-out options of a client.
+
+    Raises
+    ------
+    HilltopConfigError
+        If fan-out mode is requested without HTTP/2, or a limit is below 1.
+    """
+    if client.max_streams_per_connection is None:
+        return
+    if not client.http2:
+        raise HilltopConfigError("max_streams_per_connection requires http2=True.")
+    if client.max_streams_per_connection < 1 or client.http1_max_connections < 1:
+        raise HilltopConfigError(
+            "max_streams_per_connection and http1_max_connections must be at least 1."
+        )
+
+
+# Where get_time_ranges can read time ranges from.
+_TIME_RANGE_SOURCES = ("time_range", "measurement_list")
+
+
+def _time_range_requests(
+    client: HilltopClient | AsyncHilltopClient,
+    pairs: list[tuple[str, str]],
+    source: str,
+) -> list[BaseHilltopRequest]:
+    """Build the requests needed to look up time ranges for pairs.
+
+    Parameters
+    ----------
+    client : HilltopClient or AsyncHilltopClient
+        The client whose server the requests target.
+    pairs : list of tuple of (str, str)
+        Site and measurement names.
+    source : {"time_range", "measurement_list"}
+        Whether to send one TimeRange request per pair, or one
+        MeasurementList request per site.
+
+    Returns
+    -------
+    list of BaseHilltopRequest
+        The requests to send.
+
+    Raises
+    ------
+    HilltopRequestError
+        If the source is not supported or a pair is invalid.
+    """
+    if source not in _TIME_RANGE_SOURCES:
+        raise HilltopRequestError(
+            f"Invalid time range source: '{source}'. "
+            f"Expected one of {', '.join(_TIME_RANGE_SOURCES)}."
+        )
+    if source == "time_range":
+        return [
+            TimeRangeRequest(
+                base_url=str(client.base_url),
+                hts_endpoint=str(client.hts_endpoint),
+                site=site,
+                measurement=measurement,
+            )
+            for site, measurement in pairs
+        ]
+    template = client.request_template(MeasurementListRequest)
+    sites = dict.fromkeys(site for site, _ in pairs)
+    return [template.stamp(site=site) for site in sites]
+
+
+def _time_range_table(
+    pairs: list[tuple[str, str]], source: str, results: list[BaseModel]
+) -> pd.DataFrame:
+    """Assemble the time range table for pairs from the fetched responses.
+
+    Parameters
+    ----------
+    pairs : list of tuple of (str, str)
+        Site and measurement names, in the order of the table.
+    source : {"time_range", "measurement_list"}
+        The source the responses were fetched from.
+    results : list of BaseModel
+        TimeRange responses, one per pair, or MeasurementList responses,
+        one per site.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per pair with "Site", "Measurement", "From", "To" and
+        "Units" columns.
+    """
+    import pandas as pd
+
+    if source == "time_range" or not pairs:
+        return responses.TimeRangeResponse.table(results)
 
-load_dotenv()
+    # A measurement recorded in several data sources spans all of them.
+    ranges = (
+        pd.concat([result.time_ranges() for result in results])
+        .groupby(["Site", "Measurement"], sort=False)
+        .agg(From=("From", "min"), To=("To", "max"), Units=("Units", "first"))
+    )
+    index = pd.MultiIndex.from_arrays(
+        [[site for site, _ in pairs], [measurement for _, measurement in pairs]],
+        names=["Site", "Measurement"],
+    )
+    return ranges.reindex(index).reset_index()
 
 
 class HilltopClient:
@@ -38,9 +357,10 @@ class HilltopClient:
 
     Parameters
     ----------
-    base_url : str, optional
+    base_url : str or sequence of str, optional
         Base URL for the Hilltop server. If not provided, uses
-        HILLTOP_BASE_URL environment variable.
+        HILLTOP_BASE_URL environment variable. A list of base URLs of
+        mirrored servers spreads requests across them, with failover.
     hts_endpoint : str, optional
         HTS endpoint path (e.g., 'data.hts'). If not provided, uses
         HILLTOP_HTS_ENDPOINT environment variable.
@@ -54,12 +374,47 @@ class HilltopClient:
         Whether to enable HTTP/2 support.
     verify_ssl : bool, default False
         Whether to verify SSL certificates.
+    max_streams_per_connection : int, optional
+        Enables HTTP/2 fan-out mode, which requires ``http2=True``. Up to
+        this many requests share each of ``max_connections`` HTTP/2
+        connections, and further requests wait for a free stream. If the
+        server does not speak HTTP/2, the client switches to an HTTP/1.1
+        pool of ``http1_max_connections`` connections instead.
+    http1_max_connections : int, default 32
+        Size of the HTTP/1.1 fallback pool in fan-out mode, and the number
+        of requests in flight once it is in use.
+    compression : bool, default True
+        Whether to ask the server for compressed responses. Hilltop XML
+        typically compresses more than tenfold, which matters most on slow
+        links. Responses are decompressed chunk by chunk as they arrive.
+    hedging : HedgePolicy, optional
+        Send a second copy of small requests that have not been answered
+        within the policy's delay, and use whichever copy answers first.
+    endpoint_strategy : str, default "round_robin"
+        How requests are spread across several base URLs:
+        "round_robin", "least_outstanding" or "latency_weighted". See
+        ``EndpointPool``.
+    endpoint_cooldown : float, default 30.0
+        Seconds a mirror is skipped after it fails.
 
     Raises
     ------
     HilltopConfigError
         If required configuration (base_url or hts_endpoint) is not provided.
 
+    Notes
+    -----
+    One client can be shared by many threads. The underlying
+    ``httpx.Client`` and its connection pool are thread-safe, request
+    models are immutable once built, and every other piece of mutable
+    client state, such as the ``map`` thread pool and the counters behind
+    ``stats``, is only read or changed while holding the client's
+    ``TrackedLock``. New shared state must follow the same rule. The
+    exceptions are the ``HedgePolicy`` and ``EndpointPool``, which guard
+    their own state. Size
+    ``max_connections`` to the number of threads sharing the client, as
+    threads beyond it wait for a free connection.
+
     Examples
     --------
     >>> with HilltopClient() as client:
@@ -69,33 +424,55 @@ class HilltopClient:
 
     def __init__(
         self,
-        base_url: str | None = None,
+        base_url: str | Sequence[str] | None = None,
         hts_endpoint: str | None = None,
         timeout: int = 60,
         max_connections: int = 10,
         max_keepalive_connections: int = 5,
         http2: bool = False,
         verify_ssl: bool = False,  # Keep as False for backward compatibility
+        max_streams_per_connection: int | None = None,
+        http1_max_connections: int = 32,
+        compression: bool = True,
+        hedging: HedgePolicy | None = None,
+        endpoint_strategy: str = "round_robin",
+        endpoint_cooldown: float = 30.0,
     ):
-        self.base_url = base_url or os.getenv("HILLTOP_BASE_URL")
-        self.hts_endpoint = hts_endpoint or os.getenv("HILLTOP_HTS_ENDPOINT")
+        self.endpoints = _endpoint_pool(
+            base_url, endpoint_strategy, endpoint_cooldown
+        )
+        if self.endpoints is not None:
+            base_url = self.endpoints.primary
+        self.base_url, self.hts_endpoint = _resolve_config(base_url, hts_endpoint)
         self.timeout = timeout
         self.max_connections = max_connections
         self.max_keepalive_connections = max_keepalive_connections
         self.http2 = http2
         self.verify_ssl = verify_ssl
+        self.max_streams_per_connection = max_streams_per_connection
+        self.http1_max_connections = http1_max_connections
+        self.compression = compression
+        self.hedging = hedging
+        _check_fanout_options(self)
 
         # Create httpx session with configurable options
-        self.session = httpx.Client(
-            timeout=httpx.Timeout(timeout=timeout),
-            limits=httpx.Limits(
-                max_connections=max_connections,
-                max_keepalive_connections=max_keepalive_connections,
-            ),
-            http2=http2,
-            verify=verify_ssl,
-            follow_redirects=True,
-        )
+        self.session = httpx.Client(**_session_options(self, http2))
+        # Guards all mutable state below, as threads may share the client.
+        self._lock = TrackedLock()
+        # Created on first use of ``map`` and of hedging.
+        self._executor = None
+        self._hedge_executor = None
+        self._counters = dict.fromkeys(_COUNTERS, 0)
+        # Fan-out mode: ``_slots`` bounds the requests in flight on the
+        # current session, and sessions replaced by the HTTP/1.1 fallback
+        # are kept until the client is closed.
+        self._http2_session = self.session
+        self._http2_confirmed = False
+        self._retired_sessions = []
+        if max_streams_per_connection is not None:
+            self._slots = threading.BoundedSemaphore(
+                max_connections * max_streams_per_connection
+            )
 
         if not self.base_url:
             raise HilltopConfigError(
@@ -129,6 +506,78 @@ class HilltopClient:
                 raw_response=e.response.text,
             ) from e
 
+    def fetch(self, request: BaseHilltopRequest, **parse_options) -> BaseModel:
+        """Send a prebuilt request and parse the response.
+
+        This is the common path behind every ``get_*`` method. Call it
+        directly with requests stamped from a ``RequestTemplate``.
+
+        Parameters
+        ----------
+        request : BaseHilltopRequest
+            A validated request, e.g. from ``request_template().stamp()``.
+        **parse_options
+            Options passed to the response's ``from_xml``, e.g.
+            ``compact=True`` for a ``SiteListRequest``.
+
+        Returns
+        -------
+        BaseModel
+            The parsed response matching the request type, with its
+            ``request`` attribute set.
+
+        Raises
+        ------
+        HilltopRequestError
+            If the request type is not supported.
+        HilltopResponseError
+            If the HTTP request fails.
+        HilltopParseError
+            If the XML response cannot be parsed.
+        """
+        response_cls = _response_type(request)
+        if self.hedging is not None and self.hedging.applies_to(request):
+            response = self._hedged_get(request.gen_url())
+        else:
+            response = self._send(request.gen_url())
+        self._record(response)
+        self._validate_response(response)
+        result = response_cls.from_xml(response.text, **parse_options)
+        result.request = request
+        return result
+
+    def request_template(
+        self, request_cls: type[BaseHilltopRequest], **shared
+    ) -> RequestTemplate:
+        """Create a request template bound to this client's server.
+
+        Parameters
+        ----------
+        request_cls : type of BaseHilltopRequest
+            The request model to build, e.g. ``GetDataRequest``.
+        **shared
+            Parameters shared by every request stamped from the template.
+
+        Returns
+        -------
+        RequestTemplate
+            Template whose requests target this client's base URL and HTS
+            endpoint.
+
+        Examples
+        --------
+        >>> template = client.request_template(
+        ...     GetDataRequest, measurement="Flow", from_datetime="Data Start"
+        ... )
+        >>> results = [client.fetch(template.stamp(site=s)) for s in sites]
+        """
+        return RequestTemplate(
+            request_cls,
+            base_url=str(self.base_url),
+            hts_endpoint=str(self.hts_endpoint),
+            **shared,
+        )
+
     def get_collection_list(self, **kwargs) -> CollectionListResponse:
         """Fetch the collection list from Hilltop Server.
 
@@ -154,11 +603,7 @@ class HilltopClient:
             hts_endpoint=str(str(self.hts_endpoint)),
             **kwargs,
         )
-        response = self.session.get(request.gen_url())
-        self._validate_response(response)
-        result = CollectionListResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return self.fetch(request)
 
     def get_data(self, **kwargs) -> GetDataResponse:
         """Fetch measurement data from Hilltop Server.
@@ -188,11 +633,7 @@ class HilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = self.session.get(request.gen_url())
-        self._validate_response(response)
-        result = GetDataResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return self.fetch(request)
 
     def get_measurement_list(self, **kwargs) -> MeasurementListResponse:
         """Fetch the measurement list from Hilltop Server.
@@ -220,11 +661,7 @@ class HilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = self.session.get(request.gen_url())
-        self._validate_response(response)
-        result = MeasurementListResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return self.fetch(request)
 
     def get_site_info(self, **kwargs) -> SiteInfoResponse:
         """Fetch detailed information about a specific site from Hilltop Server.
@@ -253,17 +690,77 @@ class HilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = self.session.get(request.gen_url())
-        self._validate_response(response)
-        result = SiteInfoResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return self.fetch(request)
+
+    def get_site_info_many(
+        self,
+        sites: Iterable[str],
+        field_list: list[str] | None = None,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> SiteInfoResponse:
+        """Fetch information about many sites concurrently.
+
+        One SiteInfo request is sent per site, with at most ``max_workers``
+        in flight at once, and the responses are combined in site order.
+
+        Parameters
+        ----------
+        sites : iterable of str
+            Names of the sites to fetch.
+        field_list : list of str, optional
+            Info fields to fetch. They are requested from the server with
+            ``FieldList`` and, as some servers ignore it, also used to skip
+            other fields while parsing. Defaults to every field.
+        max_workers : int, default 8
+            Maximum number of requests in flight at once.
+        **kwargs
+            Additional request parameters passed to SiteInfoRequest.
+
+        Returns
+        -------
+        SiteInfoResponse
+            A single response holding the info of every site.
 
-    def get_site_list(self, **kwargs) -> SiteListResponse:
+        Raises
+        ------
+        HilltopRequestError
+            If the request parameters are invalid.
+        HilltopResponseError
+            If any HTTP request fails.
+        HilltopParseError
+            If any XML response cannot be parsed.
+
+        Examples
+        --------
+        >>> info = client.get_site_info_many(
+        ...     sites, field_list=["Easting", "Northing", "Altitude"]
+        ... )
+        >>> df = info.to_dataframe()
+        """
+        template = self.request_template(
+            SiteInfoRequest, field_list=field_list, **kwargs
+        )
+        results = self.map(
+            self.fetch,
+            [
+                {"request": template.stamp(site=site), "fields": field_list}
+                for site in sites
+            ],
+            max_workers=max_workers,
+            return_exceptions=False,
+        )
+        return responses.SiteInfoResponse.concat(results)
+
+    def get_site_list(self, compact: bool = False, **kwargs) -> SiteListResponse:
         """Fetch the site list from Hilltop Server.
 
         Parameters
         ----------
+        compact : bool, default False
+            Parse the sites into a ``CompactSiteList`` backed by NumPy
+            arrays instead of a list of ``Site`` models. Recommended for
+            site lists with thousands of sites.
         **kwargs
             Additional request parameters passed to SiteListRequest. Common
             parameters include location, bounding_box, measurement, and
@@ -287,11 +784,7 @@ class HilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = self.session.get(request.gen_url())
-        self._validate_response(response)
-        result = SiteListResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return self.fetch(request, compact=compact)
 
     def get_status(self, **kwargs) -> StatusResponse:
         """Fetch the server status from Hilltop Server.
@@ -319,11 +812,7 @@ class HilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = self.session.get(request.gen_url())
-        self._validate_response(response)
-        result = StatusResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return self.fetch(request)
 
     def get_time_range(self, **kwargs) -> TimeRangeResponse:
         """Fetch the available time range for measurements from Hilltop Server.
@@ -352,14 +841,352 @@ class HilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = self.session.get(request.gen_url())
-        self._validate_response(response)
-        result = TimeRangeResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return self.fetch(request)
+
+    def get_time_ranges(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        source: str = "time_range",
+        max_workers: int = 8,
+    ) -> pd.DataFrame:
+        """Fetch the time ranges of many site and measurement pairs.
+
+        Parameters
+        ----------
+        pairs : iterable of tuple of (str, str)
+            Site and measurement names.
+        source : {"time_range", "measurement_list"}, default "time_range"
+            Send one TimeRange request per pair, or one MeasurementList
+            request per site and read the "From" and "To" of each
+            measurement. The latter is cheaper when many measurements are
+            needed from the same sites.
+        max_workers : int, default 8
+            Maximum number of requests in flight at once.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per pair, in order, with "Site", "Measurement", "From",
+            "To" and "Units" columns. With the "measurement_list" source,
+            pairs the site does not list have NaT times.
+
+        Raises
+        ------
+        HilltopRequestError
+            If the source is not supported or a pair is invalid.
+        HilltopResponseError
+            If any HTTP request fails.
+        HilltopParseError
+            If any XML response cannot be parsed.
+
+        Examples
+        --------
+        >>> ranges = client.get_time_ranges(
+        ...     [("Site A", "Flow"), ("Site B", "Rainfall")]
+        ... )
+        """
+        pairs = list(pairs)
+        requests = _time_range_requests(self, pairs, source)
+        results = self.map(
+            self.fetch,
+            [{"request": request} for request in requests],
+            max_workers=max_workers,
+            return_exceptions=False,
+        )
+        return _time_range_table(pairs, source, results)
+
+    def _send(self, url: str) -> httpx.Response:
+        """Send a GET request to one of the client's endpoints.
+
+        With several endpoints, a request that fails to connect or gets a
+        5xx response is retried on each other endpoint in turn. The last
+        error or response is returned once every endpoint has been tried.
+        """
+        if self.endpoints is None:
+            return self._get(url)
+
+        tried = []
+        while True:
+            endpoint = self.endpoints.acquire(exclude=tried)
+            tried.append(endpoint)
+            start = time.perf_counter()
+            try:
+                response = self._get(self.endpoints.url_for(url, endpoint))
+            except httpx.TransportError:
+                self.endpoints.release(endpoint, failed=True)
+                if len(tried) == len(self.endpoints):
+                    raise
+                continue
+            except BaseException:
+                self.endpoints.release(endpoint)
+                raise
+            if response.is_server_error:
+                self.endpoints.release(endpoint, failed=True)
+                if len(tried) < len(self.endpoints):
+                    continue
+            else:
+                self.endpoints.release(endpoint, time.perf_counter() - start)
+            return response
+
+    def _get(self, url: str) -> httpx.Response:
+        """Send a GET request, within the fan-out stream limits if enabled."""
+        if self.max_streams_per_connection is None:
+            return self.session.get(url)
+
+        with self._lock:
+            session, slots = self.session, self._slots
+        with slots:
+            try:
+                response = session.get(url)
+            except _HTTP1_ONLY_ERRORS:
+                # A server that only speaks HTTP/1.1 drops HTTP/2 prior
+                # knowledge connections, mid-write or before answering.
+                # Failing to connect says nothing about the protocol, so
+                # ConnectError and timeouts are raised as they are.
+                if not self._fall_back_to_http1(session):
+                    raise
+                return self._get(url)
+
+        if session is self._http2_session:
+            if response.http_version == "HTTP/2":
+                if not self._http2_confirmed:
+                    with self._lock:
+                        self._http2_confirmed = True
+            else:
+                self._fall_back_to_http1(session)
+        return response
+
+    def _hedged_get(self, url: str) -> httpx.Response:
+        """Send a GET request, and a second copy if the first is slow.
+
+        Both copies run on the client's hedging thread pool. A running
+        request cannot be interrupted, so the copy that loses the race runs
+        to completion in the background and its response is discarded.
+        """
+        policy = self.hedging
+        policy.start()
+        executor = self._get_hedge_executor()
+        started = threading.Event()
+        primary = executor.submit(self._timed_get, url, started)
+        # Time the delay from when the request is sent, not while it waits
+        # for a thread behind other hedged requests.
+        started.wait()
+        done, _ = wait([primary], timeout=policy.delay())
+        if done or not policy.allow_hedge():
+            return primary.result()
+
+        hedge = executor.submit(self._timed_get, url)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    if future is hedge:
+                        policy.record_win()
+                    return future.result()
+        # Both copies failed; report the original request's error.
+        return primary.result()
+
+    def _timed_get(
+        self, url: str, started: threading.Event | None = None
+    ) -> httpx.Response:
+        """Send a GET request and record its response time for hedging.
+
+        ``started`` is set as the request is sent.
+        """
+        if started is not None:
+            started.set()
+        start = time.perf_counter()
+        response = self._send(url)
+        self.hedging.record(time.perf_counter() - start)
+        return response
+
+    def _fall_back_to_http1(self, session: httpx.Client) -> bool:
+        """Switch fan-out requests from HTTP/2 to an HTTP/1.1 pool.
+
+        Parameters
+        ----------
+        session : httpx.Client
+            The session a request failed or was downgraded on.
+
+        Returns
+        -------
+        bool
+            True if requests now go through the HTTP/1.1 pool and a failed
+            request should be retried there, False if the failure happened
+            after the server had already answered over HTTP/2.
+        """
+        with self._lock:
+            if session is not self._http2_session or self._http2_confirmed:
+                return False
+            if self.session is session:
+                self._retired_sessions.append(session)
+                self.session = httpx.Client(**_session_options(self, False))
+                self._slots = threading.BoundedSemaphore(self.http1_max_connections)
+            return True
+
+    def _record(self, response: httpx.Response) -> None:
+        """Count a received response and its size before and after decoding."""
+        with self._lock:
+            _count(self._counters, response)
+
+    def stats(self) -> dict:
+        """Return counters describing the client's activity.
+
+        Returns
+        -------
+        dict
+            "responses" and "error_responses" received, "bytes_received"
+            over the network and "bytes_decoded" after decompression, and
+            under "lock" the contention counters of the lock guarding the
+            client's shared state (see ``TrackedLock.stats``). Under
+            "hedging" are the hedging counters (see ``HedgePolicy.stats``)
+            if hedging is enabled, and under "endpoints" the load and
+            health of each mirror (see ``EndpointPool.stats``) if there are
+            several.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+        counters["lock"] = self._lock.stats()
+        if self.hedging is not None:
+            counters["hedging"] = self.hedging.stats()
+        if self.endpoints is not None:
+            counters["endpoints"] = self.endpoints.stats()
+        return counters
+
+    def _pool_size(self) -> int:
+        """Return how many requests the connection pool can carry at once.
+
+        That is one per connection, or one per stream in fan-out mode.
+        """
+        if self.max_streams_per_connection is None:
+            return self.max_connections
+        return self.max_connections * self.max_streams_per_connection
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the client's thread pool, creating it on first use.
+
+        It has one thread per request the connection pool can carry at once.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._pool_size(), thread_name_prefix="whurl"
+                )
+            return self._executor
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool for hedged requests, creating it on first use.
+
+        It is separate from the ``map`` pool, so that mapped calls waiting
+        on hedged requests cannot take every thread. It has room for an
+        original and a hedge for each request the connection pool can carry.
+        """
+        with self._lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=2 * self._pool_size(),
+                    thread_name_prefix="whurl-hedge",
+                )
+            return self._hedge_executor
+
+    def map(
+        self,
+        method: str | Callable,
+        kwargs_list: Iterable[Mapping[str, Any]],
+        max_workers: int | None = None,
+        return_exceptions: bool = True,
+    ) -> list:
+        """Call a client method once per set of keyword arguments, in parallel.
+
+        Calls run on a thread pool owned by the client. It has one thread
+        per connection in the pool (``max_connections``), or per stream in
+        HTTP/2 fan-out mode, is created on first use and is shut down by
+        ``close``. Methods that themselves
+        call ``map``, such as ``get_site_info_many``, should not be mapped.
+
+        Parameters
+        ----------
+        method : str or callable
+            Name of a public client method, e.g. ``"get_data"``, or any
+            callable such as ``client.fetch``.
+        kwargs_list : iterable of mapping
+            Keyword arguments for each call.
+        max_workers : int, optional
+            Maximum number of calls in flight at once. Defaults to the size
+            of the thread pool.
+        return_exceptions : bool, default True
+            If True, a call that raises puts its exception in the results
+            in place of a response. If False, the first exception, in input
+            order, is raised once every call has finished.
+
+        Returns
+        -------
+        list
+            The result, or exception, of each call in input order.
+
+        Raises
+        ------
+        HilltopRequestError
+            If ``method`` is not a public client method, or ``max_workers``
+            is less than 1.
+
+        Examples
+        --------
+        >>> results = client.map(
+        ...     "get_data",
+        ...     [{"site": site, "measurement": "Flow"} for site in sites],
+        ... )
+        >>> failed = [r for r in results if isinstance(r, Exception)]
+        """
+        if isinstance(method, str):
+            func = getattr(self, method, None) if not method.startswith("_") else None
+            if not callable(func):
+                raise HilltopRequestError(f"Unknown HilltopClient method: '{method}'")
+        else:
+            func = method
+        if max_workers is not None and max_workers < 1:
+            raise HilltopRequestError("max_workers must be at least 1")
+
+        executor = self._get_executor()
+        slots = threading.BoundedSemaphore(max_workers) if max_workers else None
+        futures = []
+        for kwargs in kwargs_list:
+            if slots is not None:
+                # Wait for a free slot so at most max_workers calls run at once.
+                slots.acquire()
+            future = executor.submit(func, **kwargs)
+            if slots is not None:
+                future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+
+        results = []
+        for future in futures:
+            error = future.exception()
+            if error is not None and not return_exceptions:
+                # Let the remaining calls finish before raising.
+                for rest in futures:
+                    rest.exception()
+                raise error
+            results.append(error if error is not None else future.result())
+        return results
 
     def close(self):
-        """Close the HTTP session and clean up resources."""
+        """Close the HTTP session and clean up resources.
+
+        The thread pools used by ``map`` and hedging are shut down first,
+        waiting for any calls still in flight.
+        """
+        with self._lock:
+            executors = [self._executor, self._hedge_executor]
+            self._executor = self._hedge_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        for session in self._retired_sessions:
+            session.close()
         self.session.close()
 
     def __enter__(self):
@@ -397,9 +1224,10 @@ class AsyncHilltopClient:
 
     Parameters
     ----------
-    base_url : str, optional
+    base_url : str or sequence of str, optional
         Base URL for the Hilltop server. If not provided, uses
-        HILLTOP_BASE_URL environment variable.
+        HILLTOP_BASE_URL environment variable. A list of base URLs of
+        mirrored servers spreads requests across them, with failover.
     hts_endpoint : str, optional
         HTS endpoint path (e.g., 'data.hts'). If not provided, uses
         HILLTOP_HTS_ENDPOINT environment variable.
@@ -413,12 +1241,40 @@ class AsyncHilltopClient:
         Whether to enable HTTP/2 support.
     verify_ssl : bool, default False
         Whether to verify SSL certificates.
+    max_streams_per_connection : int, optional
+        Enables HTTP/2 fan-out mode, which requires ``http2=True``. Up to
+        this many requests share each of ``max_connections`` HTTP/2
+        connections, and further requests wait for a free stream. If the
+        server does not speak HTTP/2, the client switches to an HTTP/1.1
+        pool of ``http1_max_connections`` connections instead.
+    http1_max_connections : int, default 32
+        Size of the HTTP/1.1 fallback pool in fan-out mode, and the number
+        of requests in flight once it is in use.
+    compression : bool, default True
+        Whether to ask the server for compressed responses. Hilltop XML
+        typically compresses more than tenfold, which matters most on slow
+        links. Responses are decompressed chunk by chunk as they arrive.
+    hedging : HedgePolicy, optional
+        Send a second copy of small requests that have not been answered
+        within the policy's delay, and use whichever copy answers first.
+    endpoint_strategy : str, default "round_robin"
+        How requests are spread across several base URLs:
+        "round_robin", "least_outstanding" or "latency_weighted". See
+        ``EndpointPool``.
+    endpoint_cooldown : float, default 30.0
+        Seconds a mirror is skipped after it fails.
 
     Raises
     ------
     HilltopConfigError
         If required configuration (base_url or hts_endpoint) is not provided.
 
+    Notes
+    -----
+    The client is safe to share between tasks on one event loop, but not
+    between threads or event loops. Its counters are only changed from the
+    event loop, between awaits, so they need no lock.
+
     Examples
     --------
     >>> async with AsyncHilltopClient() as client:
@@ -428,33 +1284,48 @@ class AsyncHilltopClient:
 
     def __init__(
         self,
-        base_url: str | None = None,
+        base_url: str | Sequence[str] | None = None,
         hts_endpoint: str | None = None,
         timeout: int = 60,
         max_connections: int = 10,
         max_keepalive_connections: int = 5,
         http2: bool = False,
         verify_ssl: bool = False,
+        max_streams_per_connection: int | None = None,
+        http1_max_connections: int = 32,
+        compression: bool = True,
+        hedging: HedgePolicy | None = None,
+        endpoint_strategy: str = "round_robin",
+        endpoint_cooldown: float = 30.0,
     ):
-        self.base_url = base_url or os.getenv("HILLTOP_BASE_URL")
-        self.hts_endpoint = hts_endpoint or os.getenv("HILLTOP_HTS_ENDPOINT")
+        self.endpoints = _endpoint_pool(
+            base_url, endpoint_strategy, endpoint_cooldown
+        )
+        if self.endpoints is not None:
+            base_url = self.endpoints.primary
+        self.base_url, self.hts_endpoint = _resolve_config(base_url, hts_endpoint)
         self.timeout = timeout
         self.max_connections = max_connections
         self.max_keepalive_connections = max_keepalive_connections
         self.http2 = http2
         self.verify_ssl = verify_ssl
+        self.max_streams_per_connection = max_streams_per_connection
+        self.http1_max_connections = http1_max_connections
+        self.compression = compression
+        self.hedging = hedging
+        _check_fanout_options(self)
 
         # Create async httpx session
-        self.session = httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout=timeout),
-            limits=httpx.Limits(
-                max_connections=max_connections,
-                max_keepalive_connections=max_keepalive_connections,
-            ),
-            http2=http2,
-            verify=verify_ssl,
-            follow_redirects=True,
-        )
+        self.session = httpx.AsyncClient(**_session_options(self, http2))
+        self._counters = dict.fromkeys(_COUNTERS, 0)
+        # Fan-out mode state, as for HilltopClient.
+        self._http2_session = self.session
+        self._http2_confirmed = False
+        self._retired_sessions = []
+        if max_streams_per_connection is not None:
+            self._slots = asyncio.Semaphore(
+                max_connections * max_streams_per_connection
+            )
 
         if not self.base_url:
             raise HilltopConfigError(
@@ -488,6 +1359,236 @@ class AsyncHilltopClient:
                 raw_response=e.response.text,
             ) from e
 
+    async def _send(self, url: str) -> httpx.Response:
+        """Send a GET request to one of the client's endpoints.
+
+        See ``HilltopClient._send``.
+        """
+        if self.endpoints is None:
+            return await self._get(url)
+
+        tried = []
+        while True:
+            endpoint = self.endpoints.acquire(exclude=tried)
+            tried.append(endpoint)
+            start = time.perf_counter()
+            try:
+                response = await self._get(self.endpoints.url_for(url, endpoint))
+            except httpx.TransportError:
+                self.endpoints.release(endpoint, failed=True)
+                if len(tried) == len(self.endpoints):
+                    raise
+                continue
+            except BaseException:
+                # Cancelled, e.g. as the losing copy of a hedged request.
+                self.endpoints.release(endpoint)
+                raise
+            if response.is_server_error:
+                self.endpoints.release(endpoint, failed=True)
+                if len(tried) < len(self.endpoints):
+                    continue
+            else:
+                self.endpoints.release(endpoint, time.perf_counter() - start)
+            return response
+
+    async def _get(self, url: str) -> httpx.Response:
+        """Send a GET request, within the fan-out stream limits if enabled."""
+        if self.max_streams_per_connection is None:
+            return await self.session.get(url)
+
+        session, slots = self.session, self._slots
+        async with slots:
+            try:
+                response = await session.get(url)
+            except _HTTP1_ONLY_ERRORS:
+                # A server that only speaks HTTP/1.1 drops HTTP/2 prior
+                # knowledge connections, mid-write or before answering.
+                # Failing to connect says nothing about the protocol, so
+                # ConnectError and timeouts are raised as they are.
+                if not self._fall_back_to_http1(session):
+                    raise
+                return await self._get(url)
+
+        if session is self._http2_session:
+            if response.http_version == "HTTP/2":
+                self._http2_confirmed = True
+            else:
+                self._fall_back_to_http1(session)
+        return response
+
+    async def _hedged_get(self, url: str) -> httpx.Response:
+        """Send a GET request, and a second copy if the first is slow.
+
+        The copy that loses the race is cancelled.
+        """
+        policy = self.hedging
+        policy.start()
+        primary = asyncio.ensure_future(self._timed_get(url))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=policy.delay())
+            if done or not policy.allow_hedge():
+                return await primary
+
+            hedge = asyncio.ensure_future(self._timed_get(url))
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            policy.record_win()
+                        return task.result()
+            # Both copies failed; report the original request's error.
+            return primary.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _timed_get(self, url: str) -> httpx.Response:
+        """Send a GET request and record its response time for hedging."""
+        start = time.perf_counter()
+        response = await self._send(url)
+        self.hedging.record(time.perf_counter() - start)
+        return response
+
+    def _fall_back_to_http1(self, session: httpx.AsyncClient) -> bool:
+        """Switch fan-out requests from HTTP/2 to an HTTP/1.1 pool.
+
+        See ``HilltopClient._fall_back_to_http1``.
+        """
+        if session is not self._http2_session or self._http2_confirmed:
+            return False
+        if self.session is session:
+            self._retired_sessions.append(session)
+            self.session = httpx.AsyncClient(**_session_options(self, False))
+            self._slots = asyncio.Semaphore(self.http1_max_connections)
+        return True
+
+    def _record(self, response: httpx.Response) -> None:
+        """Count a received response and its size before and after decoding."""
+        _count(self._counters, response)
+
+    def stats(self) -> dict:
+        """Return counters describing the client's activity.
+
+        Returns
+        -------
+        dict
+            "responses" and "error_responses" received, "bytes_received"
+            over the network and "bytes_decoded" after decompression, and
+            under "hedging" the hedging counters (see ``HedgePolicy.stats``)
+            if hedging is enabled, and under "endpoints" the load and
+            health of each mirror (see ``EndpointPool.stats``) if there are
+            several.
+        """
+        counters = dict(self._counters)
+        if self.hedging is not None:
+            counters["hedging"] = self.hedging.stats()
+        if self.endpoints is not None:
+            counters["endpoints"] = self.endpoints.stats()
+        return counters
+
+    async def fetch(self, request: BaseHilltopRequest, **parse_options) -> BaseModel:
+        """Send a prebuilt request and parse the response.
+
+        This is the common path behind every ``get_*`` method. Call it
+        directly with requests stamped from a ``RequestTemplate``.
+
+        Parameters
+        ----------
+        request : BaseHilltopRequest
+            A validated request, e.g. from ``request_template().stamp()``.
+        **parse_options
+            Options passed to the response's ``from_xml``, e.g.
+            ``compact=True`` for a ``SiteListRequest``.
+
+        Returns
+        -------
+        BaseModel
+            The parsed response matching the request type, with its
+            ``request`` attribute set.
+
+        Raises
+        ------
+        HilltopRequestError
+            If the request type is not supported.
+        HilltopResponseError
+            If the HTTP request fails.
+        HilltopParseError
+            If the XML response cannot be parsed.
+        """
+        response_cls = _response_type(request)
+        if self.hedging is not None and self.hedging.applies_to(request):
+            response = await self._hedged_get(request.gen_url())
+        else:
+            response = await self._send(request.gen_url())
+        self._record(response)
+        await self._validate_response(response)
+        result = response_cls.from_xml(response.text, **parse_options)
+        result.request = request
+        return result
+
+    def request_template(
+        self, request_cls: type[BaseHilltopRequest], **shared
+    ) -> RequestTemplate:
+        """Create a request template bound to this client's server.
+
+        Parameters
+        ----------
+        request_cls : type of BaseHilltopRequest
+            The request model to build, e.g. ``GetDataRequest``.
+        **shared
+            Parameters shared by every request stamped from the template.
+
+        Returns
+        -------
+        RequestTemplate
+            Template whose requests target this client's base URL and HTS
+            endpoint.
+
+        Examples
+        --------
+        >>> template = client.request_template(
+        ...     GetDataRequest, measurement="Flow", from_datetime="Data Start"
+        ... )
+        >>> results = await asyncio.gather(
+        ...     *(client.fetch(template.stamp(site=s)) for s in sites)
+        ... )
+        """
+        return RequestTemplate(
+            request_cls,
+            base_url=str(self.base_url),
+            hts_endpoint=str(self.hts_endpoint),
+            **shared,
+        )
+
+    def poller(self, series: Iterable[tuple[str, str]], **options) -> Poller:
+        """Create a poller that watches series for new values.
+
+        Parameters
+        ----------
+        series : iterable of (str, str)
+            The (site, measurement) pairs to poll.
+        **options
+            Polling options, such as ``interval`` or ``max_concurrency``.
+            See ``Poller``.
+
+        Returns
+        -------
+        Poller
+            A poller sending its requests through this client.
+
+        Examples
+        --------
+        >>> poller = client.poller(pairs, max_concurrency=100)
+        >>> await poller.run(alert_on_threshold)
+        """
+        return Poller(self, series, **options)
+
     async def get_collection_list(self, **kwargs) -> CollectionListResponse:
         """Fetch the collection list from Hilltop Server asynchronously.
 
@@ -513,11 +1614,7 @@ class AsyncHilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = await self.session.get(request.gen_url())
-        await self._validate_response(response)
-        result = CollectionListResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return await self.fetch(request)
 
     async def get_data(self, **kwargs) -> GetDataResponse:
         """Fetch measurement data from Hilltop Server asynchronously.
@@ -547,11 +1644,7 @@ class AsyncHilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = await self.session.get(request.gen_url())
-        await self._validate_response(response)
-        result = GetDataResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return await self.fetch(request)
 
     async def get_measurement_list(self, **kwargs) -> MeasurementListResponse:
         """Fetch the measurement list from Hilltop Server asynchronously.
@@ -579,11 +1672,7 @@ class AsyncHilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = await self.session.get(request.gen_url())
-        await self._validate_response(response)
-        result = MeasurementListResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return await self.fetch(request)
 
     async def get_site_info(self, **kwargs) -> SiteInfoResponse:
         """Fetch detailed information about a site from Hilltop Server asynchronously.
@@ -612,17 +1701,69 @@ class AsyncHilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = await self.session.get(request.gen_url())
-        await self._validate_response(response)
-        result = SiteInfoResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return await self.fetch(request)
+
+    async def get_site_info_many(
+        self,
+        sites: Iterable[str],
+        field_list: list[str] | None = None,
+        max_concurrency: int = 8,
+        **kwargs,
+    ) -> SiteInfoResponse:
+        """Fetch information about many sites concurrently.
+
+        One SiteInfo request is sent per site, with at most
+        ``max_concurrency`` in flight at once, and the responses are
+        combined in site order.
+
+        Parameters
+        ----------
+        sites : iterable of str
+            Names of the sites to fetch.
+        field_list : list of str, optional
+            Info fields to fetch. They are requested from the server with
+            ``FieldList`` and, as some servers ignore it, also used to skip
+            other fields while parsing. Defaults to every field.
+        max_concurrency : int, default 8
+            Maximum number of requests in flight at once.
+        **kwargs
+            Additional request parameters passed to SiteInfoRequest.
+
+        Returns
+        -------
+        SiteInfoResponse
+            A single response holding the info of every site.
+
+        Raises
+        ------
+        HilltopRequestError
+            If the request parameters are invalid.
+        HilltopResponseError
+            If any HTTP request fails.
+        HilltopParseError
+            If any XML response cannot be parsed.
+        """
+        template = self.request_template(
+            SiteInfoRequest, field_list=field_list, **kwargs
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(site: str) -> SiteInfoResponse:
+            async with semaphore:
+                return await self.fetch(template.stamp(site=site), fields=field_list)
+
+        results = await asyncio.gather(*(fetch(site) for site in sites))
+        return responses.SiteInfoResponse.concat(results)
 
-    async def get_site_list(self, **kwargs) -> SiteListResponse:
+    async def get_site_list(self, compact: bool = False, **kwargs) -> SiteListResponse:
         """Fetch the site list from Hilltop Server asynchronously.
 
         Parameters
         ----------
+        compact : bool, default False
+            Parse the sites into a ``CompactSiteList`` backed by NumPy
+            arrays instead of a list of ``Site`` models. Recommended for
+            site lists with thousands of sites.
         **kwargs
             Additional request parameters passed to SiteListRequest. Common
             parameters include location, bounding_box, measurement, and
@@ -646,11 +1787,7 @@ class AsyncHilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = await self.session.get(request.gen_url())
-        await self._validate_response(response)
-        result = SiteListResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return await self.fetch(request, compact=compact)
 
     async def get_status(self, **kwargs) -> StatusResponse:
         """Fetch the server status from Hilltop Server asynchronously.
@@ -678,11 +1815,7 @@ class AsyncHilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = await self.session.get(request.gen_url())
-        await self._validate_response(response)
-        result = StatusResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return await self.fetch(request)
 
     async def get_time_range(self, **kwargs) -> TimeRangeResponse:
         """Fetch time range for measurements from Hilltop Server asynchronously.
@@ -711,14 +1844,59 @@ class AsyncHilltopClient:
             hts_endpoint=str(self.hts_endpoint),
             **kwargs,
         )
-        response = await self.session.get(request.gen_url())
-        await self._validate_response(response)
-        result = TimeRangeResponse.from_xml(response.text)
-        result.request = request
-        return result
+        return await self.fetch(request)
+
+    async def get_time_ranges(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        source: str = "time_range",
+        max_concurrency: int = 8,
+    ) -> pd.DataFrame:
+        """Fetch the time ranges of many site and measurement pairs.
+
+        Parameters
+        ----------
+        pairs : iterable of tuple of (str, str)
+            Site and measurement names.
+        source : {"time_range", "measurement_list"}, default "time_range"
+            Send one TimeRange request per pair, or one MeasurementList
+            request per site and read the "From" and "To" of each
+            measurement. The latter is cheaper when many measurements are
+            needed from the same sites.
+        max_concurrency : int, default 8
+            Maximum number of requests in flight at once.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per pair, in order, with "Site", "Measurement", "From",
+            "To" and "Units" columns. With the "measurement_list" source,
+            pairs the site does not list have NaT times.
+
+        Raises
+        ------
+        HilltopRequestError
+            If the source is not supported or a pair is invalid.
+        HilltopResponseError
+            If any HTTP request fails.
+        HilltopParseError
+            If any XML response cannot be parsed.
+        """
+        pairs = list(pairs)
+        requests = _time_range_requests(self, pairs, source)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(request: BaseHilltopRequest) -> BaseModel:
+            async with semaphore:
+                return await self.fetch(request)
+
+        results = await asyncio.gather(*(fetch(request) for request in requests))
+        return _time_range_table(pairs, source, list(results))
 
     async def close(self):
         """Close the HTTP session and clean up resources asynchronously."""
+        for session in self._retired_sessions:
+            await session.aclose()
         await self.session.aclose()
 
     async def __aenter__(self):
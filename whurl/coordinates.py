@@ -0,0 +1,317 @@
+"""Vectorised coordinate transforms between New Zealand reference systems.
+
+This module converts site coordinates between the four EPSG codes accepted
+by Hilltop Server bounding boxes, entirely in NumPy:
+
+- EPSG:4326 (WGS84 longitude/latitude)
+- EPSG:4167 (NZGD2000 longitude/latitude)
+- EPSG:2193 (NZTM 2000 easting/northing)
+- EPSG:27200 (NZMG easting/northing, on the NZGD49 datum)
+
+NZGD2000 is treated as identical to WGS84, which holds to about a metre.
+NZGD49 is shifted to NZGD2000 with the seven-parameter transformation
+published by LINZ (EPSG:1564), which is accurate to about 4 m; the
+distortion grid needed for sub-metre NZMG conversions is not used.
+
+Geographic coordinates are always ordered longitude first, to match
+easting first for the projected systems.
+"""
+
+import numpy as np
+
+from whurl.exceptions import HilltopRequestError
+
+GEOGRAPHIC_CRS = ("EPSG:4326", "EPSG:4167")
+PROJECTED_CRS = ("EPSG:2193", "EPSG:27200")
+SUPPORTED_CRS = GEOGRAPHIC_CRS + PROJECTED_CRS
+
+# Ellipsoids as (semi-major axis, flattening).
+_GRS80 = (6378137.0, 1 / 298.257222101)
+_INTERNATIONAL_1924 = (6378388.0, 1 / 297.0)
+
+# New Zealand Transverse Mercator 2000.
+_NZTM_LON0 = 173.0
+_NZTM_K0 = 0.9996
+_NZTM_FALSE_EASTING = 1600000.0
+_NZTM_FALSE_NORTHING = 10000000.0
+
+# New Zealand Map Grid, from LINZ technical report OSG TR 12.
+_NZMG_LAT0 = -41.0
+_NZMG_LON0 = 173.0
+_NZMG_FALSE_EASTING = 2510000.0
+_NZMG_FALSE_NORTHING = 6023150.0
+_NZMG_TPSI = np.array(
+    [
+        0.6399175073,
+        -0.1358797613,
+        0.063294409,
+        -0.02526853,
+        0.0117879,
+        -0.0055161,
+        0.0026906,
+        -0.001333,
+        0.00067,
+        -0.00034,
+    ]
+)
+_NZMG_TPHI = np.array(
+    [
+        1.5627014243,
+        0.5185406398,
+        -0.03333098,
+        -0.1052906,
+        -0.0368594,
+        0.007317,
+        0.01220,
+        0.00394,
+        -0.0013,
+    ]
+)
+_NZMG_B = np.array(
+    [
+        0.7557853228 + 0j,
+        0.249204646 + 0.003371507j,
+        -0.001541739 + 0.041058560j,
+        -0.10162907 + 0.01727609j,
+        -0.26623489 - 0.36249218j,
+        -0.6870983 - 1.1651967j,
+    ]
+)
+_NZMG_C = np.array(
+    [
+        1.3231270439 + 0j,
+        -0.577245789 - 0.007809598j,
+        0.508307513 - 0.112208952j,
+        -0.15094762 + 0.18200602j,
+        1.01418179 + 1.64497696j,
+        1.9660549 + 2.5127645j,
+    ]
+)
+
+# NZGD49 to NZGD2000 (EPSG:1564): translations in metres, coordinate frame
+# rotations in arc-seconds and scale in parts per million.
+_NZGD49_SHIFT = (59.47, -5.04, 187.44)
+_NZGD49_ROTATION = (-0.47, 0.1, -1.024)
+_NZGD49_SCALE = -4.5993
+
+
+def _polyval(coefficients: np.ndarray, x):
+    """Evaluate a polynomial with no constant term, lowest power first."""
+    result = np.zeros_like(x)
+    for coefficient in coefficients[::-1]:
+        result = (result + coefficient) * x
+    return result
+
+
+def _tm_series(flattening: float):
+    """Return the Krüger series coefficients for a Transverse Mercator.
+
+    Returns
+    -------
+    tuple
+        Rectifying radius divided by the semi-major axis, and the forward,
+        inverse and latitude series coefficients (third order in n).
+    """
+    n = flattening / (2 - flattening)
+    rectifying = (1 + n**2 / 4 + n**4 / 64) / (1 + n)
+    alpha = (
+        n / 2 - 2 * n**2 / 3 + 5 * n**3 / 16,
+        13 * n**2 / 48 - 3 * n**3 / 5,
+        61 * n**3 / 240,
+    )
+    beta = (
+        n / 2 - 2 * n**2 / 3 + 37 * n**3 / 96,
+        n**2 / 48 + n**3 / 15,
+        17 * n**3 / 480,
+    )
+    delta = (
+        2 * n - 2 * n**2 / 3 - 2 * n**3,
+        7 * n**2 / 3 - 8 * n**3 / 5,
+        56 * n**3 / 15,
+    )
+    return rectifying, alpha, beta, delta
+
+
+def _nztm_forward(lon, lat):
+    """Project NZGD2000 longitude/latitude in degrees to NZTM."""
+    a, f = _GRS80
+    rectifying, alpha, _, _ = _tm_series(f)
+    e = np.sqrt(f * (2 - f))
+
+    phi = np.radians(lat)
+    dlam = np.radians(lon - _NZTM_LON0)
+    sin_phi = np.sin(phi)
+    t = np.sinh(np.arctanh(sin_phi) - e * np.arctanh(e * sin_phi))
+    xi = np.arctan2(t, np.cos(dlam))
+    eta = np.arctanh(np.sin(dlam) / np.sqrt(1 + t**2))
+
+    northing = xi.copy()
+    easting = eta.copy()
+    for j, coefficient in enumerate(alpha, start=1):
+        northing += coefficient * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+        easting += coefficient * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+
+    scale = _NZTM_K0 * a * rectifying
+    return (
+        _NZTM_FALSE_EASTING + scale * easting,
+        _NZTM_FALSE_NORTHING + scale * northing,
+    )
+
+
+def _nztm_inverse(easting, northing):
+    """Unproject NZTM easting/northing to NZGD2000 longitude/latitude."""
+    a, f = _GRS80
+    rectifying, _, beta, delta = _tm_series(f)
+
+    scale = _NZTM_K0 * a * rectifying
+    xi = (northing - _NZTM_FALSE_NORTHING) / scale
+    eta = (easting - _NZTM_FALSE_EASTING) / scale
+
+    xi_prime = xi.copy()
+    eta_prime = eta.copy()
+    for j, coefficient in enumerate(beta, start=1):
+        xi_prime -= coefficient * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+        eta_prime -= coefficient * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+
+    chi = np.arcsin(np.sin(xi_prime) / np.cosh(eta_prime))
+    phi = chi.copy()
+    for j, coefficient in enumerate(delta, start=1):
+        phi += coefficient * np.sin(2 * j * chi)
+    dlam = np.arctan2(np.sinh(eta_prime), np.cos(xi_prime))
+    return _NZTM_LON0 + np.degrees(dlam), np.degrees(phi)
+
+
+def _nzmg_forward(lon, lat):
+    """Project NZGD49 longitude/latitude in degrees to NZMG."""
+    a, _ = _INTERNATIONAL_1924
+    # Latitude differences are in units of 10^5 arc-seconds.
+    dphi = (lat - _NZMG_LAT0) * 3600e-5
+    dpsi = _polyval(_NZMG_TPSI, dphi)
+    z = dpsi + 1j * np.radians(lon - _NZMG_LON0)
+    zeta = _polyval(_NZMG_B, z)
+    return _NZMG_FALSE_EASTING + a * zeta.imag, _NZMG_FALSE_NORTHING + a * zeta.real
+
+
+def _nzmg_inverse(easting, northing):
+    """Unproject NZMG easting/northing to NZGD49 longitude/latitude."""
+    a, _ = _INTERNATIONAL_1924
+    zeta = (northing - _NZMG_FALSE_NORTHING) / a
+    zeta = zeta + 1j * (easting - _NZMG_FALSE_EASTING) / a
+
+    # Refine the series estimate with Newton-Raphson on the forward series.
+    powers = np.arange(1, len(_NZMG_B) + 1)
+    z = _polyval(_NZMG_C, zeta)
+    for _ in range(2):
+        derivative = np.zeros_like(z)
+        for coefficient in (_NZMG_B * powers)[::-1]:
+            derivative = derivative * z + coefficient
+        z = (zeta + _polyval(_NZMG_B * (powers - 1), z)) / derivative
+
+    dphi = _polyval(_NZMG_TPHI, z.real)
+    return _NZMG_LON0 + np.degrees(z.imag), _NZMG_LAT0 + dphi / 3600e-5
+
+
+def _to_cartesian(lon, lat, ellipsoid):
+    """Convert longitude/latitude at zero height to geocentric coordinates."""
+    a, f = ellipsoid
+    e2 = f * (2 - f)
+    lam, phi = np.radians(lon), np.radians(lat)
+    radius = a / np.sqrt(1 - e2 * np.sin(phi) ** 2)
+    return (
+        radius * np.cos(phi) * np.cos(lam),
+        radius * np.cos(phi) * np.sin(lam),
+        radius * (1 - e2) * np.sin(phi),
+    )
+
+
+def _from_cartesian(x, y, z, ellipsoid):
+    """Convert geocentric coordinates to longitude/latitude in degrees."""
+    a, f = ellipsoid
+    e2 = f * (2 - f)
+    p = np.hypot(x, y)
+    phi = np.arctan2(z, p * (1 - e2))
+    for _ in range(3):
+        radius = a / np.sqrt(1 - e2 * np.sin(phi) ** 2)
+        height = p / np.cos(phi) - radius
+        phi = np.arctan2(z, p * (1 - e2 * radius / (radius + height)))
+    return np.degrees(np.arctan2(y, x)), np.degrees(phi)
+
+
+def _helmert(x, y, z, sign: int):
+    """Apply the NZGD49 to NZGD2000 shift, or its inverse when sign is -1."""
+    tx, ty, tz = (sign * t for t in _NZGD49_SHIFT)
+    rx, ry, rz = (sign * np.radians(r / 3600) for r in _NZGD49_ROTATION)
+    scale = 1 + sign * _NZGD49_SCALE * 1e-6
+    return (
+        tx + scale * (x + rz * y - ry * z),
+        ty + scale * (-rz * x + y + rx * z),
+        tz + scale * (ry * x - rx * y + z),
+    )
+
+
+def _nzgd49_to_nzgd2000(lon, lat):
+    """Shift NZGD49 longitude/latitude to NZGD2000."""
+    cartesian = _to_cartesian(lon, lat, _INTERNATIONAL_1924)
+    return _from_cartesian(*_helmert(*cartesian, sign=1), _GRS80)
+
+
+def _nzgd2000_to_nzgd49(lon, lat):
+    """Shift NZGD2000 longitude/latitude to NZGD49."""
+    cartesian = _to_cartesian(lon, lat, _GRS80)
+    return _from_cartesian(*_helmert(*cartesian, sign=-1), _INTERNATIONAL_1924)
+
+
+def transform(x, y, from_crs: str, to_crs: str) -> tuple[np.ndarray, np.ndarray]:
+    """Transform coordinates between the EPSG codes supported by Hilltop.
+
+    Parameters
+    ----------
+    x : array-like
+        Eastings, or longitudes in degrees for geographic systems.
+    y : array-like
+        Northings, or latitudes in degrees for geographic systems.
+    from_crs : str
+        EPSG code of the input coordinates, e.g. "EPSG:2193".
+    to_crs : str
+        EPSG code of the output coordinates, e.g. "EPSG:4326".
+
+    Returns
+    -------
+    tuple of np.ndarray
+        The transformed x (easting or longitude) and y (northing or
+        latitude) arrays. NaN inputs give NaN outputs.
+
+    Raises
+    ------
+    HilltopRequestError
+        If either EPSG code is not supported.
+
+    Examples
+    --------
+    >>> lon, lat = transform([1748735.5], [5427916.5], "EPSG:2193", "EPSG:4326")
+    """
+    for crs in (from_crs, to_crs):
+        if crs not in SUPPORTED_CRS:
+            raise HilltopRequestError(
+                f"Unsupported EPSG code: '{crs}'. "
+                f"Valid codes are: {', '.join(SUPPORTED_CRS)}"
+            )
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if from_crs == to_crs or {from_crs, to_crs} <= set(GEOGRAPHIC_CRS):
+        return x.copy(), y.copy()
+
+    # Go through NZGD2000 longitude/latitude.
+    if from_crs == "EPSG:2193":
+        lon, lat = _nztm_inverse(x, y)
+    elif from_crs == "EPSG:27200":
+        lon, lat = _nzgd49_to_nzgd2000(*_nzmg_inverse(x, y))
+    else:
+        lon, lat = x, y
+
+    if to_crs == "EPSG:2193":
+        return _nztm_forward(lon, lat)
+    if to_crs == "EPSG:27200":
+        return _nzmg_forward(*_nzgd2000_to_nzgd49(lon, lat))
+    return lon, lat
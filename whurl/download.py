@@ -0,0 +1,460 @@
+"""Bulk downloads of many series, in resumable chunks.
+
+A download manifest lists site and measurement selections with the time
+window to fetch for each. A ``DownloadJob`` splits every series into
+chunks of a fixed length, fetches them concurrently and writes each chunk to
+its own CSV or Parquet file, partitioned by site and measurement. Finished
+chunks are recorded in a checkpoint file, so an interrupted job that is run
+again skips them. The ``whurl download`` command runs a job from the shell.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Literal
+from urllib.parse import quote
+
+import httpx
+import pandas as pd
+import yaml
+from pydantic import (BaseModel, Field, ValidationError, field_validator,
+                      model_validator)
+
+from whurl.client import HilltopClient
+from whurl.exceptions import HilltopConfigError, HilltopError
+
+# Format of the From and To parameters of each chunk's request.
+_REQUEST_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Format of chunk start and end times in file names and checkpoint keys.
+_KEY_FORMAT = "%Y%m%dT%H%M%S"
+
+
+class Selection(BaseModel):
+    """Series to download and the time window to download them for.
+
+    Every measurement is downloaded for every site.
+
+    Attributes
+    ----------
+    sites : list of str
+        Site names.
+    measurements : list of str
+        Measurement names.
+    from_datetime : datetime
+        Start of the window, inclusive.
+    to_datetime : datetime
+        End of the window, inclusive.
+    """
+
+    sites: list[str] = Field(min_length=1)
+    measurements: list[str] = Field(min_length=1)
+    from_datetime: datetime = Field(alias="from")
+    to_datetime: datetime = Field(alias="to")
+
+    @model_validator(mode="after")
+    def check_window(self) -> "Selection":
+        """Check that the window ends after it starts."""
+        if self.from_datetime >= self.to_datetime:
+            raise ValueError("from must be before to")
+        return self
+
+
+class DownloadManifest(BaseModel):
+    """What a bulk download fetches and where it writes it.
+
+    Attributes
+    ----------
+    selections : list of Selection
+        The series and time windows to download.
+    base_url : str, optional
+        Base URL of the Hilltop server. Defaults to the HILLTOP_BASE_URL
+        environment variable.
+    hts_endpoint : str, optional
+        HTS endpoint to query. Defaults to the HILLTOP_HTS_ENDPOINT
+        environment variable.
+    output : str, default "."
+        Directory the chunk files are written to.
+    format : {"csv", "parquet"}, default "csv"
+        File format of the chunks. Parquet needs pyarrow or fastparquet.
+    chunk : str, default "30D"
+        Length of each chunk, as a pandas timedelta string such as "7D" or
+        "12h".
+    max_workers : int, default 8
+        Maximum number of chunks fetched at once.
+    """
+
+    selections: list[Selection] = Field(min_length=1)
+    base_url: str | None = None
+    hts_endpoint: str | None = None
+    output: str = "."
+    format: Literal["csv", "parquet"] = "csv"
+    chunk: str = "30D"
+    max_workers: int = Field(default=8, ge=1)
+
+    @field_validator("chunk")
+    def validate_chunk(cls, value: str) -> str:
+        """Check that the chunk length is a positive timedelta."""
+        if pd.Timedelta(value) <= pd.Timedelta(0):
+            raise ValueError("chunk must be a positive length of time")
+        return value
+
+    @classmethod
+    def load(cls, path: str | Path) -> DownloadManifest:
+        """Read a manifest from a YAML or JSON file.
+
+        Parameters
+        ----------
+        path : str or Path
+            The manifest file. Files ending in ".json" are read as JSON,
+            anything else as YAML.
+
+        Returns
+        -------
+        DownloadManifest
+            The validated manifest.
+
+        Raises
+        ------
+        HilltopConfigError
+            If the file cannot be read or is not a valid manifest.
+        """
+        path = Path(path)
+        try:
+            text = path.read_text(encoding="utf-8")
+            data = json.loads(text) if path.suffix == ".json" else yaml.safe_load(text)
+            return cls.model_validate(data)
+        except (OSError, ValueError, yaml.YAMLError, ValidationError) as e:
+            raise HilltopConfigError(f"Invalid download manifest {path}: {e}") from e
+
+
+class Chunk:
+    """One request's worth of one series.
+
+    Attributes
+    ----------
+    site : str
+        Site name.
+    measurement : str
+        Measurement name.
+    start : datetime
+        Start of the chunk, inclusive.
+    end : datetime
+        End of the chunk. It is exclusive, except for the last chunk of a
+        window, whose end is the end of the window.
+    last : bool
+        Whether this is the last chunk of its window.
+    """
+
+    def __init__(
+        self, site: str, measurement: str, start: datetime, end: datetime, last: bool
+    ):
+        self.site = site
+        self.measurement = measurement
+        self.start = start
+        self.end = end
+        self.last = last
+
+    def __repr__(self) -> str:
+        """Return a short description of the chunk."""
+        return f"Chunk({self.key!r})"
+
+    @property
+    def key(self) -> str:
+        """Identify the chunk in the checkpoint file."""
+        return (
+            f"{self.site}|{self.measurement}|"
+            f"{self.start:{_KEY_FORMAT}}|{self.end:{_KEY_FORMAT}}"
+        )
+
+    def path(self, output: Path, fmt: str) -> Path:
+        """Get the file the chunk is written to.
+
+        Files are partitioned as ``site=<site>/measurement=<measurement>``,
+        with names percent-encoded.
+        """
+        return (
+            output
+            / f"site={quote(self.site, safe='')}"
+            / f"measurement={quote(self.measurement, safe='')}"
+            / f"{self.start:{_KEY_FORMAT}}_{self.end:{_KEY_FORMAT}}.{fmt}"
+        )
+
+
+def plan_chunks(manifest: DownloadManifest) -> list[Chunk]:
+    """Split every selected series into chunks.
+
+    Parameters
+    ----------
+    manifest : DownloadManifest
+        The manifest to plan.
+
+    Returns
+    -------
+    list of Chunk
+        The chunks, series by series and oldest first. A chunk selected
+        more than once is listed once.
+    """
+    length = pd.Timedelta(manifest.chunk).to_pytimedelta()
+    chunks = {}
+    for selection in manifest.selections:
+        bounds = _chunk_bounds(selection.from_datetime, selection.to_datetime, length)
+        for site in selection.sites:
+            for measurement in selection.measurements:
+                for start, end in bounds:
+                    chunk = Chunk(
+                        site, measurement, start, end, end == selection.to_datetime
+                    )
+                    chunks.setdefault(chunk.key, chunk)
+    return list(chunks.values())
+
+
+def _chunk_bounds(
+    start: datetime, end: datetime, length: timedelta
+) -> list[tuple[datetime, datetime]]:
+    """Split a window into consecutive (start, end) pairs of a fixed length."""
+    bounds = []
+    while start < end:
+        bounds.append((start, min(start + length, end)))
+        start += length
+    return bounds
+
+
+class Checkpoint:
+    """The chunks of a job that have been written, kept in a file.
+
+    Each finished chunk is appended to the file as one JSON line, so a job
+    that is interrupted loses at most the line being written. A chunk that
+    ends in the future is never finished, as data may still arrive for it,
+    so ``DownloadJob`` writes it without recording it here.
+
+    Parameters
+    ----------
+    path : str or Path
+        The checkpoint file. It is created if it does not exist.
+
+    Attributes
+    ----------
+    done : dict of str to int
+        Number of rows written for each finished chunk, keyed by
+        ``Chunk.key``.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.done = {}
+        if self.path.exists():
+            for line in self.path.read_text(encoding="utf-8").splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # The last line of an interrupted job may be incomplete.
+                    continue
+                self.done[entry["chunk"]] = entry["rows"]
+
+    def record(self, chunk: Chunk, rows: int) -> None:
+        """Mark a chunk as written.
+
+        Parameters
+        ----------
+        chunk : Chunk
+            The chunk.
+        rows : int
+            Number of rows written.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({"chunk": chunk.key, "rows": rows}) + "\n")
+        self.done[chunk.key] = rows
+
+
+class DownloadJob:
+    """Fetch the chunks of a manifest concurrently and write them to files.
+
+    Parameters
+    ----------
+    manifest : DownloadManifest
+        What to download.
+    checkpoint : str or Path, optional
+        The checkpoint file. Defaults to "checkpoint.jsonl" in the output
+        directory.
+
+    Raises
+    ------
+    HilltopConfigError
+        If Parquet output is asked for and neither pyarrow nor fastparquet
+        is installed.
+
+    Examples
+    --------
+    >>> job = DownloadJob(DownloadManifest.load("flows.yaml"))
+    >>> summary = job.run(report=print)
+    """
+
+    def __init__(
+        self, manifest: DownloadManifest, checkpoint: str | Path | None = None
+    ):
+        if manifest.format == "parquet" and not any(
+            importlib.util.find_spec(name) for name in ("pyarrow", "fastparquet")
+        ):
+            raise HilltopConfigError(
+                "Parquet output needs pyarrow or fastparquet to be installed."
+            )
+        self.manifest = manifest
+        self.output = Path(manifest.output)
+        self.checkpoint = Checkpoint(
+            checkpoint if checkpoint is not None else self.output / "checkpoint.jsonl"
+        )
+
+    def _fetch(self, client: HilltopClient, chunk: Chunk) -> int:
+        """Fetch one chunk, write it and return the number of rows written."""
+        response = client.get_data(
+            site=chunk.site,
+            measurement=chunk.measurement,
+            from_datetime=chunk.start.strftime(_REQUEST_FORMAT),
+            to_datetime=chunk.end.strftime(_REQUEST_FORMAT),
+        )
+        frame = response.to_dataframe()
+        if not chunk.last and frame.index.name == "DateTime":
+            # To is inclusive, and the next chunk starts at this one's end.
+            frame = frame[frame.index < pd.Timestamp(chunk.end)]
+        if frame.empty:
+            return 0
+
+        path = chunk.path(self.output, self.manifest.format)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(path.name + ".partial")
+        if self.manifest.format == "parquet":
+            frame.to_parquet(partial)
+        else:
+            frame.to_csv(partial)
+        os.replace(partial, path)
+        return len(frame)
+
+    def _record(self, chunk: Chunk, rows: int) -> None:
+        """Checkpoint a written chunk, unless it ends in the future."""
+        if chunk.end <= datetime.now():
+            self.checkpoint.record(chunk, rows)
+
+    def run(
+        self,
+        client: HilltopClient | None = None,
+        report: Callable[[str], object] | None = None,
+    ) -> dict:
+        """Download every chunk not already in the checkpoint.
+
+        A chunk that fails is reported and left out of the checkpoint, so it
+        is retried when the job is run again, and so is a chunk that ends in
+        the future. If the run is interrupted,
+        e.g. with Ctrl-C, chunks not yet started are cancelled and those
+        already written are checkpointed before the exception is raised.
+
+        Parameters
+        ----------
+        client : HilltopClient, optional
+            The client to fetch with. By default one is created from the
+            manifest's server settings and closed at the end.
+        report : callable, optional
+            Called with a line of progress after each chunk.
+
+        Returns
+        -------
+        dict
+            "chunks" planned, "skipped" because the checkpoint had them,
+            "downloaded", "failed", "rows" written, "bytes" received,
+            "seconds" taken, and "errors", a list of (chunk key, message)
+            pairs.
+        """
+        chunks = plan_chunks(self.manifest)
+        pending = [c for c in chunks if c.key not in self.checkpoint.done]
+        own_client = client is None
+        if own_client:
+            client = HilltopClient(
+                base_url=self.manifest.base_url,
+                hts_endpoint=self.manifest.hts_endpoint,
+                max_connections=self.manifest.max_workers,
+            )
+        summary = {
+            "chunks": len(chunks),
+            "skipped": len(chunks) - len(pending),
+            "downloaded": 0,
+            "failed": 0,
+            "rows": 0,
+            "bytes": 0,
+            "seconds": 0.0,
+            "errors": [],
+        }
+        bytes_before = client.stats()["bytes_received"]
+        start = time.perf_counter()
+        pool = ThreadPoolExecutor(max_workers=self.manifest.max_workers)
+        futures = {pool.submit(self._fetch, client, chunk): chunk for chunk in pending}
+        try:
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    rows = future.result()
+                except (HilltopError, httpx.HTTPError, OSError) as e:
+                    summary["failed"] += 1
+                    summary["errors"].append((chunk.key, str(e)))
+                    status = f"failed: {e}"
+                else:
+                    self._record(chunk, rows)
+                    summary["downloaded"] += 1
+                    summary["rows"] += rows
+                    status = f"{rows} rows"
+                summary["seconds"] = time.perf_counter() - start
+                summary["bytes"] = client.stats()["bytes_received"] - bytes_before
+                if report is not None:
+                    done = summary["downloaded"] + summary["failed"]
+                    report(
+                        f"[{done}/{len(pending)}] {chunk.site} / "
+                        f"{chunk.measurement} {chunk.start:%Y-%m-%d} to "
+                        f"{chunk.end:%Y-%m-%d}: {status} "
+                        f"({throughput(summary)})"
+                    )
+        except BaseException:
+            # E.g. Ctrl-C: drop the chunks not started yet, let the running
+            # ones finish, and checkpoint every chunk that was written so a
+            # rerun does not fetch it again.
+            pool.shutdown(wait=True, cancel_futures=True)
+            for future, chunk in futures.items():
+                if (
+                    chunk.key not in self.checkpoint.done
+                    and not future.cancelled()
+                    and future.exception() is None
+                ):
+                    self._record(chunk, future.result())
+            raise
+        finally:
+            pool.shutdown()
+            if own_client:
+                client.close()
+        return summary
+
+
+def throughput(summary: dict) -> str:
+    """Describe the rates of a download summary.
+
+    Parameters
+    ----------
+    summary : dict
+        A summary as returned by ``DownloadJob.run``.
+
+    Returns
+    -------
+    str
+        Chunks, rows and megabytes per second.
+    """
+    seconds = max(summary["seconds"], 1e-9)
+    done = summary["downloaded"] + summary["failed"]
+    return (
+        f"{done / seconds:.1f} chunks/s, {summary['rows'] / seconds:,.0f} rows/s, "
+        f"{summary['bytes'] / seconds / 1e6:.2f} MB/s"
+    )
@@ -0,0 +1,195 @@
+"""Downsampling of long series for plotting.
+
+Plotting years of 5-minute data sends millions of points to a browser that
+can only draw a few thousand. ``downsample`` cuts a series to a target
+number of points while keeping its visual shape:
+
+- "lttb", Largest-Triangle-Three-Buckets, picks from each bucket the point
+  forming the largest triangle with the previous pick and the next bucket's
+  mean, which keeps peaks and the overall shape.
+- "min_max" keeps the minimum and maximum of each bucket, so every peak and
+  trough survives.
+
+Buckets hold equal numbers of points. ``GetDataResponse.downsample`` applies
+``downsample`` to each measurement of a response.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+from whurl.exceptions import HilltopRequestError
+
+# Downsampling algorithms and the fewest points each can return.
+METHODS = {"lttb": 3, "min_max": 2}
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n: int) -> np.ndarray:
+    """Pick points with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept. The others are split into
+    ``n - 2`` buckets, and one point is picked from each. Bucket means and
+    triangle areas are computed with NumPy; only the walk from bucket to
+    bucket, where each pick depends on the previous one, is a Python loop.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Increasing x values, e.g. times as numbers.
+    y : np.ndarray
+        The y values, without NaN.
+    n : int
+        Number of points to keep, at least 3.
+
+    Returns
+    -------
+    np.ndarray
+        Positions of the kept points, in increasing order.
+    """
+    size = len(x)
+    if n >= size:
+        return np.arange(size)
+    x = np.asarray(x, dtype=float) - x[0]
+    y = np.asarray(y, dtype=float)
+
+    # n - 1 edges split the points between the first and last into n - 2
+    # buckets of at least one point each.
+    edges = np.linspace(1, size - 1, n - 1).astype(np.int64)
+    counts = np.diff(edges)
+    means_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    means_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    # Each bucket looks ahead to the next bucket's mean, the last to the
+    # last point.
+    next_x = np.append(means_x[1:], x[-1])
+    next_y = np.append(means_y[1:], y[-1])
+
+    picked = np.empty(n, dtype=np.int64)
+    picked[0], picked[-1] = 0, size - 1
+    previous = 0
+    for bucket in range(n - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        px, py = x[previous], y[previous]
+        areas = np.abs(
+            (px - next_x[bucket]) * (y[lo:hi] - py)
+            - (px - x[lo:hi]) * (next_y[bucket] - py)
+        )
+        previous = lo + int(np.argmax(areas))
+        picked[bucket + 1] = previous
+    return picked
+
+
+def min_max(y: np.ndarray, n: int) -> np.ndarray:
+    """Pick the minimum and maximum of each bucket.
+
+    The points are split into ``n // 2`` buckets of equal size, which are
+    reduced at once as the rows of a 2-D array.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        The values, without NaN.
+    n : int
+        Most points to keep, at least 2.
+
+    Returns
+    -------
+    np.ndarray
+        Positions of the kept points, in increasing order. A bucket whose
+        minimum and maximum are the same point contributes it once.
+    """
+    size = len(y)
+    if n >= size:
+        return np.arange(size)
+    width = -(-size // (n // 2))
+    buckets = -(-size // width)
+    blocks = np.full(buckets * width, np.nan)
+    blocks[:size] = y
+    blocks = blocks.reshape(buckets, width)
+    offsets = np.arange(buckets) * width
+    return np.unique(
+        np.concatenate(
+            [
+                offsets + np.nanargmin(blocks, axis=1),
+                offsets + np.nanargmax(blocks, axis=1),
+            ]
+        )
+    )
+
+
+def downsample(
+    frame: pd.DataFrame,
+    n: int,
+    method: str = "lttb",
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """Cut a series to about ``n`` points per column for plotting.
+
+    Each column picks its own points, ignoring its missing values. The
+    result holds the rows picked by any column, with every column's values,
+    so it has at most ``n`` rows per column.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        Values indexed by DateTime, as in ``GetDataResponse`` timeseries.
+    n : int
+        Number of points to keep per column.
+    method : {"lttb", "min_max"}, default "lttb"
+        The downsampling algorithm. See the module docstring.
+    columns : sequence of str, optional
+        Columns to pick points by. Defaults to every numeric column.
+
+    Returns
+    -------
+    pd.DataFrame
+        The picked rows, in time order. The frame is returned unchanged if
+        it has no more than ``n`` rows.
+
+    Raises
+    ------
+    HilltopRequestError
+        If the method is unknown, ``n`` is too small for it, a column is
+        missing, or the frame is not indexed by DateTime.
+
+    Examples
+    --------
+    >>> display = downsample(raw, 2000)
+    >>> envelope = downsample(raw, 2000, method="min_max", columns=["Flow"])
+    """
+    if method not in METHODS:
+        raise HilltopRequestError(
+            f"Unknown downsampling method '{method}'. "
+            f"Use one of: {', '.join(METHODS)}."
+        )
+    if n < METHODS[method]:
+        raise HilltopRequestError(
+            f"The '{method}' method needs n of at least {METHODS[method]}."
+        )
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        raise HilltopRequestError("Only series indexed by DateTime can be downsampled.")
+    if columns is None:
+        columns = list(frame.select_dtypes("number").columns)
+    missing = [column for column in columns if column not in frame.columns]
+    if missing:
+        raise HilltopRequestError(f"Unknown columns: {', '.join(map(str, missing))}.")
+    if len(frame) <= n:
+        return frame
+
+    if not frame.index.is_monotonic_increasing:
+        frame = frame.sort_index(kind="stable")
+    times = frame.index.asi8
+    picked = []
+    for column in columns:
+        values = frame[column].to_numpy(dtype=float)
+        positions = np.flatnonzero(~np.isnan(values))
+        if method == "lttb":
+            chosen = lttb(times[positions], values[positions], n)
+        else:
+            chosen = min_max(values[positions], n)
+        picked.append(positions[chosen])
+    if not picked:
+        return frame.iloc[:0]
+    return frame.iloc[np.unique(np.concatenate(picked))]
@@ -0,0 +1,265 @@
+"""Load balancing and failover across Hilltop mirrors.
+
+Mirrored Hilltop servers serve the same HTS files, so any request can go to
+any of them. An ``EndpointPool`` chooses a server for each request, tracks
+how each one is doing, and takes a server out of rotation for a while after
+it fails. Both clients build one when given a list of base URLs.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Sequence
+
+from whurl.exceptions import HilltopConfigError
+
+# How an EndpointPool chooses between healthy endpoints.
+STRATEGIES = ("round_robin", "least_outstanding", "latency_weighted")
+
+
+class Endpoint:
+    """Load and health of one server in an ``EndpointPool``.
+
+    Parameters
+    ----------
+    url : str
+        Base URL of the server.
+
+    Attributes
+    ----------
+    url : str
+        Base URL of the server.
+    outstanding : int
+        Requests sent to the server and not yet answered.
+    requests : int
+        Requests sent to the server.
+    failures : int
+        Requests the server failed to answer, or answered with a 5xx status.
+    latency : float or None
+        Moving average of the server's response times in seconds, or None
+        before its first response.
+    down_until : float
+        ``time.monotonic()`` time until which the server is skipped, after a
+        failure.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.latency = None
+        self.down_until = 0.0
+
+    def __repr__(self) -> str:
+        """Return a short description of the endpoint."""
+        return f"Endpoint({self.url!r})"
+
+
+class EndpointPool:
+    """Choose between mirrored Hilltop servers, with failover.
+
+    Requests go to healthy endpoints only, chosen by ``strategy``:
+
+    - "round_robin" takes healthy endpoints in turn.
+    - "least_outstanding" takes the endpoint with the fewest requests in
+      flight.
+    - "latency_weighted" picks at random, weighting each endpoint by the
+      inverse of its average response time. Endpoints without a response
+      yet are weighted like the fastest one, so they get tried.
+
+    An endpoint that fails is skipped for ``cooldown`` seconds and is then
+    tried again. A success marks it healthy straight away. When every
+    endpoint is down, the one that comes back soonest is used.
+
+    The pool is shared by all threads or tasks using a client, and guards its
+    state with its own lock.
+
+    Parameters
+    ----------
+    urls : sequence of str
+        Base URLs of the mirrors. The first one is the primary, used to
+        build request URLs.
+    strategy : str, default "round_robin"
+        One of ``STRATEGIES``.
+    cooldown : float, default 30.0
+        Seconds an endpoint is skipped after it fails.
+    smoothing : float, default 0.2
+        Weight of the newest response time in each endpoint's moving
+        average latency.
+
+    Raises
+    ------
+    HilltopConfigError
+        If no URLs are given, or an option is invalid.
+
+    Examples
+    --------
+    >>> pool = EndpointPool(
+    ...     ["https://hilltop.example.com", "https://replica.example.com"],
+    ...     strategy="least_outstanding",
+    ... )
+    >>> endpoint = pool.acquire()
+    >>> pool.release(endpoint, latency=0.2)
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        strategy: str = "round_robin",
+        cooldown: float = 30.0,
+        smoothing: float = 0.2,
+    ):
+        if isinstance(urls, str) or not urls:
+            raise HilltopConfigError("EndpointPool needs a list of base URLs.")
+        if len(set(urls)) != len(urls):
+            raise HilltopConfigError("Endpoint base URLs must be unique.")
+        if strategy not in STRATEGIES:
+            raise HilltopConfigError(
+                f"Unknown endpoint strategy '{strategy}'. "
+                f"Use one of: {', '.join(STRATEGIES)}."
+            )
+        if cooldown < 0 or not 0 < smoothing <= 1:
+            raise HilltopConfigError(
+                "cooldown must be at least 0 and smoothing in (0, 1]."
+            )
+
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._turn = 0
+        self._random = random.Random()
+
+    def __len__(self) -> int:
+        """Return the number of endpoints."""
+        return len(self.endpoints)
+
+    @property
+    def primary(self) -> str:
+        """The base URL request URLs are built with."""
+        return self.endpoints[0].url
+
+    def url_for(self, url: str, endpoint: Endpoint) -> str:
+        """Point a request URL built for the primary at another endpoint.
+
+        Parameters
+        ----------
+        url : str
+            Request URL starting with the primary base URL.
+        endpoint : Endpoint
+            The endpoint to send the request to.
+
+        Returns
+        -------
+        str
+            The URL with its base replaced, or ``url`` unchanged if it does
+            not start with the primary base URL.
+        """
+        if not url.startswith(self.primary):
+            return url
+        return endpoint.url + url[len(self.primary) :]
+
+    def acquire(self, exclude: Sequence[Endpoint] = ()) -> Endpoint:
+        """Choose an endpoint for a request and count it as outstanding.
+
+        Parameters
+        ----------
+        exclude : sequence of Endpoint, optional
+            Endpoints already tried for this request.
+
+        Returns
+        -------
+        Endpoint
+            The chosen endpoint. Pass it to ``release`` once the request
+            has finished.
+
+        Raises
+        ------
+        HilltopConfigError
+            If every endpoint is excluded.
+        """
+        with self._lock:
+            candidates = [e for e in self.endpoints if e not in exclude]
+            if not candidates:
+                raise HilltopConfigError("Every endpoint has already been tried.")
+            now = time.monotonic()
+            healthy = [e for e in candidates if e.down_until <= now]
+            if healthy:
+                endpoint = self._choose(healthy)
+            else:
+                endpoint = min(candidates, key=lambda e: e.down_until)
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def _choose(self, healthy: list[Endpoint]) -> Endpoint:
+        """Pick one of the healthy endpoints by the pool's strategy."""
+        turn = self._turn % len(healthy)
+        self._turn += 1
+        # Rotate so ties go to each endpoint in turn.
+        rotated = healthy[turn:] + healthy[:turn]
+        if self.strategy == "round_robin":
+            return rotated[0]
+        if self.strategy == "least_outstanding":
+            return min(rotated, key=lambda e: e.outstanding)
+
+        known = [e.latency for e in healthy if e.latency is not None]
+        fastest = min(known, default=1.0)
+        weights = [
+            1 / max(e.latency if e.latency is not None else fastest, 1e-6)
+            for e in healthy
+        ]
+        return self._random.choices(healthy, weights)[0]
+
+    def release(
+        self, endpoint: Endpoint, latency: float | None = None, failed: bool = False
+    ) -> None:
+        """Record how a request to an endpoint ended.
+
+        Parameters
+        ----------
+        endpoint : Endpoint
+            The endpoint returned by ``acquire``.
+        latency : float, optional
+            Response time in seconds of a successful request. Omit it for
+            a request that was abandoned, e.g. cancelled.
+        failed : bool, default False
+            Whether the endpoint failed the request, which takes it out of
+            rotation for ``cooldown`` seconds.
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            if failed:
+                endpoint.failures += 1
+                endpoint.down_until = time.monotonic() + self.cooldown
+            elif latency is not None:
+                endpoint.down_until = 0.0
+                if endpoint.latency is None:
+                    endpoint.latency = latency
+                else:
+                    endpoint.latency += self.smoothing * (latency - endpoint.latency)
+
+    def stats(self) -> dict[str, dict]:
+        """Return the load and health of each endpoint.
+
+        Returns
+        -------
+        dict
+            For each base URL, its "outstanding", "requests" and "failures"
+            counts, its moving average "latency", and whether it is
+            "healthy".
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                e.url: {
+                    "outstanding": e.outstanding,
+                    "requests": e.requests,
+                    "failures": e.failures,
+                    "latency": e.latency,
+                    "healthy": e.down_until <= now,
+                }
+                for e in self.endpoints
+            }
@@ -0,0 +1,325 @@
+"""Query several HTS files on one Hilltop server as one archive.
+
+Agencies often split their data across HTS files, e.g. recent telemetry in
+one file and the quality-coded archive in another. The federated clients
+send each request to every file at once and merge the responses, so the
+files can be queried as if they were one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+import httpx
+
+from whurl.client import AsyncHilltopClient, HilltopClient
+from whurl.exceptions import HilltopConfigError, HilltopResponseError
+from whurl.schemas import responses
+from whurl.schemas.requests import (GetDataRequest, MeasurementListRequest,
+                                    SiteListRequest)
+from whurl.schemas.requests.base import BaseHilltopRequest
+
+if TYPE_CHECKING:
+    from whurl.schemas.responses import (GetDataResponse,
+                                         MeasurementListResponse,
+                                         SiteListResponse)
+
+# How GetData values found in more than one file can be de-duplicated.
+_OVERLAPS = ("timestamp", "range")
+
+
+def _check_endpoints(hts_endpoints: Sequence[str], overlap: str) -> list[str]:
+    """Validate the options of a federated client.
+
+    Returns
+    -------
+    list of str
+        The HTS endpoints, in order of precedence.
+
+    Raises
+    ------
+    HilltopConfigError
+        If no endpoints or duplicate endpoints are given, or ``overlap`` is
+        not known.
+    """
+    if isinstance(hts_endpoints, str) or not hts_endpoints:
+        raise HilltopConfigError("A federated client needs a list of HTS endpoints.")
+    if len(set(hts_endpoints)) != len(hts_endpoints):
+        raise HilltopConfigError("HTS endpoints must be unique.")
+    if overlap not in _OVERLAPS:
+        raise HilltopConfigError(
+            f"Unknown overlap '{overlap}'. Use one of: {', '.join(_OVERLAPS)}."
+        )
+    return list(hts_endpoints)
+
+
+def _merge_results(results: list, merge: Callable):
+    """Merge the responses from each endpoint.
+
+    An endpoint answering with a Hilltop error, e.g. because it does not
+    hold the requested site, is left out. Any other error, including an
+    HTTP error status from an endpoint that is down, is raised.
+
+    Parameters
+    ----------
+    results : list
+        The response, or exception, from each endpoint in order of
+        precedence.
+    merge : callable
+        The ``merge`` classmethod of the response model.
+
+    Returns
+    -------
+    BaseModel
+        The merged response.
+
+    Raises
+    ------
+    HilltopResponseError
+        If an endpoint answered with an HTTP error status, or every
+        endpoint answered with a Hilltop error.
+    """
+    found = []
+    for result in results:
+        if not isinstance(result, BaseException):
+            found.append(result)
+        elif not isinstance(result, HilltopResponseError) or isinstance(
+            result.__cause__, httpx.HTTPStatusError
+        ):
+            raise result
+    if not found:
+        raise results[0]
+    return merge(found)
+
+
+class FederatedClient:
+    """Query several HTS endpoints on one server as one logical archive.
+
+    Each ``get_*`` call sends the request to every endpoint in parallel and
+    merges the responses. Where endpoints hold the same data, the one listed
+    first in ``hts_endpoints`` takes precedence. Endpoints that answer with a
+    Hilltop error, e.g. because they do not hold the site, are left out.
+
+    Parameters
+    ----------
+    hts_endpoints : sequence of str
+        HTS endpoints to query, in order of precedence, highest first.
+    overlap : {"timestamp", "range"}, default "timestamp"
+        How GetData values found in more than one endpoint are
+        de-duplicated. See ``GetDataResponse.merge``.
+    base_url : str or sequence of str, optional
+        Base URL for the Hilltop server, as for ``HilltopClient``.
+    **client_options
+        Other options for the underlying ``HilltopClient``, such as
+        ``timeout`` or ``max_connections``.
+
+    Attributes
+    ----------
+    client : HilltopClient
+        The client sending the requests. It is shared by every endpoint.
+
+    Raises
+    ------
+    HilltopConfigError
+        If the endpoints or options are invalid.
+
+    Examples
+    --------
+    >>> with FederatedClient(["data.hts", "telemetry.hts", "archive.hts"]) as fed:
+    ...     flow = fed.get_data(site="River at Bridge", measurement="Flow")
+    """
+
+    def __init__(
+        self,
+        hts_endpoints: Sequence[str],
+        overlap: str = "timestamp",
+        base_url: str | Sequence[str] | None = None,
+        **client_options,
+    ):
+        self.hts_endpoints = _check_endpoints(hts_endpoints, overlap)
+        self.overlap = overlap
+        self.client = HilltopClient(
+            base_url=base_url, hts_endpoint=self.hts_endpoints[0], **client_options
+        )
+
+    def _fetch_all(self, request_cls: type[BaseHilltopRequest], **kwargs) -> list:
+        """Send a request to every endpoint in parallel.
+
+        Returns
+        -------
+        list
+            The response, or exception, from each endpoint in order.
+        """
+        requests = [
+            request_cls(
+                base_url=str(self.client.base_url), hts_endpoint=endpoint, **kwargs
+            )
+            for endpoint in self.hts_endpoints
+        ]
+        return self.client.map(self.client.fetch, [{"request": r} for r in requests])
+
+    def get_data(self, **kwargs) -> GetDataResponse:
+        """Fetch measurement data from every endpoint and merge it.
+
+        Parameters
+        ----------
+        **kwargs
+            Request parameters passed to GetDataRequest.
+
+        Returns
+        -------
+        GetDataResponse
+            Every measurement found, with overlapping values de-duplicated.
+
+        Raises
+        ------
+        HilltopResponseError
+            If every endpoint answered with an error.
+        """
+        results = self._fetch_all(GetDataRequest, **kwargs)
+        return _merge_results(
+            results,
+            lambda found: responses.GetDataResponse.merge(found, self.overlap),
+        )
+
+    def get_measurement_list(self, **kwargs) -> MeasurementListResponse:
+        """Fetch the measurement lists of every endpoint and merge them.
+
+        Parameters
+        ----------
+        **kwargs
+            Request parameters passed to MeasurementListRequest.
+
+        Returns
+        -------
+        MeasurementListResponse
+            Every data source and measurement found, each listed once.
+
+        Raises
+        ------
+        HilltopResponseError
+            If every endpoint answered with an error.
+        """
+        results = self._fetch_all(MeasurementListRequest, **kwargs)
+        return _merge_results(results, responses.MeasurementListResponse.merge)
+
+    def get_site_list(self, **kwargs) -> SiteListResponse:
+        """Fetch the site lists of every endpoint and merge them.
+
+        Parameters
+        ----------
+        **kwargs
+            Request parameters passed to SiteListRequest.
+
+        Returns
+        -------
+        SiteListResponse
+            Every site found, each listed once.
+
+        Raises
+        ------
+        HilltopResponseError
+            If every endpoint answered with an error.
+        """
+        results = self._fetch_all(SiteListRequest, **kwargs)
+        return _merge_results(results, responses.SiteListResponse.merge)
+
+    def close(self):
+        """Close the underlying client."""
+        self.client.close()
+
+    def __enter__(self):
+        """Enter the runtime context for use with 'with' statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the runtime context and close the client."""
+        self.close()
+
+
+class AsyncFederatedClient:
+    """Query several HTS endpoints on one server as one logical archive.
+
+    The asynchronous counterpart of ``FederatedClient``, built on
+    ``AsyncHilltopClient``. See ``FederatedClient`` for the parameters.
+
+    Examples
+    --------
+    >>> async with AsyncFederatedClient(["data.hts", "archive.hts"]) as fed:
+    ...     flow = await fed.get_data(site="River at Bridge", measurement="Flow")
+    """
+
+    def __init__(
+        self,
+        hts_endpoints: Sequence[str],
+        overlap: str = "timestamp",
+        base_url: str | Sequence[str] | None = None,
+        **client_options,
+    ):
+        self.hts_endpoints = _check_endpoints(hts_endpoints, overlap)
+        self.overlap = overlap
+        self.client = AsyncHilltopClient(
+            base_url=base_url, hts_endpoint=self.hts_endpoints[0], **client_options
+        )
+
+    async def _fetch_all(
+        self, request_cls: type[BaseHilltopRequest], **kwargs
+    ) -> list:
+        """Send a request to every endpoint concurrently.
+
+        Returns
+        -------
+        list
+            The response, or exception, from each endpoint in order.
+        """
+        requests = [
+            request_cls(
+                base_url=str(self.client.base_url), hts_endpoint=endpoint, **kwargs
+            )
+            for endpoint in self.hts_endpoints
+        ]
+        return await asyncio.gather(
+            *(self.client.fetch(request) for request in requests),
+            return_exceptions=True,
+        )
+
+    async def get_data(self, **kwargs) -> GetDataResponse:
+        """Fetch measurement data from every endpoint and merge it.
+
+        See ``FederatedClient.get_data``.
+        """
+        results = await self._fetch_all(GetDataRequest, **kwargs)
+        return _merge_results(
+            results,
+            lambda found: responses.GetDataResponse.merge(found, self.overlap),
+        )
+
+    async def get_measurement_list(self, **kwargs) -> MeasurementListResponse:
+        """Fetch the measurement lists of every endpoint and merge them.
+
+        See ``FederatedClient.get_measurement_list``.
+        """
+        results = await self._fetch_all(MeasurementListRequest, **kwargs)
+        return _merge_results(results, responses.MeasurementListResponse.merge)
+
+    async def get_site_list(self, **kwargs) -> SiteListResponse:
+        """Fetch the site lists of every endpoint and merge them.
+
+        See ``FederatedClient.get_site_list``.
+        """
+        results = await self._fetch_all(SiteListRequest, **kwargs)
+        return _merge_results(results, responses.SiteListResponse.merge)
+
+    async def close(self):
+        """Close the underlying client."""
+        await self.client.close()
+
+    async def __aenter__(self):
+        """Enter the async runtime context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Exit the async runtime context and close the client."""
+        await self.close()
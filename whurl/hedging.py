@@ -0,0 +1,169 @@
+"""Hedged requests for cutting tail latency.
+
+A hedged request is sent a second time when the first copy has not been
+answered within a delay taken from recent response times, and whichever copy
+answers first is used. When one worker behind a load balancer stalls, the
+second copy usually lands on a healthy worker. ``HilltopClient`` and
+``AsyncHilltopClient`` hedge requests when given a ``HedgePolicy``.
+"""
+
+import threading
+from collections import deque
+
+from whurl.exceptions import HilltopConfigError
+from whurl.schemas.requests import (CollectionListRequest, SiteListRequest,
+                                    StatusRequest, TimeRangeRequest)
+from whurl.schemas.requests.base import BaseHilltopRequest
+
+# Small requests that are cheap to send twice. All Hilltop requests are
+# idempotent GETs, but GetData and SiteInfo responses can be large.
+DEFAULT_HEDGED_REQUESTS = (
+    CollectionListRequest,
+    SiteListRequest,
+    StatusRequest,
+    TimeRangeRequest,
+)
+
+
+class HedgePolicy:
+    """Decide when a slow request is sent a second time.
+
+    The hedge delay is a percentile of the most recent response times, so
+    only requests slower than nearly all recent ones are hedged. Each
+    request is hedged at most once, and ``budget`` caps the fraction of
+    requests that are hedged, so hedging never more than doubles the load.
+
+    The policy is shared by all threads or tasks using a client, and guards
+    its state with its own lock.
+
+    Parameters
+    ----------
+    percentile : float, default 95
+        Percentile of recent response times to wait before hedging.
+    min_delay : float, default 0.01
+        Shortest delay in seconds before hedging.
+    max_delay : float, default 5.0
+        Longest delay in seconds before hedging.
+    initial_delay : float, default 1.0
+        Delay in seconds used until ``min_samples`` response times have
+        been recorded.
+    window : int, default 200
+        Number of recent response times the percentile is taken from.
+    min_samples : int, default 20
+        Number of response times needed before the percentile is used.
+    budget : float, default 0.1
+        Maximum fraction of requests that may be hedged, from 0 to 1.
+    request_types : tuple of type, optional
+        Request models to hedge. Defaults to ``DEFAULT_HEDGED_REQUESTS``.
+
+    Raises
+    ------
+    HilltopConfigError
+        If an option is out of range.
+
+    Examples
+    --------
+    >>> policy = HedgePolicy(percentile=90, budget=0.05)
+    >>> with HilltopClient(hedging=policy) as client:
+    ...     status = client.get_status()
+    >>> policy.stats()
+    {'requests': 1, 'hedges': 0, 'hedge_wins': 0, 'delay': 1.0}
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        min_delay: float = 0.01,
+        max_delay: float = 5.0,
+        initial_delay: float = 1.0,
+        window: int = 200,
+        min_samples: int = 20,
+        budget: float = 0.1,
+        request_types: tuple[
+            type[BaseHilltopRequest], ...
+        ] = DEFAULT_HEDGED_REQUESTS,
+    ):
+        if not 0 < percentile <= 100:
+            raise HilltopConfigError("percentile must be in (0, 100].")
+        if not 0 <= min_delay <= max_delay:
+            raise HilltopConfigError("Hedge delays must satisfy 0 <= min <= max.")
+        if not 0 <= budget <= 1:
+            raise HilltopConfigError("budget must be between 0 and 1.")
+        if window < 1 or not 1 <= min_samples <= window:
+            raise HilltopConfigError("min_samples must be between 1 and window.")
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.budget = budget
+        self.request_types = tuple(request_types)
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def applies_to(self, request: BaseHilltopRequest) -> bool:
+        """Return whether a request may be hedged."""
+        return isinstance(request, self.request_types)
+
+    def delay(self) -> float:
+        """Return how long to wait for a response before hedging.
+
+        Returns
+        -------
+        float
+            The configured percentile of recent response times, within
+            ``min_delay`` and ``max_delay``, in seconds.
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                delay = self.initial_delay
+            else:
+                latencies = sorted(self._latencies)
+                rank = round(self.percentile / 100 * (len(latencies) - 1))
+                delay = latencies[rank]
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def record(self, latency: float) -> None:
+        """Record the response time of one copy of a request, in seconds."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def start(self) -> None:
+        """Count a request that may be hedged."""
+        with self._lock:
+            self.requests += 1
+
+    def allow_hedge(self) -> bool:
+        """Return whether the budget allows another hedge, and count it."""
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def record_win(self) -> None:
+        """Count a hedge that was answered before the original request."""
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> dict[str, int | float]:
+        """Return the hedging counters.
+
+        Returns
+        -------
+        dict
+            Number of "requests" that could be hedged, "hedges" sent,
+            "hedge_wins" answered first, and the current "delay".
+        """
+        with self._lock:
+            counters = {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+            }
+        counters["delay"] = self.delay()
+        return counters
@@ -0,0 +1,111 @@
+"""Locks for state shared between threads using one client.
+
+``HilltopClient`` guards its mutable state with a ``TrackedLock``, which
+behaves like ``threading.Lock`` but counts how often threads had to wait for
+it, so lock contention can be measured under load.
+"""
+
+import threading
+import time
+
+
+class TrackedLock:
+    """A mutual exclusion lock that records contention.
+
+    Every acquisition first tries the lock without blocking. Only when that
+    fails is the acquisition counted as contended and the wait timed, so an
+    uncontended lock costs one extra non-blocking attempt. The counters are
+    updated while the lock is held, so they are always consistent.
+
+    Attributes
+    ----------
+    acquisitions : int
+        Number of times the lock was acquired.
+    contentions : int
+        Number of acquisitions that had to wait for another thread.
+    wait_time : float
+        Total time in seconds spent waiting for the lock.
+
+    Examples
+    --------
+    >>> lock = TrackedLock()
+    >>> with lock:
+    ...     counter += 1
+    >>> lock.stats()
+    {'acquisitions': 1, 'contentions': 0, 'wait_time': 0.0}
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.contentions = 0
+        self.wait_time = 0.0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquire the lock, as ``threading.Lock.acquire`` does.
+
+        Parameters
+        ----------
+        blocking : bool, default True
+            Whether to wait for the lock if another thread holds it.
+        timeout : float, default -1
+            Maximum time in seconds to wait, or -1 to wait forever.
+
+        Returns
+        -------
+        bool
+            Whether the lock was acquired.
+        """
+        if self._lock.acquire(blocking=False):
+            self.acquisitions += 1
+            return True
+        if not blocking:
+            return False
+
+        start = time.perf_counter()
+        if not self._lock.acquire(timeout=timeout):
+            return False
+        self.acquisitions += 1
+        self.contentions += 1
+        self.wait_time += time.perf_counter() - start
+        return True
+
+    def release(self) -> None:
+        """Release the lock."""
+        self._lock.release()
+
+    def locked(self) -> bool:
+        """Return whether the lock is held."""
+        return self._lock.locked()
+
+    def __enter__(self) -> "TrackedLock":
+        """Acquire the lock for a ``with`` block."""
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Release the lock at the end of a ``with`` block."""
+        self.release()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return the contention counters.
+
+        Returns
+        -------
+        dict
+            The "acquisitions", "contentions" and "wait_time" counters.
+        """
+        # Use the underlying lock, so reading the stats does not count.
+        with self._lock:
+            return {
+                "acquisitions": self.acquisitions,
+                "contentions": self.contentions,
+                "wait_time": self.wait_time,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset the contention counters to zero."""
+        with self._lock:
+            self.acquisitions = 0
+            self.contentions = 0
+            self.wait_time = 0.0
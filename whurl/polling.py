@@ -0,0 +1,315 @@
+"""Near-real-time polling of many telemetry series.
+
+A ``Poller`` repeatedly asks Hilltop Server for values newer than the last
+one it has seen for each (site, measurement) series, and hands on only the
+new rows. Each series is polled on its own interval, which follows the rate
+at which new data arrives, so series that report every fifteen minutes are
+not polled every minute. Create one with ``AsyncHilltopClient.poller``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import TYPE_CHECKING
+
+import httpx
+
+from whurl.exceptions import HilltopConfigError, HilltopError
+from whurl.schemas.requests import GetDataRequest
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from whurl.client import AsyncHilltopClient
+
+# Format of the From parameter sent after the last seen timestamp.
+_FROM_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+class SeriesState:
+    """Polling state of one (site, measurement) series.
+
+    Attributes
+    ----------
+    site : str
+        Site name.
+    measurement : str
+        Measurement name.
+    last_time : pd.Timestamp or None
+        Timestamp of the newest value seen, or None before the first poll.
+    interval : float
+        Seconds between polls of the series.
+    spacing : float or None
+        Moving average of the time between the series' values in seconds,
+        or None until it has been observed.
+    next_poll : float
+        Clock time at which the series is next due.
+    error : Exception or None
+        The error raised by the last poll, if it failed.
+    """
+
+    def __init__(self, site: str, measurement: str, interval: float):
+        self.site = site
+        self.measurement = measurement
+        self.last_time = None
+        self.interval = interval
+        self.spacing = None
+        self.next_poll = 0.0
+        self.error = None
+
+    def __repr__(self) -> str:
+        """Return a short description of the series."""
+        return (
+            f"SeriesState({self.site!r}, {self.measurement!r}, "
+            f"last_time={self.last_time}, interval={self.interval:.0f})"
+        )
+
+
+class SeriesUpdate:
+    """New values of one series, found by a poll.
+
+    Attributes
+    ----------
+    site : str
+        Site name.
+    measurement : str
+        Measurement name.
+    data : pd.DataFrame
+        The new rows, indexed by DateTime, oldest first.
+    """
+
+    def __init__(self, site: str, measurement: str, data: pd.DataFrame):
+        self.site = site
+        self.measurement = measurement
+        self.data = data
+
+    def __repr__(self) -> str:
+        """Return a short description of the update."""
+        return (
+            f"SeriesUpdate({self.site!r}, {self.measurement!r}, "
+            f"rows={len(self.data)})"
+        )
+
+
+class Poller:
+    """Poll many series for new values with bounded concurrency.
+
+    Each cycle polls every series that is due, as one wave with at most
+    ``max_concurrency`` requests in flight. The first poll of a series
+    fetches its latest value. Later polls ask for values from the last seen
+    timestamp on, and only rows newer than it are passed on.
+
+    After each poll, a series' interval moves towards the observed spacing
+    of its values, within ``min_interval`` and ``max_interval``. A poll that
+    finds nothing new, or fails, stretches the interval by ``backoff``.
+
+    Parameters
+    ----------
+    client : AsyncHilltopClient
+        The client sending the requests.
+    series : iterable of (str, str)
+        The (site, measurement) pairs to poll.
+    interval : float, default 60.0
+        Seconds between polls of a series before its data rate is known.
+    min_interval : float, default 30.0
+        Shortest time in seconds between polls of a series.
+    max_interval : float, default 900.0
+        Longest time in seconds between polls of a series.
+    max_concurrency : int, default 50
+        Maximum number of requests in flight.
+    backoff : float, default 1.5
+        Factor the interval grows by after a poll with no new values.
+    smoothing : float, default 0.3
+        Weight of the newest observation in each series' moving average
+        spacing.
+    clock : callable, default time.monotonic
+        Returns the current time in seconds.
+
+    Raises
+    ------
+    HilltopConfigError
+        If an option is out of range.
+
+    Examples
+    --------
+    >>> async with AsyncHilltopClient() as client:
+    ...     poller = client.poller([("Site A", "Flow"), ("Site B", "Stage")])
+    ...     async for update in poller:
+    ...         print(update.site, update.measurement, update.data.iloc[-1])
+    """
+
+    def __init__(
+        self,
+        client: AsyncHilltopClient,
+        series: Iterable[tuple[str, str]],
+        interval: float = 60.0,
+        min_interval: float = 30.0,
+        max_interval: float = 900.0,
+        max_concurrency: int = 50,
+        backoff: float = 1.5,
+        smoothing: float = 0.3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < min_interval <= interval <= max_interval:
+            raise HilltopConfigError(
+                "Polling intervals must satisfy 0 < min <= interval <= max."
+            )
+        if max_concurrency < 1:
+            raise HilltopConfigError("max_concurrency must be at least 1.")
+        if backoff < 1 or not 0 < smoothing <= 1:
+            raise HilltopConfigError(
+                "backoff must be at least 1 and smoothing in (0, 1]."
+            )
+
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_concurrency = max_concurrency
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.clock = clock
+        self.series = {
+            (site, measurement): SeriesState(site, measurement, interval)
+            for site, measurement in series
+        }
+        self._stopped = asyncio.Event()
+
+    async def poll_once(self) -> list[SeriesUpdate]:
+        """Poll every series that is due, once.
+
+        Returns
+        -------
+        list of SeriesUpdate
+            An update for each series with new values. Series whose poll
+            failed have their ``error`` set and are retried later.
+        """
+        now = self.clock()
+        due = [state for state in self.series.values() if state.next_poll <= now]
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def poll(state: SeriesState) -> SeriesUpdate | None:
+            async with slots:
+                return await self._poll(state)
+
+        updates = await asyncio.gather(*(poll(state) for state in due))
+        return [update for update in updates if update is not None]
+
+    async def _poll(self, state: SeriesState) -> SeriesUpdate | None:
+        """Fetch new values of one series and reschedule it."""
+        options = {}
+        if state.last_time is not None:
+            options["from_datetime"] = state.last_time.strftime(_FROM_FORMAT)
+            options["to_datetime"] = "now"
+        request = GetDataRequest(
+            base_url=str(self.client.base_url),
+            hts_endpoint=str(self.client.hts_endpoint),
+            site=state.site,
+            measurement=state.measurement,
+            **options,
+        )
+        try:
+            response = await self.client.fetch(request)
+        except (HilltopError, httpx.HTTPError) as e:
+            state.error = e
+            self._reschedule(state, None)
+            return None
+
+        state.error = None
+        data = next(
+            (
+                m.data.timeseries
+                for m in response.measurement
+                if m.data.timeseries.index.name == "DateTime"
+            ),
+            None,
+        )
+        if data is not None and state.last_time is not None:
+            # From is inclusive, so the last seen value comes back.
+            data = data[data.index > state.last_time]
+        if data is None or data.empty:
+            self._reschedule(state, None)
+            return None
+
+        self._reschedule(state, data.index)
+        return SeriesUpdate(state.site, state.measurement, data)
+
+    def _reschedule(self, state: SeriesState, times: pd.DatetimeIndex | None):
+        """Adapt a series' interval to its new values and set its next poll.
+
+        Parameters
+        ----------
+        state : SeriesState
+            The series that was polled.
+        times : pd.DatetimeIndex or None
+            Timestamps of the new values, or None if there were none.
+        """
+        if times is None:
+            state.interval = min(state.interval * self.backoff, self.max_interval)
+        else:
+            previous = state.last_time
+            state.last_time = times[-1]
+            if previous is not None:
+                spacing = (times[-1] - previous).total_seconds() / len(times)
+            elif len(times) > 1:
+                spacing = (times[-1] - times[0]).total_seconds() / (len(times) - 1)
+            else:
+                spacing = None
+            if spacing is not None:
+                if state.spacing is None:
+                    state.spacing = spacing
+                else:
+                    state.spacing += self.smoothing * (spacing - state.spacing)
+                state.interval = state.spacing
+            state.interval = min(
+                max(state.interval, self.min_interval), self.max_interval
+            )
+        state.next_poll = self.clock() + state.interval
+
+    def next_due(self) -> float:
+        """Return the seconds until the next series is due, at least zero."""
+        if not self.series:
+            return self.max_interval
+        soonest = min(state.next_poll for state in self.series.values())
+        return max(soonest - self.clock(), 0.0)
+
+    async def updates(self) -> AsyncIterator[SeriesUpdate]:
+        """Poll until stopped, yielding each update as its wave completes.
+
+        Yields
+        ------
+        SeriesUpdate
+            New values of one series.
+        """
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            for update in await self.poll_once():
+                yield update
+            try:
+                await asyncio.wait_for(self._stopped.wait(), self.next_due())
+            except asyncio.TimeoutError:
+                pass
+
+    def __aiter__(self) -> AsyncIterator[SeriesUpdate]:
+        """Iterate over updates, as ``updates`` does."""
+        return self.updates()
+
+    async def run(self, callback: Callable[[SeriesUpdate], object]) -> None:
+        """Poll until stopped, passing each update to a callback.
+
+        Parameters
+        ----------
+        callback : callable
+            Called with each ``SeriesUpdate``. Coroutine functions are
+            awaited before polling continues.
+        """
+        async for update in self.updates():
+            result = callback(update)
+            if inspect.isawaitable(result):
+                await result
+
+    def stop(self) -> None:
+        """Stop ``run`` and ``updates`` after the current wave."""
+        self._stopped.set()
@@ -0,0 +1,292 @@
+"""Hilltop's statistical methods, computed locally on fetched data.
+
+GetData requests can ask the server to aggregate a series with ``method``,
+``interval``, ``alignment`` and ``gap_tolerance``, which costs a round trip
+per aggregation level. ``resample`` computes the same statistics from raw
+data that has already been fetched, so one raw fetch can serve every level.
+``GetDataResponse.resample`` applies it to each measurement of a response.
+
+Interval statistics are labelled with the end of their interval, and cover
+the values after its start up to and including its end.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from whurl.exceptions import HilltopRequestError
+from whurl.utils import parse_hilltop_interval
+
+# Statistical methods that can be computed locally.
+METHODS = ("Interpolate", "Average", "Total", "Moving Average", "Extrema")
+
+
+def _alignment(alignment: str | None) -> pd.Timedelta:
+    """Convert an "HH:MM" or "HH:MM:SS" alignment to a time of day."""
+    if alignment is None:
+        return pd.Timedelta(0)
+    if alignment.count(":") == 1:
+        alignment = f"{alignment}:00"
+    try:
+        offset = pd.Timedelta(alignment)
+    except ValueError as e:
+        raise HilltopRequestError(
+            f"Invalid alignment: '{alignment}'. Expected 'HH:MM' or 'HH:MM:SS'."
+        ) from e
+    if not pd.Timedelta(0) <= offset < pd.Timedelta(days=1):
+        raise HilltopRequestError(f"Alignment must be a time of day: '{alignment}'.")
+    return offset
+
+
+def _boundaries(
+    first: pd.Timestamp,
+    last: pd.Timestamp,
+    step: pd.Timedelta | pd.DateOffset,
+    alignment: pd.Timedelta,
+) -> np.ndarray:
+    """Get the interval boundaries spanning the data, as datetime64[ns].
+
+    Boundaries fall at the alignment time of day plus whole steps, so the
+    first is at or before ``first`` and the last at or after ``last``.
+    """
+    if isinstance(step, pd.DateOffset):
+        # Calendar steps count from the start of the year or month.
+        if step.kwds.get("years"):
+            start = pd.Timestamp(first.year, 1, 1) + alignment
+        else:
+            start = pd.Timestamp(first.year, first.month, 1) + alignment
+        while start > first:
+            start -= step
+        bounds = pd.date_range(start, last + step, freq=step)
+        return bounds[: bounds.searchsorted(last, side="left") + 1].to_numpy()
+
+    width = step.value
+    origin = (first.normalize() + alignment).value
+    start = origin + (first.value - origin) // width * width
+    count = -(-(last.value - start) // width)
+    return (start + width * np.arange(count + 1)).astype("datetime64[ns]")
+
+
+def _gap_bins(
+    times: np.ndarray, bounds: np.ndarray, tolerance: pd.Timedelta | None
+) -> np.ndarray:
+    """Flag the intervals that overlap a gap longer than the tolerance.
+
+    Interval ``k`` runs from ``bounds[k - 1]`` to ``bounds[k]``.
+    """
+    flags = np.zeros(len(bounds), dtype=bool)
+    if tolerance is None or len(times) < 2:
+        return flags
+    gaps = np.flatnonzero(np.diff(times) > tolerance.to_timedelta64())
+    if len(gaps):
+        first = np.searchsorted(bounds, times[gaps], side="right")
+        last = np.searchsorted(bounds, times[gaps + 1], side="left")
+        marks = np.zeros(len(bounds) + 1, dtype=np.int64)
+        np.add.at(marks, first, 1)
+        np.add.at(marks, np.minimum(last, len(bounds) - 1) + 1, -1)
+        flags = np.cumsum(marks[:-1]) > 0
+    return flags
+
+
+def _interpolate(
+    values: pd.DataFrame, bounds: np.ndarray, tolerance: pd.Timedelta | None
+) -> pd.DataFrame:
+    """Interpolate each column linearly at the boundaries within the data."""
+    times = values.index.to_numpy()
+    bounds = bounds[(bounds >= times[0]) & (bounds <= times[-1])]
+    result = {}
+    for column in values.columns:
+        column_values = values[column].to_numpy(dtype=float)
+        valid = ~np.isnan(column_values)
+        result[column] = np.full(len(bounds), np.nan)
+        if valid.any():
+            result[column] = np.interp(
+                bounds.view(np.int64),
+                times[valid].view(np.int64),
+                column_values[valid],
+                left=np.nan,
+                right=np.nan,
+            )
+    frame = pd.DataFrame(result, index=pd.DatetimeIndex(bounds, name="DateTime"))
+
+    if tolerance is not None:
+        after = np.searchsorted(times, bounds, side="left")
+        exact = times[after] == bounds
+        before = np.maximum(after - 1, 0)
+        gap = (times[after] - times[before]) > tolerance.to_timedelta64()
+        frame[~exact & gap] = np.nan
+    return frame
+
+
+def _average(values: pd.DataFrame, bounds: np.ndarray) -> dict[str, np.ndarray]:
+    """Time-weight each column's average over each interval.
+
+    The series is integrated with the trapezoidal rule, with values
+    interpolated at the boundaries, and divided by the length of the part of
+    the interval that has data.
+    """
+    times = values.index.to_numpy().view(np.int64)
+    edges = bounds.view(np.int64)
+    result = {}
+    for column in values.columns:
+        column_values = values[column].to_numpy(dtype=float)
+        valid = ~np.isnan(column_values)
+        if valid.sum() < 2:
+            result[column] = np.full(len(bounds), np.nan)
+            continue
+        t, v = times[valid], column_values[valid]
+        inner = edges[(edges > t[0]) & (edges < t[-1])]
+        points = np.union1d(t, inner)
+        levels = np.interp(points, t, v)
+        widths = np.diff(points).astype(float)
+        areas = (levels[:-1] + levels[1:]) / 2 * widths
+        bins = np.searchsorted(edges, points[1:], side="left")
+        area = np.bincount(bins, weights=areas, minlength=len(bounds))
+        covered = np.bincount(bins, weights=widths, minlength=len(bounds))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result[column] = np.where(covered > 0, area / covered, np.nan)
+    return result
+
+
+def _binned(
+    values: pd.DataFrame, bounds: np.ndarray, method: str
+) -> dict[str, np.ndarray]:
+    """Total, or find the extremes of, each column's values in each interval."""
+    codes = np.searchsorted(bounds, values.index.to_numpy(), side="left")
+    result = {}
+    if method == "Total":
+        counts = np.bincount(codes, minlength=len(bounds))
+        for column in values.columns:
+            column_values = values[column].to_numpy(dtype=float)
+            totals = np.bincount(
+                codes, weights=np.nan_to_num(column_values), minlength=len(bounds)
+            )
+            # The interval ending at the first boundary only exists if a
+            # value falls exactly on it.
+            totals[0] = totals[0] if counts[0] else np.nan
+            result[column] = totals
+        return result
+
+    grouped = values.groupby(codes)
+    minima = grouped.min().reindex(range(len(bounds)))
+    maxima = grouped.max().reindex(range(len(bounds)))
+    for column in values.columns:
+        result[f"{column} Min"] = minima[column].to_numpy(dtype=float)
+        result[f"{column} Max"] = maxima[column].to_numpy(dtype=float)
+    return result
+
+
+def _moving_average(
+    values: pd.DataFrame, window: pd.Timedelta, tolerance: pd.Timedelta | None
+) -> pd.DataFrame:
+    """Average each column over the window ending at each value."""
+    frame = values.rolling(window, closed="right").mean()
+    if tolerance is not None:
+        gap = pd.Series(
+            values.index.to_series().diff() > tolerance, index=values.index
+        ).astype(float)
+        frame[gap.rolling(window, closed="right").max().to_numpy() > 0] = np.nan
+    return frame
+
+
+def resample(
+    frame: pd.DataFrame,
+    method: str,
+    interval: str | int | float,
+    alignment: str | None = None,
+    gap_tolerance: str | int | float | None = None,
+) -> pd.DataFrame:
+    """Apply a Hilltop statistical method to a raw time series.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        Raw values indexed by DateTime, as in ``GetDataResponse``
+        timeseries. Only numeric columns are used.
+    method : {"Interpolate", "Average", "Total", "Moving Average", "Extrema"}
+        The statistic:
+
+        - "Interpolate": linear interpolation at each interval boundary.
+        - "Average": time-weighted average over each interval.
+        - "Total": sum of the values in each interval, for incremental
+          series such as rainfall.
+        - "Moving Average": average of the values in the ``interval``
+          before each value.
+        - "Extrema": minimum and maximum of each interval, in
+          "<item> Min" and "<item> Max" columns.
+    interval : str or int or float
+        Interval length in Hilltop notation, e.g. "1 hour" or "1 day".
+    alignment : str, optional
+        Time of day, "HH:MM", on which interval boundaries fall. Defaults
+        to midnight.
+    gap_tolerance : str or int or float, optional
+        Longest gap between values, in Hilltop notation, that is bridged.
+        Intervals overlapping a longer gap have no value. By default every
+        gap is bridged.
+
+    Returns
+    -------
+    pd.DataFrame
+        The statistic of each column, indexed by DateTime. Interval
+        statistics are labelled with the end of their interval.
+
+    Raises
+    ------
+    HilltopRequestError
+        If the method cannot be computed locally, or an option is invalid.
+
+    Examples
+    --------
+    >>> hourly = resample(raw, "Average", "1 hour")
+    >>> daily = resample(raw, "Total", "1 day", alignment="09:00")
+    """
+    if method == "EP":
+        raise HilltopRequestError(
+            "EP statistics cannot be computed locally. Request them from the "
+            "server."
+        )
+    if method not in METHODS:
+        raise HilltopRequestError(
+            f"Unknown method '{method}'. Use one of: {', '.join(METHODS)}."
+        )
+    step = parse_hilltop_interval(interval)
+    offset = _alignment(alignment)
+    tolerance = None
+    if gap_tolerance is not None:
+        tolerance = parse_hilltop_interval(gap_tolerance)
+        if isinstance(tolerance, pd.DateOffset):
+            raise HilltopRequestError("gap_tolerance must be a fixed length of time.")
+    if method == "Moving Average" and isinstance(step, pd.DateOffset):
+        raise HilltopRequestError(
+            "Moving Average needs a fixed interval, not months or years."
+        )
+
+    values = frame.select_dtypes("number")
+    if not isinstance(values.index, pd.DatetimeIndex):
+        raise HilltopRequestError("Only series indexed by DateTime can be resampled.")
+    # The helpers work on int64 nanoseconds, e.g. for an index read from Parquet
+    # in microseconds.
+    values.index = values.index.as_unit("ns")
+    if not values.index.is_monotonic_increasing:
+        values = values.sort_index(kind="stable")
+    values = values[~values.index.duplicated(keep="last")]
+    if values.empty:
+        return values.rename_axis("DateTime")
+
+    if method == "Moving Average":
+        return _moving_average(values, step, tolerance).rename_axis("DateTime")
+
+    bounds = _boundaries(values.index[0], values.index[-1], step, offset)
+    if method == "Interpolate":
+        return _interpolate(values, bounds, tolerance)
+
+    if method == "Average":
+        result = _average(values, bounds)
+    else:
+        result = _binned(values, bounds, method)
+    gaps = _gap_bins(values.index.to_numpy(), bounds, tolerance)
+    resampled = pd.DataFrame(result, index=pd.DatetimeIndex(bounds, name="DateTime"))
+    resampled[gaps] = np.nan
+    # Drop the empty interval ending at the first boundary.
+    return resampled[resampled.notna().any(axis=1) | (np.arange(len(bounds)) > 0)]
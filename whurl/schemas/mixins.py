@@ -5,9 +5,10 @@ additional functionality for consistent string representations and
 YAML-formatted output.
 """
 
-from typing import Any, Dict, Set
+import sys
+from collections.abc import Sequence
+from typing import Any, ClassVar, Dict, Set
 
-import yaml
 from pydantic import BaseModel
 
 
@@ -29,8 +30,22 @@ class ModelReprMixin:
 
         important_field: str = None
         other_field: str = None
+
+    Large responses are shown in a bounded form: nested models deeper than
+    ``repr_max_depth`` levels are elided, and lists and dicts show at most
+    ``repr_max_items`` entries. Use ``to_yaml()`` for the full dump.
+
+    Attributes
+    ----------
+    repr_max_depth : ClassVar[int or None]
+        Nested model levels expanded by repr and str.
+    repr_max_items : ClassVar[int or None]
+        Entries shown from each list or dict by repr and str.
     """
 
+    repr_max_depth: ClassVar[int | None] = 4
+    repr_max_items: ClassVar[int | None] = 10
+
     def _get_repr_include_unset(self) -> Set[str]:
         """Get the set of fields that should always be included in repr.
 
@@ -42,35 +57,57 @@ class ModelReprMixin:
         # Try to get repr_include_unset from the class
         return getattr(self.__class__, "repr_include_unset", set())
 
-    def _to_yaml_dict(self) -> Dict[str, Any]:
+    def _to_yaml_dict(
+        self,
+        max_depth: int | None = None,
+        max_items: int | None = None,
+        _depth: int = 0,
+    ) -> Dict[str, Any]:
         """Convert model to dictionary suitable for YAML output.
 
+        Fields are read directly from the model rather than through
+        ``model_dump``, so a bounded representation only visits the values
+        it shows.
+
+        Parameters
+        ----------
+        max_depth : int, optional
+            Maximum number of nested model levels to expand. Deeper models
+            are shown as ``<ClassName>``. None expands every level.
+        max_items : int, optional
+            Maximum number of entries to show from each list or dict. None
+            shows every entry.
+
         Returns
         -------
             Dictionary representation excluding unset values unless in
             repr_include_unset.
         """
-        # Get all field values, excluding unset ones
-        data = self.model_dump(exclude_unset=True)
-
-        # Add any fields that should always be included
         include_unset = self._get_repr_include_unset()
-        if include_unset:
-            all_data = self.model_dump(exclude_unset=False)
-            for field in include_unset:
-                if field in all_data:
-                    data[field] = all_data[field]
-
-        # Remove None values unless they're explicitly required
-        filtered_data = {}
-        for key, value in data.items():
-            if value is None and key not in include_unset:
-                continue  # Skip None values
-            filtered_data[key] = value
-
-        return self._process_nested_models(filtered_data)
-
-    def _process_nested_models(self, data: Any) -> Any:
+        fields_set = self.model_fields_set
+
+        data = {}
+        for name, field in type(self).model_fields.items():
+            if field.exclude:
+                continue
+            if name not in fields_set and name not in include_unset:
+                continue
+            value = getattr(self, name)
+            # Remove None values unless they're explicitly required
+            if value is None and name not in include_unset:
+                continue
+            data[name] = self._process_nested_models(
+                value, max_depth, max_items, _depth + 1
+            )
+        return data
+
+    def _process_nested_models(
+        self,
+        data: Any,
+        max_depth: int | None = None,
+        max_items: int | None = None,
+        _depth: int = 0,
+    ) -> Any:
         """Recursively process nested models and lists for YAML representation.
 
         This method handles conversion of complex data types including nested
@@ -81,6 +118,10 @@ class ModelReprMixin:
         ----------
         data : Any
             Data to process (could be dict, list, BaseModel, etc.)
+        max_depth : int, optional
+            Maximum number of nested model levels to expand.
+        max_items : int, optional
+            Maximum number of entries to show from each list or dict.
 
         Returns
         -------
@@ -89,22 +130,40 @@ class ModelReprMixin:
         """
         if isinstance(data, dict):
             result = {}
-            for key, value in data.items():
-                result[key] = self._process_nested_models(value)
+            for index, (key, value) in enumerate(data.items()):
+                if max_items is not None and index >= max_items:
+                    result["..."] = f"{len(data) - max_items} more entries"
+                    break
+                result[key] = self._process_nested_models(
+                    value, max_depth, max_items, _depth
+                )
+            return result
+        elif isinstance(data, Sequence) and not isinstance(data, (str, bytes)):
+            hidden = 0
+            if max_items is not None and len(data) > max_items:
+                hidden = len(data) - max_items
+                data = data[:max_items]
+            result = [
+                self._process_nested_models(item, max_depth, max_items, _depth)
+                for item in data
+            ]
+            if hidden:
+                result.append(f"... {hidden} more items")
             return result
-        elif isinstance(data, list):
-            return [self._process_nested_models(item) for item in data]
         elif isinstance(data, BaseModel):
+            if max_depth is not None and _depth > max_depth:
+                return f"<{type(data).__name__}>"
             # For nested models, get their yaml dict representation
             if hasattr(data, "_to_yaml_dict"):
-                return data._to_yaml_dict()
+                return data._to_yaml_dict(max_depth, max_items, _depth)
             else:
                 return data.model_dump(exclude_unset=True)
         else:
-            # Handle special types that need formatting
-            import pandas as pd
+            # Handle special types that need formatting. If pandas has not
+            # been imported, the data cannot hold pandas objects.
+            pd = sys.modules.get("pandas")
 
-            if isinstance(data, pd.DataFrame):
+            if pd is not None and isinstance(data, pd.DataFrame):
                 # Convert DataFrame to a more readable format
                 if data.empty:
                     return "<Empty DataFrame>"
@@ -113,7 +172,7 @@ class ModelReprMixin:
                     return (
                         f"<DataFrame: {data.shape[0]} rows × {data.shape[1]} columns>"
                     )
-            elif isinstance(data, pd.Series):
+            elif pd is not None and isinstance(data, pd.Series):
                 return f"<Series: {len(data)} values>"
             elif hasattr(data, "to_dict") and callable(data.to_dict):
                 try:
@@ -122,15 +181,56 @@ class ModelReprMixin:
                     return str(data)
             return data
 
-    def _to_yaml(self) -> str:
+    def _summary(self) -> str:
+        """Summarise the size of the model's top-level collections.
+
+        Returns
+        -------
+        str
+            For example ``"site_list: 5000 items"``, or an empty string if
+            the model holds no lists or dicts.
+        """
+        parts = []
+        for name in type(self).model_fields:
+            if name not in self.model_fields_set:
+                continue
+            value = getattr(self, name)
+            if isinstance(value, (dict, Sequence)) and not isinstance(
+                value, (str, bytes)
+            ):
+                count = len(value)
+                parts.append(f"{name}: {count} item{'' if count == 1 else 's'}")
+        return ", ".join(parts)
+
+    def to_yaml(
+        self, max_depth: int | None = None, max_items: int | None = None
+    ) -> str:
         """Generate YAML string representation of the model.
 
+        With the default arguments the whole model is dumped, which can be
+        slow for responses holding thousands of entries. ``repr`` and
+        ``str`` use the bounded limits in ``repr_max_depth`` and
+        ``repr_max_items`` instead.
+
+        Parameters
+        ----------
+        max_depth : int, optional
+            Maximum number of nested model levels to expand. Deeper models
+            are shown as ``<ClassName>``.
+        max_items : int, optional
+            Maximum number of entries to show from each list or dict. The
+            rest are replaced by a ``"... N more items"`` marker.
+
         Returns
         -------
-            YAML formatted string with model header.
+        str
+            YAML formatted string with model header. The header carries a
+            comment summarising the size of any top-level collections.
         """
+        import yaml
+
         class_name = self.__class__.__name__
-        data = self._to_yaml_dict()
+        data = self._to_yaml_dict(max_depth, max_items)
 
         # Create the header with the class name
         yaml_content = {class_name: data}
@@ -143,9 +243,23 @@ class ModelReprMixin:
             sort_keys=False,
             indent=2,
             width=80,
-        )
+        ).rstrip()  # Remove trailing newline
+
+        summary = self._summary()
+        if summary:
+            # A comment keeps the output valid YAML.
+            header, _, body = yaml_str.partition("\n")
+            yaml_str = f"{header}  # {summary}\n{body}".rstrip()
+        return yaml_str
+
+    def _to_yaml(self) -> str:
+        """Generate the bounded YAML representation used by repr and str.
 
-        return yaml_str.rstrip()  # Remove trailing newline
+        Returns
+        -------
+            YAML formatted string with model header.
+        """
+        return self.to_yaml(self.repr_max_depth, self.repr_max_items)
 
     def __repr__(self) -> str:
         """Return YAML-style representation of the model.
@@ -153,7 +267,7 @@ class ModelReprMixin:
         Returns
         -------
         str
-            YAML-formatted string representation of the model.
+            Bounded YAML-formatted string representation of the model.
         """
         return self._to_yaml()
 
@@ -163,6 +277,6 @@ class ModelReprMixin:
         Returns
         -------
         str
-            YAML-formatted string representation of the model.
+            Bounded YAML-formatted string representation of the model.
         """
         return self._to_yaml()
@@ -14,6 +14,7 @@ from .measurement_list import MeasurementListRequest
 from .site_info import SiteInfoRequest
 from .site_list import SiteListRequest
 from .status import StatusRequest
+from .template import RequestTemplate
 from .time_range import TimeRangeRequest
 
 __all__ = [
@@ -24,4 +25,5 @@ __all__ = [
     "GetDataRequest",
     "CollectionListRequest",
     "TimeRangeRequest",
+    "RequestTemplate",
 ]
@@ -4,14 +4,38 @@ This module provides the base request model and common validation logic
 for all Hilltop API requests.
 """
 
-from urllib.parse import quote, urlencode, urlparse
+from functools import lru_cache
+from typing import ClassVar
+from urllib.parse import quote, urlencode, urlparse, urlsplit, urlunsplit
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from whurl.exceptions import HilltopRequestError
 from whurl.schemas.mixins import ModelReprMixin
 
 
+@lru_cache(maxsize=64)
+def url_prefix(base_url: str, hts_endpoint: str) -> str:
+    """Build the URL prefix shared by every request to one HTS endpoint.
+
+    The prefix is cached, so the thousands of requests a client sends to the
+    same server share a single string.
+
+    Parameters
+    ----------
+    base_url : str
+        Base URL for the Hilltop server.
+    hts_endpoint : str
+        HTS endpoint filename.
+
+    Returns
+    -------
+    str
+        The URL up to and including the ``?`` that starts the query string.
+    """
+    return f"{base_url}/{hts_endpoint}?"
+
+
 class BaseHilltopRequest(ModelReprMixin, BaseModel):
     """Base model for Hilltop request parameters.
 
@@ -29,8 +53,25 @@ class BaseHilltopRequest(ModelReprMixin, BaseModel):
         Service name for the API request.
     request : str, default "Status"
         Request type identifier.
+
+    Requests are immutable once validated. This makes them hashable, and
+    lets the generated URL and cache key be computed once and reused.
+
+    Attributes
+    ----------
+    template_fields : frozenset of str
+        Fields that may vary between requests stamped from a
+        ``RequestTemplate``. These must not take part in any model-level
+        validation, so that each can be checked on its own.
     """
 
+    template_fields: ClassVar[frozenset[str]] = frozenset()
+
+    model_config = ConfigDict(frozen=True)
+
+    _url: str | None = PrivateAttr(default=None)
+    _cache_key: str | None = PrivateAttr(default=None)
+
     base_url: str = Field(
         default="http://example.com", description="Base URL for the Hilltop client."
     )
@@ -155,27 +196,77 @@ class BaseHilltopRequest(ModelReprMixin, BaseModel):
             )
         return value
 
+    def _query_params(self) -> dict:
+        """Return the query parameters keyed by their Hilltop names."""
+        return self.model_dump(
+            exclude_none=True,
+            by_alias=True,
+            exclude={"base_url", "hts_endpoint"},
+        )
+
     def gen_url(self) -> str:
         """Generate the complete URL for the Hilltop request.
 
         Combines the base URL, HTS endpoint, and request parameters into
         a properly formatted URL suitable for making HTTP requests to
-        the Hilltop Server.
+        the Hilltop Server. The URL is built on first use and cached, as
+        the request cannot change afterwards.
 
         Returns
         -------
         str
             The complete URL with encoded query parameters.
         """
-        selected_params = self.model_dump(
-            exclude_none=True,
-            by_alias=True,
-            exclude={"base_url", "hts_endpoint"},
-        )
+        if self._url is None:
+            self._url = url_prefix(self.base_url, self.hts_endpoint) + urlencode(
+                self._query_params(), quote_via=quote
+            )
+        return self._url
 
-        url = (
-            f"{self.base_url}/{self.hts_endpoint}?"
-            f"{urlencode(selected_params, quote_via=quote)}"
-        )
+    def cache_key(self) -> str:
+        """Return a canonical key identifying this request.
+
+        Unlike ``gen_url``, the key does not depend on the order in which
+        parameters are declared: the query parameters are sorted by name,
+        the scheme, host and HTS endpoint are lower-cased (Hilltop Server
+        runs on IIS, where file names are case-insensitive), and a trailing
+        slash on the base URL is ignored. Two requests that Hilltop Server would answer
+        identically share a key, which makes it suitable for response
+        caching and request coalescing.
+
+        Returns
+        -------
+        str
+            The canonical URL-like key for the request.
+        """
+        if self._cache_key is None:
+            scheme, netloc, path, _, _ = urlsplit(self.base_url)
+            base = urlunsplit(
+                (scheme.lower(), netloc.lower(), path.rstrip("/"), "", "")
+            )
+            query = urlencode(sorted(self._query_params().items()), quote_via=quote)
+            self._cache_key = f"{base}/{self.hts_endpoint.lower()}?{query}"
+        return self._cache_key
+
+    def model_copy(self, *, update: dict | None = None, deep: bool = False):
+        """Return a copy of the request, optionally with some fields changed.
+
+        The cached URL and cache key are discarded when fields are updated.
+        Note that ``update`` is not validated; use a ``RequestTemplate`` or
+        build a new request to change fields safely.
+        """
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy._url = None
+            copy._cache_key = None
+        return copy
+
+    def __eq__(self, other) -> bool:
+        """Compare requests by their fields, ignoring cached values."""
+        if not isinstance(other, BaseHilltopRequest):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
 
-        return url
+    def __hash__(self) -> int:
+        """Hash the request by its canonical cache key."""
+        return hash(self.cache_key())
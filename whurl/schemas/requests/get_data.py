@@ -5,9 +5,8 @@ from Hilltop Server with various filtering and formatting options.
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import ClassVar, Literal
 
-import pandas as pd
 from isodate import ISO8601Error, parse_datetime, parse_duration
 from pydantic import Field, ValidationError, field_validator, model_validator
 
@@ -52,6 +51,10 @@ class GetDataRequest(BaseHilltopRequest):
         Output format specification ("Native" or custom formats).
     """
 
+    template_fields: ClassVar[frozenset[str]] = frozenset(
+        {"site", "measurement", "collection"}
+    )
+
     request: str = Field(default="GetData", serialization_alias="Request")
     site: str | None = Field(default=None, serialization_alias="Site")
     measurement: str | None = Field(default=None, serialization_alias="Measurement")
@@ -221,6 +224,8 @@ class GetDataRequest(BaseHilltopRequest):
         """
         if value is None:
             return None
+        import pandas as pd
+
         try:
             # Test to see if it is a time of day (Time only, no date)
             time = pd.to_datetime(value)
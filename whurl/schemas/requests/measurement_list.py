@@ -1,5 +1,7 @@
 """Data classes for Hilltop MeasurementList request parameters."""
 
+from typing import ClassVar
+
 from pydantic import Field, field_validator
 
 from whurl.exceptions import HilltopRequestError
@@ -10,6 +12,8 @@ from whurl.schemas.requests.base import BaseHilltopRequest
 class MeasurementListRequest(BaseHilltopRequest):
     """Request parameters for Hilltop MeasurementList."""
 
+    template_fields: ClassVar[frozenset[str]] = frozenset({"site", "collection"})
+
     request: str = Field(default="MeasurementList", serialization_alias="Request")
     site: str | None = Field(default=None, serialization_alias="Site")
     collection: str | None = Field(default=None, serialization_alias="Collection")
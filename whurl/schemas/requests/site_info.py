@@ -1,6 +1,8 @@
 """Hilltop SiteInfo request schema."""
 
-from pydantic import Field, field_validator
+from typing import ClassVar
+
+from pydantic import Field, field_serializer, field_validator
 
 from whurl.exceptions import HilltopRequestError
 from whurl.schemas.mixins import ModelReprMixin
@@ -10,6 +12,8 @@ from whurl.schemas.requests.base import BaseHilltopRequest
 class SiteInfoRequest(BaseHilltopRequest):
     """Hilltop SiteInfo request schema."""
 
+    template_fields: ClassVar[frozenset[str]] = frozenset({"site", "collection"})
+
     request: str = Field(default="SiteInfo", serialization_alias="Request")
     site: str | None = Field(default=None, serialization_alias="Site")
     field_list: list[str] | None = Field(serialization_alias="FieldList", default=None)
@@ -21,3 +25,10 @@ class SiteInfoRequest(BaseHilltopRequest):
         if value != "SiteInfo":
             raise HilltopRequestError("Request must be 'SiteInfo'")
         return value
+
+    @field_serializer("field_list")
+    def serialize_field_list(self, value: list[str] | None) -> str | None:
+        """Serialise the field list as Hilltop's comma-separated list."""
+        if value is None:
+            return None
+        return ",".join(value)
@@ -4,6 +4,8 @@ This module defines the request model for retrieving lists of sites from
 Hilltop Server with various filtering and location options.
 """
 
+from typing import ClassVar
+
 from pydantic import Field, field_validator, model_validator
 
 from whurl.exceptions import HilltopRequestError
@@ -39,6 +41,8 @@ class SiteListRequest(BaseHilltopRequest):
         Fill column data ("Yes") when site_parameters provided.
     """
 
+    template_fields: ClassVar[frozenset[str]] = frozenset({"measurement", "collection"})
+
     request: str = Field(default="SiteList", serialization_alias="Request")
     location: str | None = Field(default=None, serialization_alias="Location")
     bounding_box: str | None = Field(default=None, serialization_alias="BBox")
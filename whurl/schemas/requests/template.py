@@ -0,0 +1,179 @@
+"""Request templates for building many similar requests cheaply.
+
+A template fully validates the parameters shared by a batch of requests
+once, then stamps out per-site or per-measurement variants. Only the
+fields that change between variants are checked for each stamp.
+"""
+
+from typing import Generic, TypeVar
+from urllib.parse import quote, urlencode
+
+from whurl.exceptions import HilltopRequestError
+from whurl.schemas.requests.base import BaseHilltopRequest, url_prefix
+
+RequestT = TypeVar("RequestT", bound=BaseHilltopRequest)
+
+
+class RequestTemplate(Generic[RequestT]):
+    """Validate shared request parameters once and stamp out variants.
+
+    Fields listed in the request class's ``template_fields`` (e.g. ``site``
+    and ``measurement``) carry no cross-field constraints, so stamping a
+    variant that only changes those fields runs just their own field
+    validators and copies the validated base request. Changing any other
+    field falls back to full validation of the merged parameters, so a
+    stamped request is always as valid as one built directly.
+
+    Parameters
+    ----------
+    request_cls : type of BaseHilltopRequest
+        The request model to build, e.g. ``GetDataRequest``.
+    **shared
+        Parameters shared by every request stamped from this template.
+
+    Raises
+    ------
+    HilltopRequestError
+        If the shared parameters, or the parameters of a stamped variant,
+        are invalid.
+
+    Examples
+    --------
+    >>> template = RequestTemplate(
+    ...     GetDataRequest,
+    ...     base_url="https://example.com",
+    ...     hts_endpoint="data.hts",
+    ...     measurement="Flow",
+    ...     from_datetime="2024-01-01T00:00:00",
+    ... )
+    >>> requests = [template.stamp(site=site) for site in sites]
+    >>> urls = [template.gen_url(site=site) for site in sites]
+    """
+
+    def __init__(self, request_cls: type[RequestT], **shared):
+        self.request_cls = request_cls
+        self.shared = shared
+        self.base = request_cls(**shared)
+
+        self._prefix = url_prefix(self.base.base_url, self.base.hts_endpoint)
+        self._aliases = {}
+        self._encoded = {}
+        # Serialised values, so fields with custom serialisers match gen_url.
+        params = self.base._query_params()
+        for name, field in request_cls.model_fields.items():
+            if name in ("base_url", "hts_endpoint"):
+                continue
+            self._aliases[name] = field.serialization_alias or name
+            self._encoded[name] = self._encode(
+                name, params.get(self._aliases[name])
+            )
+
+        self._field_validators = {}
+        for decorator in request_cls.__pydantic_decorators__.field_validators.values():
+            for name in decorator.info.fields:
+                self._field_validators.setdefault(name, []).append(decorator.func)
+
+    def _encode(self, name: str, value) -> str | None:
+        """Encode one query parameter exactly as ``gen_url`` would."""
+        if value is None:
+            return None
+        return urlencode({self._aliases[name]: value}, quote_via=quote)
+
+    def _check(self, overrides: dict) -> dict | None:
+        """Cheaply validate overrides, returning None if they need full validation.
+
+        Parameters
+        ----------
+        overrides : dict
+            Field values that differ from the shared parameters.
+
+        Returns
+        -------
+        dict or None
+            The overrides as returned by their validators, if every override
+            is a template field; None if the overrides must be validated as
+            a whole.
+
+        Raises
+        ------
+        HilltopRequestError
+            If an override is not a field of the request model, or a
+            template field fails its validators.
+        """
+        validated = {}
+        for name, value in overrides.items():
+            if name not in self.request_cls.model_fields:
+                raise HilltopRequestError(
+                    f"Unknown {self.request_cls.__name__} field: '{name}'"
+                )
+            if name not in self.request_cls.template_fields:
+                validated = None
+                continue
+            for validator in self._field_validators.get(name, []):
+                value = validator(value)
+            if value is not None and not isinstance(value, str):
+                raise HilltopRequestError(
+                    f"{self.request_cls.__name__}.{name} must be a string, "
+                    f"got {type(value).__name__}"
+                )
+            if validated is not None:
+                validated[name] = value
+        return validated
+
+    def _variant_url(self, overrides: dict) -> str:
+        """Assemble the URL for checked template-field overrides."""
+        encoded = dict(self._encoded)
+        for name, value in overrides.items():
+            encoded[name] = self._encode(name, value)
+        return self._prefix + "&".join(
+            part for part in encoded.values() if part is not None
+        )
+
+    def stamp(self, **overrides) -> RequestT:
+        """Build a request that differs from the template by ``overrides``.
+
+        Requests that only change template fields come with their URL
+        already generated, so sending them never runs ``model_dump``.
+
+        Parameters
+        ----------
+        **overrides
+            Field values for this variant.
+
+        Returns
+        -------
+        BaseHilltopRequest
+            A validated request of the template's request class.
+        """
+        if not overrides:
+            return self.base
+        validated = self._check(overrides)
+        if validated is not None:
+            request = self.base.model_copy(update=validated)
+            request._url = self._variant_url(validated)
+            return request
+        return self.request_cls(**{**self.shared, **overrides})
+
+    def gen_url(self, **overrides) -> str:
+        """Generate the URL for a variant without building a request model.
+
+        The query string is assembled from parameters encoded once when the
+        template was created, so no ``model_dump`` runs per call. The result
+        is identical to ``self.stamp(**overrides).gen_url()``.
+
+        Parameters
+        ----------
+        **overrides
+            Field values for this variant.
+
+        Returns
+        -------
+        str
+            The complete URL with encoded query parameters.
+        """
+        if not overrides:
+            return self.base.gen_url()
+        validated = self._check(overrides)
+        if validated is not None:
+            return self._variant_url(validated)
+        return self.stamp(**overrides).gen_url()
@@ -1,5 +1,7 @@
 """Schema for HilltopServer TimeRange requests."""
 
+from typing import ClassVar
+
 from pydantic import Field, field_validator
 
 from whurl.exceptions import HilltopRequestError
@@ -10,6 +12,8 @@ from whurl.schemas.requests.base import BaseHilltopRequest
 class TimeRangeRequest(BaseHilltopRequest):
     """Request parameters for Hilltop TimeRange."""
 
+    template_fields: ClassVar[frozenset[str]] = frozenset({"site", "measurement"})
+
     request: str = Field(default="TimeRange", serialization_alias="Request")
     site: str | None = Field(
         default=None, serialization_alias="Site", validate_default=True
@@ -8,13 +8,29 @@ __author__ = """Nic Mostert"""
 __email__ = "nicolas.mostert@horizons.govt.nz"
 __version__ = "0.1.2"
 
-from .collection_list import CollectionListResponse
-from .get_data import GetDataResponse
-from .measurement_list import MeasurementListResponse
-from .site_info import SiteInfoResponse
-from .site_list import SiteListResponse
-from .status import StatusResponse
-from .time_range import TimeRangeResponse
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .collection_list import CollectionListResponse
+    from .get_data import GetDataResponse
+    from .measurement_list import MeasurementListResponse
+    from .site_info import SiteInfoResponse
+    from .site_list import SiteListResponse
+    from .status import StatusResponse
+    from .time_range import TimeRangeResponse
+
+# Response modules pull in pandas, numpy and the XML parsers, so each one is
+# only imported the first time its response model is used.
+_MODULES = {
+    "CollectionListResponse": ".collection_list",
+    "GetDataResponse": ".get_data",
+    "MeasurementListResponse": ".measurement_list",
+    "SiteInfoResponse": ".site_info",
+    "SiteListResponse": ".site_list",
+    "StatusResponse": ".status",
+    "TimeRangeResponse": ".time_range",
+}
 
 __all__ = [
     "MeasurementListResponse",
@@ -25,3 +41,17 @@ __all__ = [
     "CollectionListResponse",
     "TimeRangeResponse",
 ]
+
+
+def __getattr__(name: str):
+    """Import response models on first access."""
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily imported response models alongside module attributes."""
+    return sorted(set(globals()) | set(__all__))
@@ -3,6 +3,7 @@
 import xmltodict
 from pydantic import BaseModel, Field, field_validator
 
+from whurl.exceptions import HilltopParseError
 from whurl.schemas.mixins import ModelReprMixin
 from whurl.schemas.requests import CollectionListRequest
 
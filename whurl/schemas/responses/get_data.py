@@ -1,17 +1,19 @@
 """GetData response schema."""
 
 from __future__ import annotations
-from dulwich.config import Value
 
-from urllib.parse import quote, urlencode
+from collections.abc import Iterable, Sequence
 
-import httpx
+import numpy as np
 import pandas as pd
 import xmltodict
 from pydantic import (BaseModel, ConfigDict, Field, PrivateAttr,
                       field_validator, model_validator)
 
-from whurl.exceptions import HilltopParseError, HilltopResponseError
+from whurl.downsampling import downsample
+from whurl.exceptions import (HilltopParseError, HilltopRequestError,
+                              HilltopResponseError)
+from whurl.resampling import resample
 from whurl.schemas.mixins import ModelReprMixin
 from whurl.schemas.requests import GetDataRequest
 
@@ -228,6 +230,232 @@ class GetDataResponse(ModelReprMixin, BaseModel):
         else:
             return pd.concat(frames, ignore_index=False)
 
+    def to_wide_frame(self) -> pd.DataFrame:
+        """Align every measurement on one shared DateTime index.
+
+        Each item of each measurement becomes a column keyed by ``(Site, Item)``.
+        The per-measurement indexes are already sorted, so the union index is
+        built with a single stable sort over their concatenation followed by a
+        vectorised de-duplication. Values are then scattered into place by
+        position instead of being joined frame by frame.
+
+        Returns
+        -------
+        pd.DataFrame
+            Frame indexed by the sorted union of all timestamps, with a
+            ``(Site, Item)`` column MultiIndex. Timestamps that a measurement
+            does not cover are left as NaN (or NaT for date items). If two
+            measurements share a ``(Site, Item)`` key, the later one wins where
+            both have a value.
+        """
+        blocks = []
+        for measurement in self.measurement:
+            frame = measurement.data.timeseries
+            if frame.empty or frame.index.name != "DateTime":
+                continue
+            items = [
+                item.item_name
+                for item in measurement.data_source.item_info
+                if item.item_name in frame.columns
+            ]
+            if not items:
+                items = [c for c in frame.columns if c not in ("Site", "DataSource")]
+            if frame.index.has_duplicates:
+                frame = frame[~frame.index.duplicated(keep="last")]
+            blocks.append((measurement.site_name, frame.index.to_numpy(), frame[items]))
+
+        if not blocks:
+            return pd.DataFrame()
+
+        merged = np.sort(np.concatenate([index for _, index, _ in blocks]), kind="stable")
+        if len(merged) > 1:
+            merged = merged[np.concatenate(([True], merged[1:] != merged[:-1]))]
+
+        columns = {}
+        for site, index, frame in blocks:
+            positions = np.searchsorted(merged, index)
+            for item in frame.columns:
+                values = frame[item].to_numpy()
+                key = (site, item)
+                if key not in columns:
+                    columns[key] = _empty_column(values, len(merged))
+                    columns[key][positions] = values
+                else:
+                    # A gap in the later measurement keeps the earlier value.
+                    present = pd.notna(values)
+                    columns[key][positions[present]] = values[present]
+
+        wide = pd.DataFrame(columns, index=pd.DatetimeIndex(merged, name="DateTime"))
+        wide.columns.names = ["Site", "Item"]
+        return wide
+
+    @classmethod
+    def merge(
+        cls, responses: Iterable[GetDataResponse], overlap: str = "timestamp"
+    ) -> GetDataResponse:
+        """Combine responses for the same data from several sources.
+
+        Measurements with the same site and data source are joined into one,
+        keeping the metadata of the first response that has it.
+
+        Parameters
+        ----------
+        responses : iterable of GetDataResponse
+            Responses in order of precedence, highest first.
+        overlap : {"timestamp", "range"}, default "timestamp"
+            How data present in more than one response is de-duplicated.
+            With "timestamp", a value is dropped if a response with higher
+            precedence has a value at the same time. With "range", every
+            value within the time span of a response with higher precedence
+            is dropped, so each stretch of time comes from one source.
+
+        Returns
+        -------
+        GetDataResponse
+            A response holding every measurement, with the agency of the
+            first response that names one. Its ``request`` is None, as no
+            single request produced it.
+
+        Raises
+        ------
+        HilltopRequestError
+            If ``overlap`` is not "timestamp" or "range".
+        """
+        if overlap not in ("timestamp", "range"):
+            raise HilltopRequestError(
+                f"Unknown overlap '{overlap}'. Use 'timestamp' or 'range'."
+            )
+
+        data = {}
+        groups = {}
+        for response in responses:
+            if response.agency is not None:
+                data.setdefault("agency", response.agency)
+            for measurement in response.measurement:
+                key = (measurement.site_name, measurement.data_source.name)
+                groups.setdefault(key, []).append(measurement)
+
+        measurements = []
+        for first, *rest in groups.values():
+            if rest:
+                frames = [m.data.timeseries for m in (first, *rest)]
+                merged = first.data.model_copy(
+                    update={"timeseries": _merge_timeseries(frames, overlap)}
+                )
+                first = first.model_copy(update={"data": merged})
+            measurements.append(first)
+        if measurements:
+            data["measurement"] = measurements
+        return cls.model_construct(set(data), **data)
+
+    def resample(
+        self,
+        method: str,
+        interval: str | int | float,
+        alignment: str | None = None,
+        gap_tolerance: str | int | float | None = None,
+    ) -> GetDataResponse:
+        """Apply a Hilltop statistical method to every measurement locally.
+
+        Gives the statistics the server would return for the same
+        ``method``, ``interval``, ``alignment`` and ``gap_tolerance``, from
+        raw data that has already been fetched. See ``whurl.resampling``.
+
+        Parameters
+        ----------
+        method : str
+            The statistic to compute: "Interpolate", "Average", "Total",
+            "Moving Average" or "Extrema".
+        interval : str or int or float
+            Interval length in Hilltop notation, e.g. "1 hour".
+        alignment : str, optional
+            Time of day, "HH:MM", on which interval boundaries fall.
+        gap_tolerance : str or int or float, optional
+            Longest gap between values, in Hilltop notation, that is bridged.
+
+        Returns
+        -------
+        GetDataResponse
+            A copy of the response with each measurement's numeric items
+            resampled. Measurements not indexed by DateTime are unchanged.
+
+        Raises
+        ------
+        HilltopRequestError
+            If the method cannot be computed locally, or an option is
+            invalid.
+
+        Examples
+        --------
+        >>> raw = client.get_data(site="Site A", measurement="Flow")
+        >>> hourly = raw.resample("Average", "1 hour")
+        >>> daily = raw.resample("Average", "1 day", alignment="09:00")
+        """
+        measurements = []
+        for measurement in self.measurement:
+            frame = measurement.data.timeseries
+            if frame.index.name == "DateTime":
+                data = measurement.data.model_copy(
+                    update={
+                        "timeseries": resample(
+                            frame, method, interval, alignment, gap_tolerance
+                        )
+                    }
+                )
+                measurement = measurement.model_copy(update={"data": data})
+            measurements.append(measurement)
+        return self.model_copy(update={"measurement": measurements})
+
+    def downsample(
+        self,
+        n: int,
+        method: str = "lttb",
+        columns: Sequence[str] | None = None,
+    ) -> GetDataResponse:
+        """Cut every measurement to about ``n`` points per item for plotting.
+
+        See ``whurl.downsampling``.
+
+        Parameters
+        ----------
+        n : int
+            Number of points to keep per item.
+        method : {"lttb", "min_max"}, default "lttb"
+            Largest-Triangle-Three-Buckets, or the minimum and maximum of
+            each bucket.
+        columns : sequence of str, optional
+            Items to pick points by. Defaults to every numeric item.
+            Measurements without these items are unchanged.
+
+        Returns
+        -------
+        GetDataResponse
+            A copy of the response with each measurement downsampled.
+            Measurements not indexed by DateTime are unchanged.
+
+        Raises
+        ------
+        HilltopRequestError
+            If the method is unknown or ``n`` is too small for it.
+
+        Examples
+        --------
+        >>> raw = client.get_data(site="Site A", measurement="Flow")
+        >>> plot(raw.downsample(2000).to_dataframe())
+        """
+        measurements = []
+        for measurement in self.measurement:
+            frame = measurement.data.timeseries
+            if frame.index.name == "DateTime" and (
+                columns is None or set(columns) <= set(frame.columns)
+            ):
+                data = measurement.data.model_copy(
+                    update={"timeseries": downsample(frame, n, method, columns)}
+                )
+                measurement = measurement.model_copy(update={"data": data})
+            measurements.append(measurement)
+        return self.model_copy(update={"measurement": measurements})
+
     @classmethod
     def from_xml(cls, xml_str: str) -> "GetDataResponse":
         """Parse XML string into GetData object."""
@@ -260,3 +488,42 @@ class GetDataResponse(ModelReprMixin, BaseModel):
                 raw_response=xml_str,
             )
         return cls(**data)
+
+
+def _merge_timeseries(frames: list[pd.DataFrame], overlap: str) -> pd.DataFrame:
+    """Join time series in order of precedence, dropping overlapping values.
+
+    See ``GetDataResponse.merge`` for the meaning of ``overlap``.
+    """
+    kept = []
+    seen = None
+    spans = []
+    for frame in frames:
+        if frame.empty:
+            continue
+        index = frame.index
+        if kept:
+            if overlap == "timestamp":
+                mask = ~index.isin(seen)
+            else:
+                mask = np.ones(len(index), dtype=bool)
+                for start, end in spans:
+                    mask &= (index < start) | (index > end)
+            kept.append(frame[mask])
+        else:
+            kept.append(frame)
+        seen = index if seen is None else seen.append(index)
+        spans.append((index.min(), index.max()))
+
+    if not kept:
+        return frames[0]
+    return pd.concat(kept).sort_index(kind="stable")
+
+
+def _empty_column(values: np.ndarray, length: int) -> np.ndarray:
+    """Allocate a missing-filled column able to hold ``values``."""
+    if values.dtype.kind in "fiub":
+        return np.full(length, np.nan, dtype=float)
+    if values.dtype.kind == "M":
+        return np.full(length, np.datetime64("NaT"), dtype=values.dtype)
+    return np.full(length, None, dtype=object)
@@ -1,11 +1,9 @@
 """Contains the functions and models for the Hilltop MeasurementList request."""
 
+from collections.abc import Iterable
 from datetime import datetime
-from typing import List, Optional, Self
-from urllib.parse import quote, urlencode
+from typing import TYPE_CHECKING, List, Optional, Self
 
-import httpx
-import pandas as pd
 import xmltodict
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -14,6 +12,9 @@ from whurl.exceptions import (HilltopParseError, HilltopRequestError,
 from whurl.schemas.mixins import ModelReprMixin
 from whurl.schemas.requests import MeasurementListRequest
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class MeasurementListResponse(ModelReprMixin, BaseModel):
     """Top-level Hilltop MeasurementList response model."""
@@ -112,19 +113,73 @@ class MeasurementListResponse(ModelReprMixin, BaseModel):
             )
         return self
 
-    def to_dataframe(self) -> pd.DataFrame:
-        """Convert the model to a pandas DataFrame."""
-        records = [m.to_dict() for m in self.measurements]
+    def _flat_measurements(self) -> tuple[list, list]:
+        """List every measurement with the data source it belongs to.
+
+        Returns
+        -------
+        tuple of list
+            The top-level measurements followed by those of each data
+            source, and the matching data sources (None for top-level
+            measurements).
+        """
+        measurements = list(self.measurements)
+        sources = [None] * len(measurements)
         for ds in self.data_sources:
-            # Flatten the measurements into the records
-            for measurement in ds.measurements:
-                record = measurement.to_dict()
-                if "@Site" not in record:
-                    record["@Site"] = ds.site
-            record["DataSource"] = ds.name
-            records.append(record)
+            measurements.extend(ds.measurements)
+            sources.extend([ds] * len(ds.measurements))
+        return measurements, sources
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Convert the model to a pandas DataFrame.
+
+        The frame has one row per measurement, top-level measurements first
+        and then those of each data source. There is one column per field
+        that is set on at least one measurement, named by its Hilltop alias
+        with "@Name" as "Measurement Name" and "@Site" as "Site". Rows from
+        a data source take the data source's site when their own is unset,
+        and its name in a "DataSource" column. Columns are filled straight
+        from the model attributes, without dumping each measurement.
+
+        Returns
+        -------
+        pd.DataFrame
+            The flattened measurements. Unset values are NaN.
+        """
+        import numpy as np
+        import pandas as pd
+
+        measurements, sources = self._flat_measurements()
+        fields = self.DataSource.Measurement.model_fields
+
+        # Only visit the fields set on each measurement, so each column is
+        # filled in one pass without dumping the models.
+        values = {}
+        for row, measurement in enumerate(measurements):
+            attributes = measurement.__dict__
+            for name in measurement.model_fields_set:
+                if name not in values:
+                    values[name] = [np.nan] * len(measurements)
+                values[name][row] = attributes[name]
 
-        df = pd.DataFrame.from_records(records)
+        # Rows from a data source fall back to the data source's site.
+        if any(ds is not None for ds in sources):
+            site = values.setdefault("site", [np.nan] * len(measurements))
+            for row, (measurement, ds) in enumerate(zip(measurements, sources)):
+                if ds is not None and "site" not in measurement.model_fields_set:
+                    site[row] = ds.site
+
+        columns = {
+            field.alias: values[name]
+            for name, field in fields.items()
+            if name in values
+        }
+        if any(ds is not None for ds in sources):
+            columns["DataSource"] = [
+                ds.name if ds is not None else np.nan for ds in sources
+            ]
+
+        df = pd.DataFrame(columns)
 
         df.rename(
             columns={
@@ -136,10 +191,127 @@ class MeasurementListResponse(ModelReprMixin, BaseModel):
 
         return df
 
+    def availability(self) -> "pd.DataFrame":
+        """Build a site by measurement availability matrix.
+
+        Lookups such as ``matrix.at[site, measurement]`` are hash lookups,
+        so scheduling code can check many site and measurement pairs
+        without scanning the response.
+
+        Returns
+        -------
+        pd.DataFrame
+            Boolean frame indexed by site name, with one column per
+            measurement name, True where the site has the measurement.
+            Measurements without a known site are left out.
+        """
+        import numpy as np
+        import pandas as pd
+
+        measurements, sources = self._flat_measurements()
+        pairs = [
+            (m.site if m.site is not None else ds.site, m.name)
+            for m, ds in zip(measurements, sources)
+            if m.site is not None or ds is not None
+        ]
+        site_codes, sites = pd.factorize(np.array([p[0] for p in pairs], dtype=object))
+        name_codes, names = pd.factorize(np.array([p[1] for p in pairs], dtype=object))
+
+        matrix = np.zeros((len(sites), len(names)), dtype=bool)
+        matrix[site_codes, name_codes] = True
+        return pd.DataFrame(
+            matrix,
+            index=pd.Index(sites, name="Site"),
+            columns=pd.Index(names, name="Measurement Name"),
+        )
+
+    def time_ranges(self) -> "pd.DataFrame":
+        """List the time range of every measurement.
+
+        Measurements without their own "From" and "To" take those of their
+        data source.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per measurement with "Site", "Measurement", "From",
+            "To" and "Units" columns. Measurements without a known site are
+            left out, and unknown times are NaT.
+        """
+        import pandas as pd
+
+        rows = []
+        for m, ds in zip(*self._flat_measurements()):
+            if ds is None:
+                site, from_time, to_time = m.site, m.from_time, m.to_time
+            else:
+                site = m.site if m.site is not None else ds.site
+                from_time = m.from_time if m.from_time is not None else ds.from_time
+                to_time = m.to_time if m.to_time is not None else ds.to_time
+            if site is not None:
+                rows.append((site, m.name, from_time, to_time, m.units))
+
+        df = pd.DataFrame(rows, columns=["Site", "Measurement", "From", "To", "Units"])
+        df["From"] = pd.to_datetime(df["From"])
+        df["To"] = pd.to_datetime(df["To"])
+        return df
+
     def to_dict(self):
         """Convert the model to a dictionary."""
         return self.model_dump(exclude_unset=True, by_alias=True)
 
+    @classmethod
+    def merge(
+        cls, responses: Iterable["MeasurementListResponse"]
+    ) -> "MeasurementListResponse":
+        """Combine MeasurementList responses from several sources.
+
+        A data source found in more than one response, with the same site
+        and name, is kept once with the metadata of the first response that
+        has it. Its time range is widened to cover every copy, and it lists
+        the measurements of every copy.
+
+        Parameters
+        ----------
+        responses : iterable of MeasurementListResponse
+            Responses in order of precedence, highest first.
+
+        Returns
+        -------
+        MeasurementListResponse
+            A response holding every data source and measurement once, with
+            the agency of the first response that names one. Its
+            ``request`` is None, as no single request produced it.
+        """
+        data = {}
+        sources = {}
+        measurements = {}
+        for response in responses:
+            if response.agency is not None:
+                data.setdefault("agency", response.agency)
+            for source in response.data_sources:
+                key = (source.site, source.name)
+                kept = sources.setdefault(key, source)
+                if kept is source:
+                    continue
+                names = {m.name for m in kept.measurements}
+                sources[key] = kept.model_copy(
+                    update={
+                        "from_time": min(kept.from_time, source.from_time),
+                        "to_time": max(kept.to_time, source.to_time),
+                        "measurements": kept.measurements
+                        + [m for m in source.measurements if m.name not in names],
+                    }
+                )
+            for m in response.measurements:
+                measurements.setdefault((m.site, m.name), m)
+
+        if sources:
+            data["data_sources"] = list(sources.values())
+        if measurements:
+            data["measurements"] = list(measurements.values())
+        return cls.model_construct(set(data), **data)
+
     @classmethod
     def from_xml(cls, xml_str: str) -> "MeasurementListResponse":
         """Parse the XML string and return a HilltopMeasurementList object."""
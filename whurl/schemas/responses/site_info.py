@@ -1,15 +1,91 @@
 """Hilltop SiteInfo response schema."""
 
+import re
+from collections.abc import Collection, Iterable
 from typing import Any, Dict
-from xml.parsers.expat import ExpatError
 
-import xmltodict
 from pydantic import BaseModel, Field, model_validator
 
-from whurl.exceptions import HilltopParseError, HilltopResponseError
+from whurl.exceptions import HilltopParseError
 from whurl.schemas.mixins import ModelReprMixin
 from whurl.schemas.requests import SiteInfoRequest
-from whurl.utils import sanitise_xml_attributes
+
+# Attribute values; a quoted run cannot backtrack past its closing quote.
+_ATTRIBUTE_VALUE = re.compile(r'="([^"]*)"')
+# Ampersands that do not start a character or entity reference.
+_BARE_AMPERSAND = re.compile(r"&(?!#?\w+;)")
+
+
+def _escape_attribute_values(xml_str: str) -> str:
+    """Escape bare ampersands and angle brackets inside attribute values.
+
+    Hilltop writes some attribute values, such as site names, without
+    escaping them. This makes a single linear pass over the attributes and
+    only rewrites the values that need it.
+
+    Parameters
+    ----------
+    xml_str : str
+        The XML string to escape.
+
+    Returns
+    -------
+    str
+        The XML string with well-formed attribute values.
+    """
+
+    def escape(match: re.Match) -> str:
+        value = match.group(1)
+        if "&" not in value and "<" not in value:
+            return match.group(0)
+        value = _BARE_AMPERSAND.sub("&amp;", value).replace("<", "&lt;")
+        return f'="{value}"'
+
+    return _ATTRIBUTE_VALUE.sub(escape, xml_str)
+
+
+def _element_to_value(element, tags: Collection[str] | None = None) -> Any:
+    """Convert an lxml element to the structure xmltodict would produce.
+
+    Attributes become ``@``-prefixed keys, repeated child tags become lists,
+    and an element with no attributes or children becomes its stripped text,
+    or None when it has none. If ``tags`` is given, only direct children
+    with those tags are converted, so an empty ``tags`` converts none.
+    """
+    attributes = element.attrib
+    if tags is None and not attributes and not len(element):
+        # Most SiteInfo fields are plain text leaves.
+        text = element.text
+        return text.strip() or None if text else None
+
+    value = {f"@{key}": text for key, text in attributes.items()}
+    text = element.text or ""
+    repeated = set()
+    if tags is None:
+        children = element
+    else:
+        # iterchildren() with no tags would yield every child.
+        children = element.iterchildren(*tags) if tags else ()
+    for child in children:
+        text += child.tail or ""
+        # Skip comments and processing instructions.
+        if not isinstance(child.tag, str):
+            continue
+        child_value = _element_to_value(child)
+        if child.tag in repeated:
+            value[child.tag].append(child_value)
+        elif child.tag in value:
+            value[child.tag] = [value[child.tag], child_value]
+            repeated.add(child.tag)
+        else:
+            value[child.tag] = child_value
+
+    text = text.strip()
+    if not value:
+        return text or None
+    if text:
+        value["#text"] = text
+    return value
 
 
 class SiteInfoResponse(ModelReprMixin, BaseModel):
@@ -41,37 +117,121 @@ class SiteInfoResponse(ModelReprMixin, BaseModel):
     request: SiteInfoRequest | None = Field(default=None, exclude=True)
 
     @classmethod
-    def from_xml(cls, xml_str: str) -> "SiteInfoResponse":
-        """Parse the XML string and return a SiteInfoResponse instance."""
+    def from_xml(
+        cls, xml_str: str, fields: Collection[str] | None = None
+    ) -> "SiteInfoResponse":
+        """Parse the XML string and return a SiteInfoResponse instance.
+
+        The payload is parsed with lxml. Only if it is not well-formed are
+        unescaped attribute values repaired and the payload parsed again.
+
+        Parameters
+        ----------
+        xml_str : str
+            The XML response from the Hilltop server.
+        fields : collection of str, optional
+            Info fields to keep for each site. Other fields are skipped
+            without being converted. Defaults to every field.
+
+        Returns
+        -------
+        SiteInfoResponse
+            The parsed response.
+
+        Raises
+        ------
+        HilltopParseError
+            If the XML cannot be parsed or is not a HilltopServer response.
+        """
+        from lxml import etree
+
+        # Override any declared encoding, as the string is already decoded.
+        parser = etree.XMLParser(encoding="utf-8", huge_tree=True)
         try:
-            response = xmltodict.parse(sanitise_xml_attributes(xml_str))
-        except ExpatError as e:
-            raise HilltopParseError(
-                "Failed to parse XML response", raw_response=xml_str
-            ) from e
-
-        if "HilltopServer" not in response:
+            root = etree.fromstring(xml_str.encode("utf-8"), parser)
+        except etree.XMLSyntaxError:
+            try:
+                root = etree.fromstring(
+                    _escape_attribute_values(xml_str).encode("utf-8"), parser
+                )
+            except etree.XMLSyntaxError as e:
+                raise HilltopParseError(
+                    f"Failed to parse XML response: {e}", raw_response=xml_str
+                ) from e
+
+        if root.tag != "HilltopServer":
             raise HilltopParseError(
                 "Unexpected HilltopServer response format", raw_response=xml_str
             )
-        data = response["HilltopServer"]
 
-        if "Site" in data:
-            if not isinstance(data["Site"], list):
-                data["Site"] = [data["Site"]]
+        data = {}
+        sites = []
+        for element in root.iterchildren("Agency", "Site"):
+            if element.tag == "Agency":
+                data["agency"] = _element_to_value(element)
+                continue
+            info = _element_to_value(element, fields)
+            info = info if isinstance(info, dict) else {}
+            name = info.pop("@Name", None)
+            if name is None:
+                raise HilltopParseError(
+                    "SiteInfo response has a Site without a Name",
+                    raw_response=xml_str,
+                )
+            sites.append(cls.Site.model_construct(name=name, info=info))
+
+        if sites:
+            data["site"] = sites
+        return cls.model_construct(set(data), **data)
 
-        return cls(**data)
+    @classmethod
+    def concat(cls, responses: Iterable["SiteInfoResponse"]) -> "SiteInfoResponse":
+        """Combine several SiteInfo responses into one.
+
+        Parameters
+        ----------
+        responses : iterable of SiteInfoResponse
+            Responses to combine, e.g. one per site.
+
+        Returns
+        -------
+        SiteInfoResponse
+            A response holding the sites of every response in order, with
+            the agency of the first response that names one. Its
+            ``request`` is None, as no single request produced it.
+        """
+        data = {}
+        sites = []
+        for response in responses:
+            if response.agency is not None:
+                data.setdefault("agency", response.agency)
+            sites.extend(response.site)
+        if sites:
+            data["site"] = sites
+        return cls.model_construct(set(data), **data)
 
     def to_dataframe(self):
-        """Convert the model to a pandas DataFrame."""
+        """Convert the model to a pandas DataFrame.
+
+        Each site is a column and each info field is a row, in the order the
+        fields first appear. Fields a site does not have are NaN.
+        """
+        import numpy as np
         import pandas as pd
 
         if not self.site:
             raise HilltopParseError("No site data available in the response.")
 
-        df = pd.DataFrame({site.name: site.info for site in self.site})
+        fields = list(dict.fromkeys(key for site in self.site for key in site.info))
+        rows = {field: row for row, field in enumerate(fields)}
+        values = np.full((len(fields), len(self.site)), np.nan, dtype=object)
+        for column, site in enumerate(self.site):
+            for key, value in site.info.items():
+                values[rows[key], column] = value
 
-        return df
+        return pd.DataFrame(
+            values, index=fields, columns=[site.name for site in self.site]
+        )
 
     def to_dict(self):
         """Convert the model to a dictionary."""
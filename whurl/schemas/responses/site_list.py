@@ -1,18 +1,38 @@
 """Hilltop SiteList response models."""
 
-from typing import Any
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 import xmltodict
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (BaseModel, Field, field_serializer, field_validator,
+                      model_validator)
 
-from whurl.exceptions import HilltopParseError, HilltopResponseError
+from whurl.exceptions import (HilltopParseError, HilltopRequestError,
+                              HilltopResponseError)
 from whurl.schemas.mixins import ModelReprMixin
 from whurl.schemas.requests import SiteListRequest
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from whurl.spatial import SiteIndex
+
+# Site elements holding coordinates, and the matching Site fields.
+_COORDINATE_TAGS = {
+    "Easting": "easting",
+    "Northing": "northing",
+    "Latitude": "latitude",
+    "Longitude": "longitude",
+}
+
 
 class SiteListResponse(ModelReprMixin, BaseModel):
-    """Top-level Hilltop SiteList response model."""
+    """Top-level Hilltop SiteList response model.
+
+    Parsing with ``from_xml(xml_str, compact=True)`` stores the sites in a
+    ``CompactSiteList`` backed by NumPy arrays instead of a list of ``Site``
+    models, which is several times faster and smaller for large agencies.
+    """
 
     class Site(ModelReprMixin, BaseModel):
         """Represents a single Hilltop site."""
@@ -34,6 +54,13 @@ class SiteListResponse(ModelReprMixin, BaseModel):
     error: str = Field(alias="Error", default=None)
     request: SiteListRequest | None = Field(default=None, exclude=True)
 
+    @field_serializer("site_list", mode="wrap")
+    def serialize_site_list(self, value, handler):
+        """Expand a ``CompactSiteList`` into sites before serializing it."""
+        if isinstance(value, CompactSiteList):
+            value = list(value)
+        return handler(value)
+
     @model_validator(mode="after")
     def handle_error(self) -> "SiteListResponse":
         """Handle errors in the response."""
@@ -50,9 +77,17 @@ class SiteListResponse(ModelReprMixin, BaseModel):
 
     def to_dataframe(self):
         """Convert the model to a pandas DataFrame."""
-        data = self.to_dict()
-        sites = data.pop("Site", [])
-        df = pd.DataFrame(sites)
+        import pandas as pd
+
+        if isinstance(self.site_list, CompactSiteList):
+            data = self.model_dump(
+                exclude={"site_list"}, exclude_unset=True, by_alias=True
+            )
+            df = self.site_list.to_dataframe()
+        else:
+            data = self.to_dict()
+            sites = data.pop("Site", [])
+            df = pd.DataFrame(sites)
 
         df["Agency"] = data["Agency"]
         if "Version" in data:
@@ -60,9 +95,185 @@ class SiteListResponse(ModelReprMixin, BaseModel):
 
         return df
 
+    def coordinates(
+        self, crs: str = "EPSG:2193", projected_crs: str = "EPSG:2193"
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """Get the coordinates of every site in one reference system.
+
+        Each site's coordinates are converted from whichever of easting and
+        northing or latitude and longitude it has, so a site list fetched
+        with ``location="Yes"`` can also be used in WGS84, and vice versa.
+
+        Parameters
+        ----------
+        crs : str, default "EPSG:2193"
+            EPSG code of the coordinates to return: "EPSG:4326",
+            "EPSG:4167", "EPSG:2193" or "EPSG:27200".
+        projected_crs : str, default "EPSG:2193"
+            EPSG code of the easting and northing returned by the server,
+            "EPSG:2193" (NZTM 2000) or "EPSG:27200" (NZMG).
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Easting or longitude, and northing or latitude, of each site in
+            ``site_list`` order. Sites without coordinates are NaN.
+
+        Raises
+        ------
+        HilltopRequestError
+            If either EPSG code is not supported.
+        """
+        import numpy as np
+
+        from whurl.coordinates import PROJECTED_CRS, transform
+
+        if projected_crs not in PROJECTED_CRS:
+            raise HilltopRequestError(
+                f"Unsupported projected CRS: '{projected_crs}'. "
+                f"Valid codes are: {', '.join(PROJECTED_CRS)}"
+            )
+
+        sources = [
+            (projected_crs, "easting", "northing"),
+            ("EPSG:4326", "longitude", "latitude"),
+        ]
+        # Prefer coordinates that are already in the requested system.
+        if crs in PROJECTED_CRS:
+            sources.sort(key=lambda source: source[0] != crs)
+        else:
+            sources.reverse()
+
+        x = np.full(len(self.site_list), np.nan)
+        y = np.full(len(self.site_list), np.nan)
+        for source_crs, x_field, y_field in sources:
+            source_x = self._site_values(x_field)
+            source_y = self._site_values(y_field)
+            fill = np.isnan(x) & ~np.isnan(source_x) & ~np.isnan(source_y)
+            x[fill], y[fill] = transform(
+                source_x[fill], source_y[fill], source_crs, crs
+            )
+        return x, y
+
+    def _site_values(self, field: str) -> "np.ndarray":
+        """Get one coordinate field of every site as a float array."""
+        import numpy as np
+
+        if isinstance(self.site_list, CompactSiteList):
+            return getattr(self.site_list, field)
+        return np.array(
+            [getattr(site, field) for site in self.site_list], dtype=float
+        )
+
+    def spatial_index(
+        self,
+        crs: str = "EPSG:2193",
+        projected_crs: str = "EPSG:2193",
+        leaf_size: int = 16,
+    ) -> "SiteIndex":
+        """Build an in-memory spatial index over the sites.
+
+        The index answers bounding box and nearest-site queries without
+        another request to the server. Build it once and reuse it; it does
+        not track later changes to ``site_list``.
+
+        Parameters
+        ----------
+        crs : str, default "EPSG:2193"
+            EPSG code of the coordinates to index. Projected systems
+            ("EPSG:2193", "EPSG:27200") are indexed by easting and northing,
+            geographic ones ("EPSG:4326", "EPSG:4167") by longitude and
+            latitude. Coordinates are converted as in ``coordinates``.
+        projected_crs : str, default "EPSG:2193"
+            EPSG code of the easting and northing returned by the server.
+        leaf_size : int, default 16
+            Number of sites per leaf of the tree.
+
+        Returns
+        -------
+        SiteIndex
+            Spatial index over the sites that have coordinates.
+
+        Raises
+        ------
+        HilltopRequestError
+            If an EPSG code is not supported, or no site has coordinates.
+        """
+        from whurl.coordinates import GEOGRAPHIC_CRS
+        from whurl.spatial import SiteIndex
+
+        x, y = self.coordinates(crs, projected_crs)
+        if isinstance(self.site_list, CompactSiteList):
+            names = self.site_list.names.tolist()
+        else:
+            names = [site.name for site in self.site_list]
+        index = SiteIndex(
+            names, x, y, geographic=crs in GEOGRAPHIC_CRS, leaf_size=leaf_size
+        )
+        if names and not len(index):
+            raise HilltopRequestError(
+                "No site has coordinates. Request the site list with "
+                "location='Yes' or location='LatLong'."
+            )
+        return index
+
+    @classmethod
+    def merge(cls, responses: Iterable["SiteListResponse"]) -> "SiteListResponse":
+        """Combine SiteList responses from several sources.
+
+        Parameters
+        ----------
+        responses : iterable of SiteListResponse
+            Responses in order of precedence, highest first. Compact site
+            lists are expanded into ``Site`` models.
+
+        Returns
+        -------
+        SiteListResponse
+            A response holding each site name once, taken from the first
+            response that lists it, with the agency of the first response
+            that names one. Its ``request`` is None, as no single request
+            produced it.
+        """
+        data = {}
+        sites = {}
+        for response in responses:
+            if response.agency is not None:
+                data.setdefault("agency", response.agency)
+            for site in response.site_list:
+                sites.setdefault(site.name, site)
+        if sites:
+            data["site_list"] = list(sites.values())
+        return cls.model_construct(set(data), **data)
+
     @classmethod
-    def from_xml(cls, xml_str: str) -> "SiteListResponse":
-        """Parse XML string into SiteListResponse object."""
+    def from_xml(cls, xml_str: str, compact: bool = False) -> "SiteListResponse":
+        """Parse XML string into SiteListResponse object.
+
+        Parameters
+        ----------
+        xml_str : str
+            The SiteList XML returned by Hilltop Server.
+        compact : bool, default False
+            Parse the sites straight into NumPy arrays held by a
+            ``CompactSiteList``, building ``Site`` models only when they
+            are accessed.
+
+        Returns
+        -------
+        SiteListResponse
+            The parsed response.
+
+        Raises
+        ------
+        HilltopParseError
+            If the XML is not a Hilltop SiteList response.
+        HilltopResponseError
+            If the response holds a Hilltop error message.
+        """
+        if compact:
+            return cls._from_xml_compact(xml_str)
+
         response = xmltodict.parse(xml_str)
 
         if "HilltopServer" not in response:
@@ -78,3 +289,154 @@ class SiteListResponse(ModelReprMixin, BaseModel):
                 data["Site"] = [data["Site"]]
 
         return cls(**data)
+
+    @classmethod
+    def _from_xml_compact(cls, xml_str: str) -> "SiteListResponse":
+        """Parse XML string into a SiteListResponse backed by arrays."""
+        import numpy as np
+        from lxml import etree
+
+        # Override any declared encoding, as the string is already decoded.
+        parser = etree.XMLParser(encoding="utf-8", huge_tree=True)
+        try:
+            root = etree.fromstring(xml_str.encode("utf-8"), parser)
+        except etree.XMLSyntaxError as e:
+            raise HilltopParseError(
+                f"Failed to parse Hilltop XML response: {e}",
+                raw_response=xml_str,
+            ) from e
+
+        if root.tag != "HilltopServer":
+            raise HilltopParseError(
+                "Unexpected Hilltop XML response.",
+                raw_response=xml_str,
+            )
+
+        aliases = {
+            field.alias: name
+            for name, field in cls.model_fields.items()
+            if field.alias and name != "site_list"
+        }
+        data = {
+            aliases[element.tag]: element.text
+            for element in root.iterchildren(*aliases)
+        }
+
+        names = []
+        # Positions and text of each coordinate, converted in one pass below.
+        columns = {tag: ([], []) for tag in _COORDINATE_TAGS}
+        for element in root.iter("Site", *_COORDINATE_TAGS):
+            if element.tag == "Site":
+                names.append(element.get("Name"))
+            elif element.text:
+                positions, texts = columns[element.tag]
+                positions.append(len(names) - 1)
+                texts.append(element.text)
+
+        if data.get("error") is not None:
+            raise HilltopResponseError(
+                f"Hilltop SiteList error: {data['error']}",
+                raw_response={"Error": data["error"]},
+            )
+
+        coordinates = {}
+        for tag, (positions, texts) in columns.items():
+            values = np.full(len(names), np.nan)
+            try:
+                values[positions] = np.array(texts, dtype=float)
+            except ValueError as e:
+                raise HilltopParseError(
+                    f"Invalid {tag} in Hilltop SiteList response: {e}",
+                    raw_response=xml_str,
+                ) from e
+            coordinates[_COORDINATE_TAGS[tag]] = values
+
+        site_list = CompactSiteList(np.array(names, dtype=str), **coordinates)
+        # Like full parsing, a response without sites leaves site_list unset.
+        fields_set = set(data) | ({"site_list"} if names else set())
+        return cls.model_construct(fields_set, site_list=site_list, **data)
+
+
+class CompactSiteList(Sequence):
+    """Read-only sequence of sites backed by NumPy arrays.
+
+    Site names are held in one string array and coordinates in float64
+    arrays, with NaN for missing values. Indexing builds a
+    ``SiteListResponse.Site`` on demand, and slicing returns another view.
+
+    Parameters
+    ----------
+    names : np.ndarray
+        Site names.
+    easting, northing, latitude, longitude : np.ndarray
+        Coordinates of each site, NaN where the server returned none.
+    """
+
+    def __init__(self, names, easting, northing, latitude, longitude):
+        self.names = names
+        self.easting = easting
+        self.northing = northing
+        self.latitude = latitude
+        self.longitude = longitude
+
+    def __len__(self) -> int:
+        """Return the number of sites."""
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """Build the site at ``index``, or a view over a slice of sites."""
+        if isinstance(index, slice):
+            return CompactSiteList(
+                *(
+                    getattr(self, field)[index]
+                    for field in ("names", *_COORDINATE_TAGS.values())
+                )
+            )
+
+        values = {"name": str(self.names[index])}
+        for field in _COORDINATE_TAGS.values():
+            value = getattr(self, field)[index]
+            if value == value:  # Skip NaN
+                values[field] = float(value)
+        return SiteListResponse.Site.model_construct(**values)
+
+    def __iter__(self):
+        """Iterate over the sites, building each one as it is reached."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        """Compare site by site with another sequence of sites."""
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine.model_dump() == theirs.model_dump()
+            for mine, theirs in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        """Return a short summary of the sequence."""
+        return f"<CompactSiteList: {len(self)} sites>"
+
+    def to_dataframe(self):
+        """Convert the sites to a pandas DataFrame without building models.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per site, with the same columns as
+            ``SiteListResponse.to_dataframe``: "@Name" and any coordinate
+            column that at least one site has a value for, or no columns
+            when there are no sites.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if not len(self.names):
+            return pd.DataFrame()
+        columns = {"@Name": self.names.astype(object)}
+        for tag, field in _COORDINATE_TAGS.items():
+            values = getattr(self, field)
+            if not np.isnan(values).all():
+                columns[tag] = values
+        return pd.DataFrame(columns)
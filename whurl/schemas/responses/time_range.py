@@ -1,8 +1,9 @@
 """Schema for TimeRange responses."""
 
+from collections.abc import Iterable
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-import httpx
 import xmltodict
 from pydantic import BaseModel, Field, field_validator
 
@@ -10,6 +11,9 @@ from whurl.exceptions import HilltopParseError, HilltopResponseError
 from whurl.schemas.mixins import ModelReprMixin
 from whurl.schemas.requests import TimeRangeRequest
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class TimeRangeResponse(ModelReprMixin, BaseModel):
     """Hilltop TimeRange response model."""
@@ -26,6 +30,34 @@ class TimeRangeResponse(ModelReprMixin, BaseModel):
         """Convert the model to a dictionary."""
         return self.model_dump(exclude_unset=True, by_alias=True)
 
+    @staticmethod
+    def table(responses: Iterable["TimeRangeResponse"]) -> "pd.DataFrame":
+        """Collect many TimeRange responses into one table.
+
+        Parameters
+        ----------
+        responses : iterable of TimeRangeResponse
+            Responses to collect, e.g. one per site and measurement.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per response, in order, with "Site", "Measurement",
+            "From", "To" and "Units" columns.
+        """
+        import pandas as pd
+
+        df = pd.DataFrame(
+            [
+                (r.site, r.measurement, r.from_time, r.to_time, r.units)
+                for r in responses
+            ],
+            columns=["Site", "Measurement", "From", "To", "Units"],
+        )
+        df["From"] = pd.to_datetime(df["From"])
+        df["To"] = pd.to_datetime(df["To"])
+        return df
+
     @field_validator("from_time", "to_time", mode="before")
     def validate_time(cls, value: str) -> datetime:
         """Convert time strings to datetime objects."""
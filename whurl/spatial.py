@@ -0,0 +1,240 @@
+"""In-memory spatial index over Hilltop site coordinates.
+
+This module provides a packed R-tree held in NumPy arrays, built once from
+a site list and then queried for bounding boxes and nearest sites without
+another request to the server.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from whurl.exceptions import HilltopRequestError
+
+# Mean Earth radius in metres, used for great-circle distances.
+EARTH_RADIUS = 6371008.8
+
+
+def _str_order(points: np.ndarray, leaf_size: int) -> np.ndarray:
+    """Order points by Sort-Tile-Recursive packing.
+
+    Points are sorted into slabs along the first axis, each slab is sorted
+    along the next axis, and so on, so that consecutive runs of
+    ``leaf_size`` points are spatially compact.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Array of shape (n, d) of point coordinates.
+    leaf_size : int
+        Number of points per leaf.
+
+    Returns
+    -------
+    np.ndarray
+        Permutation of the point indexes in packed order.
+    """
+    order = np.arange(len(points))
+
+    def pack(idx: np.ndarray, axis: int) -> np.ndarray:
+        idx = idx[np.argsort(points[idx, axis], kind="stable")]
+        dims_left = points.shape[1] - axis
+        if dims_left == 1:
+            return idx
+        leaves = -(-len(idx) // leaf_size)
+        slabs = int(np.ceil(leaves ** (1 / dims_left)))
+        slab_size = -(-leaves // slabs) * leaf_size
+        return np.concatenate(
+            [
+                pack(idx[start : start + slab_size], axis + 1)
+                for start in range(0, len(idx), slab_size)
+            ]
+        )
+
+    return pack(order, 0) if len(order) else order
+
+
+class _PackedTree:
+    """Leaf level of a packed R-tree.
+
+    Sites are small enough (thousands, not millions) that testing every leaf
+    box in one vectorised pass is faster than walking upper tree levels in
+    Python, so only the leaves are stored.
+    """
+
+    def __init__(self, points: np.ndarray, leaf_size: int):
+        self.order = _str_order(points, leaf_size)
+        self.points = points[self.order]
+        self.starts = np.arange(0, len(points), leaf_size)
+        if len(points):
+            self.mins = np.minimum.reduceat(self.points, self.starts, axis=0)
+            self.maxs = np.maximum.reduceat(self.points, self.starts, axis=0)
+        else:
+            self.mins = self.maxs = np.empty((0, points.shape[1]))
+        self.ends = np.append(self.starts[1:], len(points))
+
+    def _gather(self, leaves: np.ndarray) -> np.ndarray:
+        """Return the packed positions of every point in the given leaves."""
+        lengths = self.ends[leaves] - self.starts[leaves]
+        # Shift a running count so each leaf's run begins at its start.
+        first = self.starts[leaves] - np.cumsum(lengths) + lengths
+        return np.repeat(first, lengths) + np.arange(lengths.sum())
+
+    def within(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """Return the original indexes of points inside a box."""
+        hits = np.flatnonzero(
+            np.all((self.maxs >= lower) & (self.mins <= upper), axis=1)
+        )
+        positions = self._gather(hits)
+        points = self.points[positions]
+        inside = np.all((points >= lower) & (points <= upper), axis=1)
+        return np.sort(self.order[positions[inside]])
+
+    def nearest(self, point: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the original indexes and distances of the k nearest points."""
+        k = min(k, len(self.points))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        # Lower bound on the distance from the point to each leaf.
+        gap = np.maximum(self.mins - point, 0) + np.maximum(point - self.maxs, 0)
+        bound = np.sqrt(np.sum(gap**2, axis=1))
+        by_bound = np.argsort(bound, kind="stable")
+
+        # The closest leaves holding k points give an upper bound on the
+        # k-th distance; only leaves within that bound can hold a nearer one.
+        counts = np.cumsum(self.ends[by_bound] - self.starts[by_bound])
+        first = by_bound[: np.searchsorted(counts, k) + 1]
+        dist = self._distances(self._gather(first), point)
+        kth = np.partition(dist, k - 1)[k - 1]
+
+        positions = self._gather(by_bound[bound[by_bound] <= kth])
+        dist = self._distances(positions, point)
+        best = np.argsort(dist, kind="stable")[:k]
+        return self.order[positions[best]], dist[best]
+
+    def _distances(self, positions: np.ndarray, point: np.ndarray) -> np.ndarray:
+        """Return the Euclidean distances from packed positions to a point."""
+        return np.sqrt(np.sum((self.points[positions] - point) ** 2, axis=1))
+
+
+def _unit_vectors(lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    """Convert longitude and latitude in degrees to 3D unit vectors."""
+    lon, lat = np.radians(lon), np.radians(lat)
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+class SiteIndex:
+    """Packed R-tree over site coordinates for bounding box and nearest queries.
+
+    Sites are packed into leaves with Sort-Tile-Recursive ordering, and
+    queries test all leaf bounding boxes in one vectorised pass before
+    checking the points in the matching leaves. Sites without coordinates
+    are left out of the index.
+
+    For projected coordinates (NZTM, NZMG) distances are Euclidean, in
+    metres. For geographic coordinates (WGS84, NZGD2000) ``x`` is longitude
+    and ``y`` is latitude in degrees; nearest-site queries then use
+    great-circle distances in metres, while bounding boxes are compared in
+    degrees and are not expected to cross the antimeridian.
+
+    Parameters
+    ----------
+    names : sequence of str
+        Site names, in the same order as the coordinates.
+    x : array-like
+        Easting or longitude of each site. NaN or None marks a missing value.
+    y : array-like
+        Northing or latitude of each site. NaN or None marks a missing value.
+    geographic : bool, default False
+        Whether ``x`` and ``y`` are longitude and latitude in degrees.
+    leaf_size : int, default 16
+        Number of sites per leaf of the tree.
+
+    Examples
+    --------
+    >>> index = site_list_response.spatial_index("EPSG:2193")
+    >>> index.within(1800000, 5500000, 1850000, 5550000)
+    ['Site A', 'Site B']
+    >>> index.nearest(1820000, 5520000, k=1)
+    [('Site A', 1523.4)]
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        x,
+        y,
+        geographic: bool = False,
+        leaf_size: int = 16,
+    ):
+        if leaf_size < 1:
+            raise HilltopRequestError("leaf_size must be at least 1")
+
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if not len(names) == len(x) == len(y):
+            raise HilltopRequestError("names, x and y must all have the same length")
+
+        valid = ~(np.isnan(x) | np.isnan(y))
+        self.names = [name for name, keep in zip(names, valid) if keep]
+        self.x = x[valid]
+        self.y = y[valid]
+        self.geographic = geographic
+
+        self._boxes = _PackedTree(np.column_stack([self.x, self.y]), leaf_size)
+        if geographic:
+            self._metric = _PackedTree(_unit_vectors(self.x, self.y), leaf_size)
+        else:
+            self._metric = self._boxes
+
+    def __len__(self) -> int:
+        """Return the number of indexed sites."""
+        return len(self.names)
+
+    def within(
+        self, min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> list[str]:
+        """Find the sites inside a bounding box.
+
+        Parameters
+        ----------
+        min_x, min_y, max_x, max_y : float
+            Corners of the box, in the coordinates of the index. Sites on
+            the boundary are included.
+
+        Returns
+        -------
+        list of str
+            Names of the sites in the box, in site list order.
+        """
+        hits = self._boxes.within(
+            np.array([min_x, min_y], dtype=float),
+            np.array([max_x, max_y], dtype=float),
+        )
+        return [self.names[i] for i in hits]
+
+    def nearest(self, x: float, y: float, k: int = 1) -> list[tuple[str, float]]:
+        """Find the sites nearest to a point.
+
+        Parameters
+        ----------
+        x, y : float
+            The query point, in the coordinates of the index.
+        k : int, default 1
+            Number of sites to return.
+
+        Returns
+        -------
+        list of tuple of (str, float)
+            Site names and their distances in metres, nearest first. Fewer
+            than ``k`` sites are returned if the index holds fewer.
+        """
+        if self.geographic:
+            point = _unit_vectors(np.array([x]), np.array([y]))[0]
+            hits, chords = self._metric.nearest(point, k)
+            distances = 2 * EARTH_RADIUS * np.arcsin(np.minimum(chords / 2, 1))
+        else:
+            hits, distances = self._metric.nearest(np.array([x, y], dtype=float), k)
+        return [(self.names[i], float(d)) for i, d in zip(hits, distances)]
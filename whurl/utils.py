@@ -4,10 +4,43 @@ This module contains utility functions for validating and processing
 Hilltop-specific data formats and request parameters.
 """
 
+from __future__ import annotations
+
 import re
+from typing import TYPE_CHECKING
 
 from whurl.exceptions import HilltopRequestError
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Keyword arguments of pd.Timedelta, or of pd.DateOffset for calendar units,
+# for each unit of Hilltop interval notation.
+_INTERVAL_UNITS = {
+    "": "seconds",
+    "s": "seconds",
+    "second": "seconds",
+    "seconds": "seconds",
+    "m": "minutes",
+    "minute": "minutes",
+    "minutes": "minutes",
+    "h": "hours",
+    "hour": "hours",
+    "hours": "hours",
+    "d": "days",
+    "day": "days",
+    "days": "days",
+    "w": "weeks",
+    "week": "weeks",
+    "weeks": "weeks",
+    "mo": "months",
+    "month": "months",
+    "months": "months",
+    "y": "years",
+    "year": "years",
+    "years": "years",
+}
+
 
 def validate_hilltop_interval_notation(value: str) -> str:
     """Validate Hilltop interval notation format.
@@ -107,6 +140,58 @@ def validate_hilltop_interval_notation(value: str) -> str:
     return value
 
 
+def parse_hilltop_interval(value: str | int | float) -> pd.Timedelta | pd.DateOffset:
+    """Convert Hilltop interval notation to a length of time.
+
+    Parameters
+    ----------
+    value : str or int or float
+        An interval such as "15 minutes", "1 day", "1 month" or "30"
+        (seconds), or a number of seconds.
+
+    Returns
+    -------
+    pd.Timedelta or pd.DateOffset
+        A Timedelta for fixed units, or a DateOffset for months and years,
+        whose length varies.
+
+    Raises
+    ------
+    HilltopRequestError
+        If the interval is not valid notation, is not positive, or is a
+        fractional number of months or years.
+
+    Examples
+    --------
+    >>> parse_hilltop_interval("2.5 minutes")
+    Timedelta('0 days 00:02:30')
+    >>> parse_hilltop_interval("1 month")
+    <DateOffset: months=1>
+    """
+    import pandas as pd
+
+    if isinstance(value, (int, float)):
+        value = str(value)
+    match = re.fullmatch(r"\s*(\d+\.?\d*)\s*([a-zA-Z]*)\s*", str(value))
+    if match is None or match.group(2).lower() not in _INTERVAL_UNITS:
+        raise HilltopRequestError(
+            f"Invalid interval: '{value}'. Expected a number of seconds, or "
+            "a number and one of: seconds, minutes, hours, days, weeks, "
+            "months, years."
+        )
+    number = float(match.group(1))
+    unit = _INTERVAL_UNITS[match.group(2).lower()]
+    if number <= 0:
+        raise HilltopRequestError(f"Interval must be positive: '{value}'.")
+    if unit in ("months", "years"):
+        if not number.is_integer():
+            raise HilltopRequestError(
+                f"Intervals in {unit} must be whole numbers: '{value}'."
+            )
+        return pd.DateOffset(**{unit: int(number)})
+    return pd.Timedelta(**{unit: number})
+
+
 def sanitise_xml_attributes(xml_str: str) -> str:
     """Sanitise XML attributes by escaping special characters.
 